@@ -5,7 +5,7 @@ Compatible con Python 3.11+ y dependencias mínimas
 """
 
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseSettings, Field
 
 class Settings(BaseSettings):
@@ -48,11 +48,39 @@ class Settings(BaseSettings):
         description="URL base de la API del BCRA"
     )
     
+    # HTTP Pool (conexiones compartidas hacia APIs externas)
+    HTTP_POOL_LIMIT: int = Field(default=100, description="Máximo de conexiones simultáneas del pool")
+    HTTP_POOL_LIMIT_PER_HOST: int = Field(default=20, description="Máximo de conexiones por host")
+    HTTP_KEEPALIVE_TIMEOUT: int = Field(default=30, description="Segundos que se mantiene viva una conexión ociosa")
+    HTTP_DNS_TTL: int = Field(default=300, description="TTL del cache DNS en segundos")
+    HTTP_TIMEOUT: int = Field(default=30, description="Timeout total por request en segundos")
+    
     # Cache Settings
     CACHE_TTL: int = Field(default=300, description="TTL del cache en segundos")
+    CACHE_MAX_ENTRIES: int = Field(default=1024, description="Entradas máximas del cache en memoria (LRU)")
+    CACHE_SERIALIZER: str = Field(default="orjson", description="Serialización para Redis: orjson, msgpack o json")
+    CACHE_PREFIX: str = Field(default="argfy:", description="Prefijo de claves en Redis")
+    REDIS_URL: Optional[str] = Field(default=None, description="URL de Redis (sin valor: cache solo en memoria)")
+    REDIS_TIMEOUT: float = Field(default=0.5, description="Timeout de operaciones Redis en segundos")
+    
+    # Respuestas
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, description="Bytes mínimos para comprimir una respuesta")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, description="Nivel de compresión gzip (1-9)")
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, description="Calidad de brotli (0-11)")
     
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = Field(default=60, description="Límite de requests por minuto")
+    RATE_LIMIT_ENABLED: bool = Field(default=True, description="Habilitar rate limiting")
+    RATE_LIMIT_BACKEND: str = Field(default="memory", description="memory (token bucket por proceso) o redis (ventana compartida)")
+    RATE_LIMIT_ROUTES: Dict[str, int] = Field(
+        default={
+            "/api/v1/data/export": 10,
+            "/api/v1/indicators/refresh": 5,
+        },
+        description="Requests por minuto por prefijo de ruta"
+    )
+    RATE_LIMIT_CLIENTS: Dict[str, int] = Field(default={}, description="Requests por minuto por API key (X-API-Key)")
+    RATE_LIMIT_TRUST_FORWARDED: bool = Field(default=False, description="Usar X-Forwarded-For (solo detrás de un proxy confiable)")
     
     # Monitoring
     ENABLE_MONITORING: bool = Field(default=True, description="Habilitar monitoreo")
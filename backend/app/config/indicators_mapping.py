@@ -413,4 +413,25 @@ IMPLEMENTATION_PRIORITY = {
         "empleo_publico", "exportaciones_sbc", "empleo_it",
         "inversion_id", "vc_startups", "facturacion_software"
     ]
-}
\ No newline at end of file
+}
+
+# FRESCURA DE DATOS POR FRECUENCIA (stale-while-revalidate)
+# soft_ttl: edad (s) hasta la que el valor se sirve como fresco.
+# hard_ttl: edad máxima a servir como `stale` mientras se refresca en background.
+FRESHNESS_POLICIES = {
+    "real_time": {"soft_ttl": 60, "hard_ttl": 15 * 60},
+    "daily": {"soft_ttl": 30 * 60, "hard_ttl": 2 * 86400},
+    "monthly": {"soft_ttl": 6 * 3600, "hard_ttl": 45 * 86400},
+    "quarterly": {"soft_ttl": 12 * 3600, "hard_ttl": 120 * 86400},
+    "yearly": {"soft_ttl": 24 * 3600, "hard_ttl": 400 * 86400},
+}
+
+
+def get_freshness_policy(indicator_id: str) -> dict:
+    """
+    Política de frescura de un indicador según su `frequency`.
+    Un indicador puede sobreescribirla con una clave "freshness" propia.
+    """
+    indicator = ALL_INDICATORS.get(indicator_id, {})
+    policy = FRESHNESS_POLICIES.get(indicator.get("frequency"), FRESHNESS_POLICIES["daily"])
+    return {**policy, **indicator.get("freshness", {})}
@@ -1,29 +1,218 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 import os
+import uuid
 
 # Base de datos SQLite para desarrollo
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/argentina.db")
+# Réplica de lectura opcional (Postgres); por defecto la misma base
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+
+# Pool de conexiones
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# SQLite
+SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "30"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000"))
 
 # Crear directorio si no existe
 os.makedirs("data", exist_ok=True)
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={
-        "check_same_thread": False,
-        "timeout": 30
-    },
-    poolclass=StaticPool,
-    pool_pre_ping=True,
-    echo=False  # No logs SQL en producción
-)
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def _shared_memory_url(url: str) -> str:
+    """
+    `sqlite://` es una base distinta por conexión. Se la reemplaza por una
+    base en memoria con nombre y cache compartida, así el engine async abre
+    sus propias conexiones a la misma base (vive mientras el StaticPool del
+    engine sync mantenga la suya abierta).
+    """
+    if "mode=memory" in url:
+        return url
+    return f"sqlite:///file:argfy_{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true"
+
+
+def _set_sqlite_pragmas(read_only: bool, shared_memory: bool = False):
+    """
+    WAL permite lectores concurrentes mientras el scheduler escribe;
+    synchronous=NORMAL es seguro con WAL y evita un fsync por commit.
+    """
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        if shared_memory:
+            # Con cache compartida una lectura no espera: falla con "table is
+            # locked" si otra conexión tiene escrituras sin commit (solo dev/tests)
+            cursor.execute("PRAGMA read_uncommitted=ON")
+        cursor.close()
+
+    return on_connect
+
+
+def create_db_engine(url: str = DATABASE_URL, read_only: bool = False):
+    """
+    Engine configurado según el motor:
+    - SQLite en memoria: StaticPool (una conexión compartida, solo tests/dev)
+      sobre una base con nombre y cache compartida (ver `_shared_memory_url`)
+    - SQLite en archivo: QueuePool + WAL/mmap; `read_only` agrega query_only
+    - Postgres/otros: QueuePool con tamaño configurable y pre-ping
+    """
+    if _is_sqlite(url):
+        connect_args = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT}
+
+        if _is_sqlite_memory(url):
+            return create_engine(
+                _shared_memory_url(url), connect_args=connect_args, poolclass=StaticPool, echo=False
+            )
+
+        engine = create_engine(
+            url,
+            connect_args=connect_args,
+            poolclass=QueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_pre_ping=True,
+            echo=False
+        )
+        event.listen(engine, "connect", _set_sqlite_pragmas(read_only))
+        return engine
+
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=False  # No logs SQL en producción
+    )
+
+
+engine = create_db_engine(DATABASE_URL)
+
+# Pool de solo lectura para endpoints GET: con WAL no hace cola detrás de
+# las escrituras del scheduler. En memoria comparte la única conexión.
+if DATABASE_READ_URL:
+    read_engine = create_db_engine(DATABASE_READ_URL, read_only=True)
+elif _is_sqlite(DATABASE_URL) and not _is_sqlite_memory(DATABASE_URL):
+    read_engine = create_db_engine(DATABASE_URL, read_only=True)
+else:
+    read_engine = engine
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 Base = declarative_base()
 
+
+def dialect_insert(dialect_name: str):
+    """`insert` con ON CONFLICT (upsert) del dialecto, o None si no lo soporta"""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
+# === SESIONES ASYNC (aiosqlite / asyncpg) ===
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    """sqlite:///x.db -> sqlite+aiosqlite:///x.db, postgresql://... -> postgresql+asyncpg://..."""
+    scheme, sep, rest = url.partition("://")
+    base_scheme = scheme.split("+", 1)[0]
+    return f"{ASYNC_DRIVERS.get(base_scheme, scheme)}{sep}{rest}"
+
+
+def create_async_db_engine(url: str = DATABASE_URL, read_only: bool = False, sync_engine=None):
+    """
+    Equivalente async de `create_db_engine` (mismos pools y PRAGMAs).
+    SQLite en memoria necesita el engine sync (`sync_engine`) que creó la
+    base: el async abre conexiones propias a su base con nombre y cache
+    compartida, sin tocar la conexión ni las transacciones del sync.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    shared_memory = _is_sqlite(url) and _is_sqlite_memory(url)
+    if shared_memory:
+        if sync_engine is None or not isinstance(sync_engine.pool, StaticPool):
+            raise ValueError("In-memory SQLite needs the sync StaticPool engine that owns the database")
+        url = sync_engine.url.render_as_string(hide_password=False)
+
+    async_url = to_async_url(url)
+
+    if _is_sqlite(url):
+        connect_args = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT}
+
+        async_engine = create_async_engine(
+            async_url,
+            connect_args=connect_args,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_pre_ping=True
+        )
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas(read_only, shared_memory))
+        return async_engine
+
+    return create_async_engine(
+        async_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
+
+
+# Se crean al primer uso para no exigir el driver async a scripts sync
+async_engine = None
+AsyncSessionLocal = None
+
+
+def get_async_sessionmaker():
+    global async_engine, AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        # Las sesiones async solo sirven lecturas (endpoints GET, live, backfill)
+        async_engine = create_async_db_engine(
+            DATABASE_READ_URL or DATABASE_URL, read_only=True, sync_engine=read_engine
+        )
+        AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    return AsyncSessionLocal
+
 def get_db():
     """Dependency para obtener sesión de base de datos"""
     db = SessionLocal()
@@ -32,6 +221,32 @@ def get_db():
     finally:
         db.close()
 
+def get_read_db():
+    """Dependency para endpoints de solo lectura (pool separado)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    """Dependency async: las consultas no bloquean el event loop"""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+async def dispose_async_engine():
+    """Cerrar el pool async (shutdown de la app)"""
+    if async_engine is not None:
+        await async_engine.dispose()
+
+def get_pool_stats() -> dict:
+    """Estado de los pools para monitoreo"""
+    return {
+        "write": engine.pool.status(),
+        "read": read_engine.pool.status() if read_engine is not engine else "shared",
+        "async": async_engine.pool.status() if async_engine is not None else "idle"
+    }
+
 def init_db():
     """Inicializar base de datos y crear tablas"""
     Base.metadata.create_all(bind=engine)
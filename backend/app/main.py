@@ -5,6 +5,7 @@ FastAPI main application con imports robustos
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
 import sys
@@ -23,6 +24,17 @@ except ImportError as e:
     logger.error(f"Error importing core modules: {e}")
     sys.exit(1)
 
+# Serialización JSON rápida (orjson) si está instalado
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+from .middleware.compression_middleware import CompressionMiddleware
+from .middleware.logging_middleware import LoggingMiddleware
+from .middleware.rate_limit_middleware import RateLimitMiddleware
+
 # Lista para trackear routers cargados
 routers_loaded = []
 routers_failed = []
@@ -55,6 +67,12 @@ def load_router(router_name: str, module_path: str):
         elif router_name == "bcra_real":
             from .routers.bcra_real import router
             return router
+        elif router_name == "live":
+            from .routers.live import router
+            return router
+        elif router_name == "metrics":
+            from .routers.metrics import router
+            return router
         else:
             raise ImportError(f"Unknown router: {router_name}")
             
@@ -77,6 +95,8 @@ routers_config = [
     ("unified_economic", "app.routers.unified_economic"),
     ("bcra_real", "app.routers.bcra_real"),
     ("expanded_indicators", "app.routers.expanded_indicators"),
+    ("live", "app.routers.live"),
+    ("metrics", "app.routers.metrics"),
 ]
 
 # Cargar routers disponibles
@@ -121,6 +141,40 @@ async def lifespan(app: FastAPI):
         Base.metadata.create_all(bind=engine)
         logger.info("✅ Tablas de base de datos verificadas")
         
+        # Snapshot de valores actuales (bases creadas antes de la tabla)
+        try:
+            from .database import SessionLocal
+            from .services.snapshot_service import ensure_snapshot
+            db = SessionLocal()
+            try:
+                ensure_snapshot(db)
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Error construyendo snapshot de indicadores: {e}")
+        
+        # Pool HTTP compartido por todos los servicios de datos
+        try:
+            from .services.http_pool import http_pool
+            await http_pool.start()
+        except Exception as e:
+            logger.warning(f"⚠️ Error iniciando pool HTTP: {e}")
+        
+        # Sampler de salud (métricas del sistema, base y fuentes externas)
+        try:
+            from .services.health_monitor import health_monitor
+            health_monitor.start()
+        except Exception as e:
+            logger.warning(f"⚠️ Error iniciando health sampler: {e}")
+        
+        # Flush periódico del registro de uso de la API
+        try:
+            from .services.api_usage import ENABLED, usage_recorder
+            if ENABLED:
+                usage_recorder.start()
+        except Exception as e:
+            logger.warning(f"⚠️ Error iniciando registro de uso: {e}")
+        
         # Inicializar scheduler si está disponible
         if scheduler_status["enabled"]:
             try:
@@ -141,13 +195,45 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("⏹️ Cerrando Argfy Platform...")
     
+    # Cada paso con su propio try: una falla no saltea el resto. El pool
+    # HTTP se cierra al final, cuando ya no quedan tasks que lo usen.
+    if scheduler_status["enabled"]:
+        logger.info("🔄 Deteniendo scheduler...")
+    
+    # Detener el sampler de salud
     try:
-        # Detener scheduler si está corriendo
-        if scheduler_status["enabled"]:
-            logger.info("🔄 Deteniendo scheduler...")
-            
+        from .services.health_monitor import health_monitor
+        await health_monitor.stop()
     except Exception as e:
-        logger.error(f"❌ Error en shutdown: {e}")
+        logger.error(f"❌ Error deteniendo health sampler: {e}")
+    
+    # Escribir los requests que quedaron en el buffer de uso
+    try:
+        from .services.api_usage import usage_recorder
+        await usage_recorder.stop()
+    except Exception as e:
+        logger.error(f"❌ Error guardando registro de uso: {e}")
+    
+    # Terminar las escrituras pendientes del store de series
+    try:
+        from .services.timeseries_store import wait_for_writes
+        await wait_for_writes()
+    except Exception as e:
+        logger.error(f"❌ Error escribiendo series pendientes: {e}")
+    
+    # Cerrar conexiones keep-alive del pool HTTP
+    try:
+        from .services.http_pool import http_pool
+        await http_pool.close()
+    except Exception as e:
+        logger.error(f"❌ Error cerrando pool HTTP: {e}")
+    
+    # Cerrar el pool de sesiones async de la base
+    try:
+        from .database import dispose_async_engine
+        await dispose_async_engine()
+    except Exception as e:
+        logger.error(f"❌ Error cerrando pool async de la base: {e}")
 
 # ✅ CREAR APP FASTAPI
 app = FastAPI(
@@ -174,17 +260,46 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=DefaultResponse,
     lifespan=lifespan
 )
 
-# ✅ MIDDLEWARES
+# ✅ MIDDLEWARES (el último agregado es el más externo)
+try:
+    # Interno a CORS: los 429 también llevan headers CORS
+    from .services.rate_limit_service import middleware_options
+    app.add_middleware(RateLimitMiddleware, **middleware_options())
+except Exception as e:
+    logger.error(f"❌ Error configurando rate limiting: {e}")
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=getattr(settings, 'CORS_ORIGINS', ["*"]),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After"],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=getattr(settings, 'COMPRESSION_MIN_SIZE', 1024),
+    gzip_level=getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6),
+    brotli_quality=getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4),
+)
+
+try:
+    # Más externo: mide también compresión y rechazos por rate limit
+    from .services.api_usage import ENABLED as API_USAGE_ENABLED, usage_recorder
+    from .services.metrics_service import instrument_db, observe_request
+    instrument_db()
+    app.add_middleware(
+        LoggingMiddleware,
+        recorder=usage_recorder if API_USAGE_ENABLED else None,
+        metrics=observe_request,
+        trust_forwarded=getattr(settings, 'RATE_LIMIT_TRUST_FORWARDED', False),
+    )
+except Exception as e:
+    logger.error(f"❌ Error configurando logging de requests: {e}")
 
 # ✅ INCLUIR ROUTERS DISPONIBLES
 for router_name, router in available_routers.items():
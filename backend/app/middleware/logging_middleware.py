@@ -1,25 +1,116 @@
-# Logging middleware implementation# backend/app/middleware/logging_middleware.py
-from time import perf_counter
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+# backend/app/middleware/logging_middleware.py
+"""
+Logging y registro de uso por request.
+
+Middleware ASGI puro (sin BaseHTTPMiddleware, que bufferea la respuesta
+y agrega una task por request): mide desde que llega el request hasta el
+último chunk del body, agrega `X-Response-Time`, loguea la línea de
+acceso y deja el request en el ring buffer de `api_usage` con el
+template de la ruta (`/api/v1/indicators/{indicator_type}`), no el path
+crudo, para que la agregación por endpoint tenga cardinalidad acotada.
+"""
 import logging
+from time import perf_counter
+from typing import Callable, Iterable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .rate_limit_middleware import api_key_id, client_identifier, request_api_key
 
 logger = logging.getLogger("argfy.request")
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
+UNMATCHED_ROUTE = "<unmatched>"
+DEFAULT_UNRECORDED_PATHS = ("/docs", "/redoc", "/openapi.json", "/favicon.ico", "/metrics")
+
+
+def route_template(scope: Scope) -> str:
+    """Template de la ruta que atendió el request (lo completa el router de FastAPI)"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if path else UNMATCHED_ROUTE
+
+
+def usage_client_id(scope: Scope, trust_forwarded: bool = False) -> str:
+    """client_id para api_usage: la API key nunca se guarda en claro"""
+    api_key = request_api_key(scope)
+    if api_key is not None:
+        return api_key_id(api_key)
+    return client_identifier(scope, trust_forwarded)
+
+
+class LoggingMiddleware:
+    """
+    `recorder` es un `UsageRecorder` (o cualquier objeto con `record`);
+    `metrics(method, route, status_code, duration_ms)` se llama en todos
+    los requests. Sin ninguno de los dos solo loguea.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        recorder=None,
+        metrics: Optional[Callable[[str, str, int, float], None]] = None,
+        unrecorded_paths: Iterable[str] = DEFAULT_UNRECORDED_PATHS,
+        trust_forwarded: bool = False
+    ):
+        self.app = app
+        self.recorder = recorder
+        self.metrics = metrics
+        self.unrecorded_paths = tuple(unrecorded_paths)
+        self.trust_forwarded = trust_forwarded
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start = perf_counter()
-        response = await call_next(request)
-        duration = (perf_counter() - start) * 1000
-
-        logger.info(
-            "%s %s → %s (%.1f ms)",
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration,
+        status_code = 500
+        duration: Optional[float] = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code, duration
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = (perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-response-time", f"{elapsed:.1f}ms".encode()),
+                ]
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                duration = (perf_counter() - start) * 1000
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            if duration is None:
+                duration = (perf_counter() - start) * 1000
+            self._record(scope, status_code, duration)
+
+    def _record(self, scope: Scope, status_code: int, duration: float) -> None:
+        logger.info("%s %s → %s (%.1f ms)", scope["method"], scope["path"], status_code, duration)
+
+        endpoint = route_template(scope)
+        if self.metrics is not None:
+            self.metrics(scope["method"], endpoint, status_code, duration)
+
+        if self.recorder is None or scope["path"].startswith(self.unrecorded_paths):
+            return
+
+        user_agent = None
+        for name, value in scope.get("headers", ()):
+            if name == b"user-agent":
+                user_agent = value.decode("latin-1")
+                break
+        client = scope.get("client")
+
+        self.recorder.record(
+            method=scope["method"],
+            endpoint=endpoint,
+            status_code=status_code,
+            response_time_ms=round(duration, 2),
+            ip_address=client[0] if client else None,
+            user_agent=user_agent,
+            client_id=usage_client_id(scope, self.trust_forwarded),
         )
-        # cabecera opcional
-        response.headers["X-Response-Time"] = f"{duration:.1f}ms"
-        return response
@@ -1,11 +1,154 @@
-# Rate limiting middleware implementation# backend/app/middleware/rate_limit_middleware.py
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+# backend/app/middleware/rate_limit_middleware.py
+"""
+Rate limiting por cliente y por ruta.
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # TODO: lógica real
-        response: Response = await call_next(request)
-        return response
+Middleware ASGI puro: una llamada al limitador por request y headers
+`RateLimit-*` (draft IETF) en todas las respuestas; al superar la cuota
+responde 429 con `Retry-After` sin llegar al endpoint.
+"""
+import hashlib
+import json
+import math
+from typing import Collection, Dict, Iterable, List, Mapping, Optional, Tuple
 
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..utils.rate_limit import Quota, RateLimitResult, TokenBucketLimiter
+
+DEFAULT_EXEMPT_PATHS = ("/health", "/docs", "/redoc", "/openapi.json", "/metrics")
+
+
+def request_api_key(scope: Scope) -> Optional[str]:
+    """Valor de X-API-Key (sin validar)"""
+    for name, value in scope.get("headers", ()):
+        if name == b"x-api-key":
+            return value.decode("latin-1")
+    return None
+
+
+def api_key_id(api_key: str) -> str:
+    """Identificador estable de una API key sin exponerla (buckets, api_usage)"""
+    return "key:" + hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+def bucket_id(client: str) -> str:
+    """
+    Clave del bucket para un client_id: las keys se guardan hasheadas (el
+    dict en memoria y los nombres de keys en Redis no llevan el secreto).
+    """
+    if client.startswith("key:"):
+        return api_key_id(client[len("key:"):])
+    return client
+
+
+def client_identifier(scope: Scope, trust_forwarded: bool = False,
+                      known_keys: Collection[str] = ()) -> str:
+    """
+    API key de X-API-Key si es conocida; si no, IP (X-Forwarded-For solo
+    detrás de un proxy confiable). Una key desconocida no abre un bucket
+    propio: rotando keys al azar no se evita el límite por IP.
+    """
+    api_key = request_api_key(scope)
+    if api_key is not None and "key:" + api_key in known_keys:
+        return "key:" + api_key
+    forwarded = None
+    if trust_forwarded:
+        for name, value in scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                forwarded = value.decode("latin-1").split(",")[0].strip()
+    if forwarded:
+        return "ip:" + forwarded
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+def rate_limit_headers(result: RateLimitResult, quota: Quota) -> List[Tuple[bytes, bytes]]:
+    headers = [
+        (b"ratelimit-limit", str(result.limit).encode()),
+        (b"ratelimit-remaining", str(result.remaining).encode()),
+        (b"ratelimit-reset", str(math.ceil(result.reset_after)).encode()),
+        (b"ratelimit-policy", quota.policy.encode()),
+    ]
+    if not result.allowed:
+        headers.append((b"retry-after", str(max(1, math.ceil(result.retry_after))).encode()))
+    return headers
+
+
+class RateLimitMiddleware:
+    """
+    Cuotas: `route_quotas` por prefijo de ruta (gana el más largo) y
+    `client_quotas` por client_id (p.ej. "key:<api key>") para el resto.
+    Solo las keys de `client_quotas` o `api_keys` tienen bucket propio; el
+    resto de los requests se limita por IP.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter=None,
+        default_quota: Quota = Quota(60, 60),
+        route_quotas: Optional[Mapping[str, Quota]] = None,
+        client_quotas: Optional[Mapping[str, Quota]] = None,
+        api_keys: Iterable[str] = (),
+        exempt_paths: Iterable[str] = DEFAULT_EXEMPT_PATHS,
+        trust_forwarded: bool = False,
+        enabled: bool = True
+    ):
+        self.app = app
+        self.limiter = limiter if limiter is not None else TokenBucketLimiter()
+        self.default_quota = default_quota
+        self.route_quotas = sorted((route_quotas or {}).items(), key=lambda item: -len(item[0]))
+        self.client_quotas: Dict[str, Quota] = dict(client_quotas or {})
+        self.known_keys = frozenset(
+            [client for client in self.client_quotas if client.startswith("key:")]
+            + ["key:" + api_key for api_key in api_keys]
+        )
+        self.exempt_paths = tuple(exempt_paths)
+        self.trust_forwarded = trust_forwarded
+        self.enabled = enabled
+
+    def _quota_for(self, path: str, client: str) -> Tuple[str, Quota]:
+        for prefix, quota in self.route_quotas:
+            if path.startswith(prefix):
+                return prefix, quota
+        return "*", self.client_quotas.get(client, self.default_quota)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.enabled
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client = client_identifier(scope, self.trust_forwarded, self.known_keys)
+        route, quota = self._quota_for(scope["path"], client)
+        # La key en claro solo sirve para buscar la cuota en `client_quotas`
+        result = await self.limiter.hit(f"{bucket_id(client)}|{route}", quota)
+        headers = rate_limit_headers(result, quota)
+
+        if not result.allowed:
+            body = json.dumps({
+                "detail": "Rate limit exceeded",
+                "retry_after": max(1, math.ceil(result.retry_after))
+            }).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    *headers,
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
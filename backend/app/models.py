@@ -41,6 +41,29 @@ class EconomicIndicator(Base):
     def __repr__(self):
         return f"<EconomicIndicator(type={self.indicator_type}, value={self.value}, source={self.source})>"
 
+class CurrentIndicator(Base):
+    """
+    Snapshot del último valor activo de cada indicador
+    Se actualiza en cada escritura (ver services/snapshot_service.py) para que
+    las lecturas de "valores actuales" no agreguen sobre todo el historial
+    """
+    __tablename__ = "current_indicators"
+
+    indicator_type = Column(String(50), primary_key=True)
+    indicator_id = Column(Integer)  # EconomicIndicator.id del valor vigente
+    value = Column(Float, nullable=False)
+    source = Column(String(20), nullable=False)
+    date = Column(DateTime, nullable=False)
+
+    unit = Column(String(10))
+    label = Column(String(100))
+    category = Column(String(30), index=True)
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<CurrentIndicator(type={self.indicator_type}, value={self.value}, date={self.date})>"
+
 class HistoricalData(Base):
     """
     Datos históricos para gráficos y análisis
@@ -167,6 +190,41 @@ class APIUsage(Base):
     def __repr__(self):
         return f"<APIUsage(endpoint={self.endpoint}, status={self.status_code})>"
 
+class APIUsageRollupMixin:
+    """
+    Uso de API pre-agregado por bucket de tiempo, endpoint, método y status
+    Se suma en cada flush del registro de uso (ver services/api_usage.py);
+    h_* son conteos del histograma de latencias (utils/histogram.py)
+    """
+    bucket = Column(DateTime, primary_key=True)
+    endpoint = Column(String(100), primary_key=True)
+    method = Column(String(10), primary_key=True)
+    status_code = Column(Integer, primary_key=True)
+
+    count = Column(Integer, nullable=False, default=0)
+    sum_latency_ms = Column(Float, nullable=False, default=0.0)
+
+    h_5 = Column(Integer, nullable=False, default=0)
+    h_10 = Column(Integer, nullable=False, default=0)
+    h_25 = Column(Integer, nullable=False, default=0)
+    h_50 = Column(Integer, nullable=False, default=0)
+    h_100 = Column(Integer, nullable=False, default=0)
+    h_250 = Column(Integer, nullable=False, default=0)
+    h_500 = Column(Integer, nullable=False, default=0)
+    h_1000 = Column(Integer, nullable=False, default=0)
+    h_2500 = Column(Integer, nullable=False, default=0)
+    h_5000 = Column(Integer, nullable=False, default=0)
+    h_inf = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<{type(self).__name__}(bucket={self.bucket}, endpoint={self.endpoint}, count={self.count})>"
+
+class APIUsageMinute(APIUsageRollupMixin, Base):
+    __tablename__ = "api_usage_minute"
+
+class APIUsageHour(APIUsageRollupMixin, Base):
+    __tablename__ = "api_usage_hour"
+
 class Configuration(Base):
     """
     Configuración dinámica de la aplicación
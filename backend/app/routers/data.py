@@ -3,20 +3,36 @@
 Router para endpoints de datos históricos y procesamiento
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import distinct, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
+import asyncio
 import logging
 
 # Imports con manejo de errores
 try:
-    from ..database import get_db
+    from ..database import ReadSessionLocal, get_async_db, get_db
     from ..models import EconomicIndicator, HistoricalData
+    from ..services.timeseries_store import load_series
+    from ..utils import columnar
+    from ..utils.columnar import COLUMNAR_FORMATS
+    from ..utils.resampling import downsample, resample
+    from ..utils.streaming import accepts_gzip, csv_chunks, gzip_chunks, json_chunks, ndjson_chunks
+    from ..utils.timeseries import to_isoformat
 except ImportError:
     # Fallback para imports relativos
-    from app.database import get_db
+    from app.database import ReadSessionLocal, get_async_db, get_db
     from app.models import EconomicIndicator, HistoricalData
+    from app.services.timeseries_store import load_series
+    from app.utils import columnar
+    from app.utils.columnar import COLUMNAR_FORMATS
+    from app.utils.resampling import downsample, resample
+    from app.utils.streaming import accepts_gzip, csv_chunks, gzip_chunks, json_chunks, ndjson_chunks
+    from app.utils.timeseries import to_isoformat
 
 logger = logging.getLogger(__name__)
 
@@ -42,24 +58,31 @@ async def get_historical_data(
     indicator: Optional[str] = Query(None, description="Tipo de indicador"),
     days: int = Query(30, description="Días hacia atrás", ge=1, le=365),
     limit: int = Query(100, description="Máximo de registros", ge=1, le=1000),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Obtener datos históricos con filtros"""
     try:
-        query = db.query(EconomicIndicator)
+        query = select(
+            EconomicIndicator.id,
+            EconomicIndicator.indicator_type,
+            EconomicIndicator.value,
+            EconomicIndicator.date,
+            EconomicIndicator.source,
+            EconomicIndicator.is_active
+        )
         
         # Filtrar por indicador si se especifica
         if indicator:
-            query = query.filter(EconomicIndicator.indicator_type == indicator)
+            query = query.where(EconomicIndicator.indicator_type == indicator)
         
         # Filtrar por fecha
         cutoff_date = datetime.now() - timedelta(days=days)
-        query = query.filter(EconomicIndicator.date >= cutoff_date)
+        query = query.where(EconomicIndicator.date >= cutoff_date)
         
         # Ordenar por fecha descendente y limitar
         query = query.order_by(EconomicIndicator.date.desc()).limit(limit)
         
-        results = query.all()
+        results = (await db.execute(query)).all()
         
         # Formatear datos
         data_points = []
@@ -92,54 +115,56 @@ async def get_historical_data(
 @router.get("/timeseries/{indicator}")
 async def get_timeseries_data(
     indicator: str,
-    period: str = Query("daily", description="Período: daily, weekly, monthly"),
+    period: str = Query("daily", description="Período: raw, daily, weekly, monthly", pattern="^(raw|daily|weekly|monthly)$"),
     days: int = Query(30, description="Días de historial", ge=1, le=365),
-    db: Session = Depends(get_db)
+    aggregate: str = Query("last", description="Agregación por período: last, mean, ohlc", pattern="^(last|mean|ohlc)$"),
+    max_points: Optional[int] = Query(None, description="Máximo de puntos (downsampling LTTB para gráficos)", ge=3, le=10000)
 ):
     """Obtener serie temporal de un indicador específico"""
     try:
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        # Buscar datos del indicador
-        data = db.query(EconomicIndicator).filter(
-            EconomicIndicator.indicator_type == indicator,
-            EconomicIndicator.date >= cutoff_date
-        ).order_by(EconomicIndicator.date.asc()).all()
+        # Buscar datos del indicador en el store columnar
+        timestamps, values, meta = await load_series(indicator, start=cutoff_date)
         
-        if not data:
+        if not len(timestamps):
             raise HTTPException(
                 status_code=404, 
                 detail=f"No data found for indicator '{indicator}'"
             )
         
-        # Procesar según el período
-        timeseries = []
-        for record in data:
-            timeseries.append({
-                "date": record.date.isoformat(),
-                "value": record.value,
-                "source": record.source
-            })
+        # Procesar según el período (agregación vectorizada por bucket)
+        series = resample(timestamps, values, period, aggregate)
+        if max_points:
+            series = downsample(series, max_points)
         
-        # Calcular estadísticas básicas
-        values = [record.value for record in data if record.value is not None]
-        statistics = {}
+        source = meta.get("source")
+        columns = {name: series[name].tolist() for name in ("open", "high", "low", "close", "count") if name in series}
+        timeseries = [
+            {"date": date, "value": value, "source": source}
+            for date, value in zip(to_isoformat(series["timestamp"]), series["value"].tolist())
+        ]
+        for i, point in enumerate(timeseries):
+            for name, column in columns.items():
+                point[name] = column[i]
         
-        if values:
-            statistics = {
-                "count": len(values),
-                "min": min(values),
-                "max": max(values),
-                "average": sum(values) / len(values),
-                "latest": values[-1] if values else None,
-                "change": values[-1] - values[0] if len(values) > 1 else 0
-            }
+        # Calcular estadísticas básicas (vectorizadas)
+        statistics = {
+            "count": int(len(values)),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "average": float(values.mean()),
+            "latest": float(values[-1]),
+            "change": float(values[-1] - values[0]) if len(values) > 1 else 0
+        }
         
         return {
             "status": "success",
             "indicator": indicator,
             "period": period,
+            "aggregate": aggregate,
             "days": days,
+            "raw_points": int(len(values)),
             "timeseries": timeseries,
             "statistics": statistics,
             "timestamp": datetime.now().isoformat()
@@ -151,103 +176,140 @@ async def get_timeseries_data(
         logger.error(f"Error getting timeseries for {indicator}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+EXPORT_COLUMNS = ("indicator_type", "value", "date", "source")
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {
+    "csv": ("text/csv", csv_chunks),
+    "ndjson": ("application/x-ndjson", ndjson_chunks),
+}
+EXPORT_SCHEMA = (
+    ("indicator_type", "string"),
+    ("value", "float64"),
+    ("date", "timestamp"),
+    ("source", "string"),
+)
+
+
+def _export_statement(indicator: Optional[str], days: int):
+    cutoff_date = datetime.now() - timedelta(days=days)
+    stmt = select(
+        EconomicIndicator.indicator_type,
+        EconomicIndicator.value,
+        EconomicIndicator.date,
+        EconomicIndicator.source
+    ).where(EconomicIndicator.date >= cutoff_date)
+
+    if indicator:
+        stmt = stmt.where(EconomicIndicator.indicator_type == indicator)
+
+    return stmt.order_by(EconomicIndicator.date.desc())
+
+
+def _export_batches(stmt) -> Iterator[List[Any]]:
+    """
+    Filas en lotes con cursor del lado del servidor (yield_per). Abre su
+    propia sesión: el generador corre después de que el endpoint retorna.
+    """
+    db = ReadSessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE, stream_results=True))
+        for partition in result.partitions():
+            yield partition
+    finally:
+        db.close()
+
+
 @router.get("/export/{format}")
 async def export_data(
     format: str,
+    request: Request,
     indicator: Optional[str] = Query(None, description="Indicador específico"),
-    days: int = Query(30, description="Días de datos", ge=1, le=365),
-    db: Session = Depends(get_db)
+    days: int = Query(30, description="Días de datos", ge=1, le=365)
 ):
-    """Exportar datos en diferentes formatos"""
+    """Exportar datos en diferentes formatos (json/csv/ndjson en streaming)"""
+    format = format.lower()
     
     # Validar formato
-    if format.lower() not in ["json", "csv"]:
+    if format not in ["json", *EXPORT_MEDIA_TYPES, *COLUMNAR_FORMATS]:
         raise HTTPException(
             status_code=400, 
-            detail="Format must be 'json' or 'csv'"
+            detail="Format must be 'json', 'csv', 'ndjson', 'parquet' or 'arrow'"
         )
+    if format in COLUMNAR_FORMATS and not columnar.is_available():
+        raise HTTPException(status_code=501, detail=f"Format '{format}' requires pyarrow")
     
     try:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        query = db.query(EconomicIndicator).filter(
-            EconomicIndicator.date >= cutoff_date
-        )
+        stmt = _export_statement(indicator, days)
         
-        if indicator:
-            query = query.filter(EconomicIndicator.indicator_type == indicator)
+        # Parquet / Arrow: arrays por columna, un RecordBatch por lote
+        if format in COLUMNAR_FORMATS:
+            media_type, extension = COLUMNAR_FORMATS[format]
+            content = await asyncio.to_thread(
+                columnar.write_columnar,
+                _export_batches(stmt),
+                columnar.schema(EXPORT_SCHEMA),
+                format
+            )
+            return Response(
+                content=content,
+                media_type=media_type,
+                headers={"Content-Disposition": f"attachment; filename=indicators_{days}days.{extension}"}
+            )
         
-        data = query.order_by(EconomicIndicator.date.desc()).all()
+        # JSON / CSV / NDJSON: streaming por lotes, memoria constante (el
+        # generador sync corre en el threadpool, fuera del event loop)
+        headers = {"Vary": "Accept-Encoding"}
+        if format == "json":
+            media_type = "application/json"
+            body = json_chunks(_export_batches(stmt), EXPORT_COLUMNS, {"status": "success", "format": "json"})
+        else:
+            media_type, serializer = EXPORT_MEDIA_TYPES[format]
+            body = serializer(_export_batches(stmt), EXPORT_COLUMNS)
+            headers["Content-Disposition"] = f"attachment; filename=indicators_{days}days.{format}"
         
-        if format.lower() == "json":
-            export_data = []
-            for record in data:
-                export_data.append({
-                    "indicator_type": record.indicator_type,
-                    "value": record.value,
-                    "date": record.date.isoformat(),
-                    "source": record.source
-                })
-            
-            return {
-                "status": "success",
-                "format": "json",
-                "data": export_data,
-                "count": len(export_data)
-            }
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            body = gzip_chunks(body)
+            headers["Content-Encoding"] = "gzip"
         
-        elif format.lower() == "csv":
-            # Para CSV, devolver como texto plano
-            from fastapi.responses import PlainTextResponse
-            
-            csv_lines = ["indicator_type,value,date,source"]
-            for record in data:
-                csv_lines.append(
-                    f"{record.indicator_type},{record.value},{record.date.isoformat()},{record.source}"
-                )
-            
-            csv_content = "\n".join(csv_lines)
-            
-            return PlainTextResponse(
-                content=csv_content,
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename=indicators_{days}days.csv"}
-            )
+        return StreamingResponse(body, media_type=media_type, headers=headers)
     
     except Exception as e:
         logger.error(f"Error exporting data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/stats")
-async def get_data_stats(db: Session = Depends(get_db)):
+async def get_data_stats(db: AsyncSession = Depends(get_async_db)):
     """Obtener estadísticas generales de los datos"""
     try:
-        from sqlalchemy import func, distinct
-        
         # Estadísticas básicas
-        total_records = db.query(EconomicIndicator).count()
-        active_records = db.query(EconomicIndicator).filter(
-            EconomicIndicator.is_active == True
-        ).count()
+        total_records = await db.scalar(select(func.count(EconomicIndicator.id)))
+        active_records = await db.scalar(
+            select(func.count(EconomicIndicator.id)).where(EconomicIndicator.is_active == True)
+        )
         
         # Indicadores únicos
-        unique_indicators = db.query(
-            distinct(EconomicIndicator.indicator_type)
-        ).count()
+        unique_indicators = await db.scalar(
+            select(func.count(distinct(EconomicIndicator.indicator_type)))
+        )
         
         # Fuentes de datos
-        sources = db.query(
-            EconomicIndicator.source,
-            func.count(EconomicIndicator.id).label('count')
-        ).group_by(EconomicIndicator.source).all()
+        sources = (await db.execute(
+            select(
+                EconomicIndicator.source,
+                func.count(EconomicIndicator.id).label('count')
+            ).group_by(EconomicIndicator.source)
+        )).all()
         
         # Datos por día (últimos 7 días)
         last_week = datetime.now() - timedelta(days=7)
-        daily_stats = db.query(
-            func.date(EconomicIndicator.date).label('day'),
-            func.count(EconomicIndicator.id).label('count')
-        ).filter(
-            EconomicIndicator.date >= last_week
-        ).group_by(func.date(EconomicIndicator.date)).all()
+        daily_stats = (await db.execute(
+            select(
+                func.date(EconomicIndicator.date).label('day'),
+                func.count(EconomicIndicator.id).label('count')
+            ).where(
+                EconomicIndicator.date >= last_week
+            ).group_by(func.date(EconomicIndicator.date))
+        )).all()
         
         return {
             "status": "success",
@@ -3,19 +3,34 @@
 Router para cards económicas con modales y gráficos históricos elegantes
 """
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 import logging
 
+from ..database import get_async_db
+from ..services import snapshot_service
+from ..utils.conditional import is_not_modified, make_etag, not_modified, validator_headers
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/cards", tags=["Economic Cards"])
 
+
+def cards_etag(version: snapshot_service.SnapshotVersion, category: Optional[str], limit: int) -> str:
+    """ETag de la lista de cards: versión del snapshot + parámetros de la vista"""
+    return make_etag("cards", category.lower() if category else None, limit,
+                     version.count, version.last_id)
+
+
 @router.get("/", response_model=Dict[str, Any])
 async def get_economic_cards(
+    request: Request,
+    response: Response,
     category: Optional[str] = Query(None, description="Filtrar por categoría"),
-    limit: int = Query(8, ge=1, le=20, description="Número máximo de cards")
+    limit: int = Query(8, ge=1, le=20, description="Número máximo de cards"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Obtiene todas las cards de indicadores económicos
@@ -29,6 +44,14 @@ async def get_economic_cards(
     - reserves: Reservas
     """
     try:
+        # 304 antes de ir a las fuentes: el validador sale de la versión del
+        # snapshot (misma consulta cacheada que /indicators/current)
+        version = await snapshot_service.get_version_async(db)
+        etag = cards_etag(version, category, limit)
+        if is_not_modified(request.headers, etag, version.updated_at):
+            return not_modified(etag, version.updated_at)
+        response.headers.update(validator_headers(etag, version.updated_at))
+
         from ..services.enhanced_economic_service import enhanced_economic_service
         
         async with enhanced_economic_service as service:
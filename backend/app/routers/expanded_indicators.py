@@ -3,19 +3,33 @@
 API Endpoints expandidos para TODOS los indicadores de la plataforma
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 
 from ..database import get_db
-from ..services.expanded_data_service import ExpandedDataService
+from ..services.expanded_data_service import META_KEYS, ExpandedDataService
 from ..config.indicators_mapping import ALL_INDICATORS, CATEGORIES, IMPLEMENTATION_PRIORITY
 from ..models import EconomicIndicator, HistoricalData
+from ..utils import columnar
+from ..utils.columnar import COLUMNAR_FORMATS
+from ..utils.conditional import PrecomputedResponse
+from ..utils.streaming import csv_chunks
+from ..utils.swr import swr_store
 
 router = APIRouter(prefix="/api/v1", tags=["Expanded Indicators"])
 
+def _stale_indicators(data: Dict[str, Any]) -> List[str]:
+    """Indicadores servidos desde cache vencido (refrescándose en background)"""
+    return sorted(
+        name
+        for category in data.values() if isinstance(category, dict)
+        for name, item in category.items()
+        if isinstance(item, dict) and item.get("stale")
+    )
+
 # ENDPOINT PRINCIPAL - TODOS LOS DATOS
 @router.get("/dashboard/complete")
 async def get_complete_dashboard():
@@ -28,12 +42,15 @@ async def get_complete_dashboard():
             all_data = await service.get_all_indicators()
             
             if all_data.get("status") == "success":
+                stale = _stale_indicators(all_data["data"])
                 return {
                     "status": "success",
                     "data": all_data["data"],
                     "metadata": {
                         "total_indicators": all_data.get("total_indicators", 0),
                         "categories": list(all_data["data"].keys()),
+                        "stale": bool(stale),
+                        "stale_indicators": stale,
                         "timestamp": all_data["timestamp"],
                         "version": "1.0.0"
                     }
@@ -189,24 +206,8 @@ async def get_single_indicator(indicator_name: str):
                 break
         
         async with ExpandedDataService() as service:
-            # Obtener datos de la categoría correspondiente
-            if category == "economia":
-                category_data = await service.get_economic_indicators()
-            elif category == "gobierno":
-                category_data = await service.get_government_indicators()
-            elif category == "finanzas":
-                category_data = await service.get_financial_indicators()
-            elif category == "mercados":
-                category_data = await service.get_market_indicators()
-            elif category == "tecnologia":
-                category_data = await service.get_tech_indicators()
-            elif category == "industria":
-                category_data = await service.get_industry_indicators()
-            else:
-                raise HTTPException(status_code=500, detail="Category not found")
-            
-            # Extraer datos del indicador específico
-            indicator_data = category_data.get(indicator_name, {})
+            # Solo se consulta la fuente de este indicador
+            indicator_data, source_status = await service.get_indicator(indicator_name)
             
             return {
                 "status": "success",
@@ -214,6 +215,7 @@ async def get_single_indicator(indicator_name: str):
                 "category": category,
                 "metadata": ALL_INDICATORS[indicator_name],
                 "current_data": indicator_data,
+                "source_status": source_status,
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -223,39 +225,44 @@ async def get_single_indicator(indicator_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 # ENDPOINTS DE CONFIGURACIÓN Y METADATOS
+# Contenido estático: body y ETag se calculan una vez al importar el router
+CONFIG_CATEGORIES = PrecomputedResponse({
+    "status": "success",
+    "categories": CATEGORIES,
+    "total_categories": len(CATEGORIES),
+    "total_indicators": len(ALL_INDICATORS)
+})
+CONFIG_INDICATORS = PrecomputedResponse({
+    "status": "success",
+    "indicators": ALL_INDICATORS,
+    "implementation_priority": IMPLEMENTATION_PRIORITY,
+    "total_indicators": len(ALL_INDICATORS)
+})
+CONFIG_PRIORITY = PrecomputedResponse({
+    "status": "success",
+    "priority": IMPLEMENTATION_PRIORITY,
+    "phases": {
+        "phase_1": "APIs oficiales fáciles (BCRA, INDEC)",
+        "phase_2": "APIs más complejas",
+        "phase_3": "Scraping de sitios web",
+        "phase_4": "Datos de actualización manual"
+    }
+})
+
 @router.get("/config/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Obtener configuración de todas las categorías"""
-    return {
-        "status": "success",
-        "categories": CATEGORIES,
-        "total_categories": len(CATEGORIES),
-        "total_indicators": len(ALL_INDICATORS)
-    }
+    return CONFIG_CATEGORIES.respond(request)
 
 @router.get("/config/indicators")
-async def get_indicators_config():
+async def get_indicators_config(request: Request):
     """Obtener configuración de todos los indicadores"""
-    return {
-        "status": "success",
-        "indicators": ALL_INDICATORS,
-        "implementation_priority": IMPLEMENTATION_PRIORITY,
-        "total_indicators": len(ALL_INDICATORS)
-    }
+    return CONFIG_INDICATORS.respond(request)
 
 @router.get("/config/priority")
-async def get_implementation_priority():
+async def get_implementation_priority(request: Request):
     """Obtener prioridades de implementación"""
-    return {
-        "status": "success",
-        "priority": IMPLEMENTATION_PRIORITY,
-        "phases": {
-            "phase_1": "APIs oficiales fáciles (BCRA, INDEC)",
-            "phase_2": "APIs más complejas",
-            "phase_3": "Scraping de sitios web",
-            "phase_4": "Datos de actualización manual"
-        }
-    }
+    return CONFIG_PRIORITY.respond(request)
 
 # ENDPOINTS DE BÚSQUEDA Y FILTROS
 @router.get("/indicators/search")
@@ -418,21 +425,68 @@ async def get_platform_stats():
                 "INDEC": len([i for i in ALL_INDICATORS.values() if i["source"] == "INDEC"]),
                 "BYMA": len([i for i in ALL_INDICATORS.values() if i["source"] == "BYMA"]),
                 "Others": len([i for i in ALL_INDICATORS.values() if i["source"] not in ["BCRA", "INDEC", "BYMA"]])
-            }
+            },
+            "freshness": swr_store.get_stats()
         },
         "timestamp": datetime.now().isoformat()
     }
 
 # ENDPOINTS DE EXPORTACIÓN
+EXPORT_FIELDS = (
+    ("category", "string"),
+    ("indicator", "string"),
+    ("value", "float64"),
+    ("date", "string"),
+    ("source", "string"),
+    ("unit", "string"),
+    ("status", "string"),
+)
+CATEGORY_FETCHERS = {
+    "economia": "get_economic_indicators",
+    "gobierno": "get_government_indicators",
+    "finanzas": "get_financial_indicators",
+    "mercados": "get_market_indicators",
+    "tecnologia": "get_tech_indicators",
+    "industria": "get_industry_indicators",
+}
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _export_rows(data: Dict[str, Any], wanted: Optional[set] = None) -> List[tuple]:
+    """Aplanar {categoría: {indicador: {...}}} a filas (una por indicador)"""
+    rows = []
+    for category, items in data.items():
+        if not isinstance(items, dict):
+            continue
+        for name, item in items.items():
+            if name in META_KEYS or not isinstance(item, dict) or (wanted and name not in wanted):
+                continue
+            rows.append((
+                category,
+                name,
+                _as_float(item.get("value")),
+                None if item.get("date") is None else str(item.get("date")),
+                item.get("source"),
+                item.get("unit"),
+                item.get("status"),
+            ))
+    return rows
+
 @router.get("/export/{format}")
 async def export_data(
     format: str,
     category: Optional[str] = None,
     indicators: Optional[str] = None
 ):
-    """Exportar datos en diferentes formatos (JSON, CSV, etc.)"""
-    if format not in ["json", "csv"]:
-        raise HTTPException(status_code=400, detail="Format must be 'json' or 'csv'")
+    """Exportar datos en diferentes formatos (JSON, CSV, Parquet, Arrow)"""
+    if format not in ["json", "csv", *COLUMNAR_FORMATS]:
+        raise HTTPException(status_code=400, detail="Format must be 'json', 'csv', 'parquet' or 'arrow'")
+    if format in COLUMNAR_FORMATS and not columnar.is_available():
+        raise HTTPException(status_code=501, detail=f"Format '{format}' requires pyarrow")
     
     try:
         async with ExpandedDataService() as service:
@@ -441,21 +495,37 @@ async def export_data(
                 if category not in CATEGORIES:
                     raise HTTPException(status_code=404, detail=f"Category '{category}' not found")
                 
-                # Obtener datos de la categoría
-                # ... implementar lógica de exportación
-                pass
+                data = {category: await getattr(service, CATEGORY_FETCHERS[category])()}
             else:
                 # Exportar todos los datos
                 all_data = await service.get_all_indicators()
-                
                 if format == "json":
                     return JSONResponse(content=all_data)
-                elif format == "csv":
-                    # Convertir a CSV
-                    # ... implementar conversión
-                    pass
+                data = all_data.get("data", {})
         
-        return {"status": "success", "message": f"Export in {format} format completed"}
+        if format == "json":
+            return JSONResponse(content=data)
         
+        wanted = {name.strip() for name in indicators.split(",")} if indicators else None
+        rows = _export_rows(data, wanted)
+        filename = f"indicators_{category or 'all'}"
+        
+        if format == "csv":
+            return Response(
+                content=b"".join(csv_chunks([rows], [name for name, _ in EXPORT_FIELDS])),
+                media_type="text/csv",
+                headers={"Content-Disposition": f"attachment; filename={filename}.csv"}
+            )
+        
+        media_type, extension = COLUMNAR_FORMATS[format]
+        content = columnar.write_columnar([rows], columnar.schema(EXPORT_FIELDS), format)
+        return Response(
+            content=content,
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename={filename}.{extension}"}
+        )
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -5,11 +5,11 @@ Router de Health Check y monitoreo del sistema
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from datetime import datetime
-import psutil
 import logging
 
-from ..database import get_db
+from ..database import get_db, get_pool_stats
 from ..models import HealthCheck
+from ..services.health_monitor import health_monitor
 from ..services.scheduler import scheduler
 
 logger = logging.getLogger(__name__)
@@ -26,71 +26,40 @@ async def health_check():
     }
 
 @router.get("/health/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)):
-    """Health check detallado con métricas del sistema"""
+async def detailed_health_check():
+    """
+    Health check detallado con métricas del sistema.
+    Lee el snapshot del sampler de background (ver services/health_monitor.py):
+    no hace I/O, apto para balanceadores que consultan cada pocos segundos.
+    """
     try:
-        # Test de base de datos
-        db_healthy = True
-        try:
-            db.execute("SELECT 1")
-        except Exception as e:
-            db_healthy = False
-            logger.error(f"Database health check failed: {e}")
-
-        # Métricas del sistema
-        cpu_percent = 0
-        memory_percent = 0
-        disk_percent = 0
-        
-        try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            disk = psutil.disk_usage('/')
-            disk_percent = disk.percent
-        except ImportError:
-            logger.warning("psutil not available for system metrics")
-        except Exception as e:
-            logger.error(f"System metrics error: {e}")
+        snapshot = health_monitor.snapshot()
+        database = snapshot["database"]
+        system = snapshot["system"]
 
         # Estado del scheduler
         scheduler_status = scheduler.get_status() if hasattr(scheduler, 'get_status') else {"running": False}
 
-        # Determinar estado general
-        overall_status = "healthy"
-        if not db_healthy:
-            overall_status = "unhealthy"
-        elif cpu_percent > 80 or memory_percent > 80:
-            overall_status = "degraded"
-
-        # Guardar health check en DB
-        try:
-            health_record = HealthCheck(
-                status=overall_status,
-                services=f"{{'database': {db_healthy}, 'scheduler': {scheduler_status.get('running', False)}}}",
-                uptime_seconds=scheduler_status.get('uptime_seconds', 0),
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                disk_percent=disk_percent,
-                timestamp=datetime.now()
-            )
-            db.add(health_record)
-            db.commit()
-        except Exception as e:
-            logger.error(f"Failed to save health check: {e}")
-
         return {
-            "status": overall_status,
+            "status": snapshot["status"],
             "timestamp": datetime.now().isoformat(),
+            "sample_age_seconds": snapshot["sample_age_seconds"],
             "services": {
-                "database": db_healthy,
-                "scheduler": scheduler_status.get('running', False)
+                "database": database.get("healthy", False),
+                "scheduler": scheduler_status.get('running', False),
+                "sampler": health_monitor.running
             },
+            "database": database,
+            "database_pool": get_pool_stats(),
             "system_metrics": {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory_percent,
-                "disk_percent": disk_percent
+                "cpu_percent": system.get("cpu_percent", 0),
+                "memory_percent": system.get("memory_percent", 0),
+                "disk_percent": system.get("disk_percent", 0),
+                "process_rss_mb": system.get("process_rss_mb"),
+                "load_average": system.get("load_average")
             },
+            "upstreams": snapshot["upstreams"],
+            "circuit_breakers": snapshot["circuit_breakers"],
             "scheduler": scheduler_status
         }
 
@@ -2,36 +2,42 @@
 """
 Router principal de indicadores económicos
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
 from typing import Optional, List
 from datetime import datetime, timedelta
 
-from ..database import get_db
+from ..database import get_async_db, get_db
 from ..models import EconomicIndicator, HistoricalData
 from ..services.bcra_service import bcra_service
+from ..services import snapshot_service
+from ..services.ingestion import ingest_indicators
+from ..services.timeseries_store import load_series
+from ..utils.conditional import is_not_modified, make_etag, not_modified, validator_headers
+from ..utils.resampling import lttb_indices
+from ..utils.timeseries import to_isoformat
 from ..config.indicators_mapping import ALL_INDICATORS
 
 router = APIRouter()
 
 @router.get("/indicators/current")
-async def get_current_indicators(db: Session = Depends(get_db)):
+async def get_current_indicators(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """Obtener indicadores económicos actuales"""
     try:
-        # Obtener últimos indicadores de cada tipo
-        subquery = db.query(
-            EconomicIndicator.indicator_type,
-            func.max(EconomicIndicator.date).label('max_date')
-        ).filter(
-            EconomicIndicator.is_active == True
-        ).group_by(EconomicIndicator.indicator_type).subquery()
+        # 304 si el snapshot no cambió desde el último poll del cliente
+        version = await snapshot_service.get_version_async(db)
+        etag = make_etag("current", version.count, version.last_id)
+        if is_not_modified(request.headers, etag, version.updated_at):
+            return not_modified(etag, version.updated_at)
+        response.headers.update(validator_headers(etag, version.updated_at))
 
-        current_indicators = db.query(EconomicIndicator).join(
-            subquery,
-            (EconomicIndicator.indicator_type == subquery.c.indicator_type) &
-            (EconomicIndicator.date == subquery.c.max_date)
-        ).all()
+        # Últimos indicadores de cada tipo (snapshot mantenido en escritura)
+        current_indicators = await snapshot_service.get_current_async(db)
 
         # Formatear respuesta
         indicators_data = []
@@ -59,14 +65,18 @@ async def get_current_indicators(db: Session = Depends(get_db)):
 @router.get("/indicators/{indicator_type}")
 async def get_indicator_by_type(
     indicator_type: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Obtener un indicador específico por tipo"""
     try:
-        indicator = db.query(EconomicIndicator).filter(
-            EconomicIndicator.indicator_type == indicator_type,
-            EconomicIndicator.is_active == True
-        ).order_by(EconomicIndicator.date.desc()).first()
+        version = await snapshot_service.get_version_async(db, indicator_type)
+        etag = make_etag("indicator", indicator_type, version.last_id)
+        if version.count and is_not_modified(request.headers, etag, version.updated_at):
+            return not_modified(etag, version.updated_at)
+
+        indicator = await snapshot_service.get_one_async(db, indicator_type)
 
         if not indicator:
             raise HTTPException(
@@ -74,6 +84,7 @@ async def get_indicator_by_type(
                 detail=f"Indicator '{indicator_type}' not found"
             )
 
+        response.headers.update(validator_headers(etag, version.updated_at))
         return {
             "status": "success",
             "indicator": {
@@ -97,39 +108,31 @@ async def get_indicator_by_type(
 async def get_historical_data(
     indicator_type: str,
     days: int = Query(30, description="Días de historial", ge=1, le=365),
-    db: Session = Depends(get_db)
+    max_points: Optional[int] = Query(None, description="Máximo de puntos (downsampling LTTB para gráficos)", ge=3, le=10000)
 ):
     """Obtener datos históricos de un indicador"""
     try:
         cutoff_date = datetime.now() - timedelta(days=days)
         
-        # Buscar en HistoricalData primero
-        historical_data = db.query(HistoricalData).filter(
-            HistoricalData.indicator_type == indicator_type,
-            HistoricalData.date >= cutoff_date
-        ).order_by(HistoricalData.date.asc()).all()
+        # Store columnar (backfill desde HistoricalData/EconomicIndicator la primera vez)
+        timestamps, values, meta = await load_series(indicator_type, start=cutoff_date)
 
-        # Si no hay datos históricos, buscar en EconomicIndicator
-        if not historical_data:
-            historical_data = db.query(EconomicIndicator).filter(
-                EconomicIndicator.indicator_type == indicator_type,
-                EconomicIndicator.date >= cutoff_date
-            ).order_by(EconomicIndicator.date.asc()).all()
-
-        if not historical_data:
+        if not len(timestamps):
             raise HTTPException(
                 status_code=404, 
                 detail=f"No historical data found for '{indicator_type}'"
             )
 
+        if max_points:
+            indices = lttb_indices(timestamps, values, max_points)
+            timestamps, values = timestamps[indices], values[indices]
+
         # Formatear datos
-        data_points = []
-        for record in historical_data:
-            data_points.append({
-                "date": record.date.isoformat(),
-                "value": record.value,
-                "source": record.source
-            })
+        source = meta.get("source")
+        data_points = [
+            {"date": date, "value": value, "source": source}
+            for date, value in zip(to_isoformat(timestamps), values.tolist())
+        ]
 
         return {
             "status": "success",
@@ -156,27 +159,18 @@ async def refresh_indicators(background_tasks: BackgroundTasks):
                 if data.get("indicators"):
                     db = next(get_db())
                     try:
-                        for key, indicator_data in data["indicators"].items():
-                            # Desactivar indicadores anteriores
-                            db.query(EconomicIndicator).filter(
-                                EconomicIndicator.indicator_type == key,
-                                EconomicIndicator.is_active == True
-                            ).update({"is_active": False})
-                            
-                            # Crear nuevo indicador
-                            new_indicator = EconomicIndicator(
-                                indicator_type=key,
-                                value=indicator_data["value"],
-                                source=indicator_data["source"],
-                                unit=indicator_data.get("unit"),
-                                label=indicator_data.get("label"),
-                                category=indicator_data.get("category"),
-                                date=datetime.now(),
-                                is_active=True
-                            )
-                            db.add(new_indicator)
-                        
-                        db.commit()
+                        # Desactivar anteriores + insertar nuevos en una transacción
+                        ingest_indicators(db, [
+                            {
+                                "indicator_type": key,
+                                "value": indicator_data["value"],
+                                "source": indicator_data["source"],
+                                "unit": indicator_data.get("unit"),
+                                "label": indicator_data.get("label"),
+                                "category": indicator_data.get("category")
+                            }
+                            for key, indicator_data in data["indicators"].items()
+                        ])
                         print("✅ Indicators refreshed successfully")
                     finally:
                         db.close()
@@ -197,39 +191,12 @@ async def search_indicators(
     q: str = Query(..., description="Término de búsqueda"),
     source: Optional[str] = Query(None, description="Filtrar por fuente"),
     category: Optional[str] = Query(None, description="Filtrar por categoría"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Buscar indicadores"""
     try:
-        query = db.query(EconomicIndicator).filter(
-            EconomicIndicator.is_active == True
-        )
-        
-        # Filtro de búsqueda en label o indicator_type
-        search_term = f"%{q.lower()}%"
-        query = query.filter(
-            (func.lower(EconomicIndicator.label).like(search_term)) |
-            (func.lower(EconomicIndicator.indicator_type).like(search_term))
-        )
-        
-        # Filtros adicionales
-        if source:
-            query = query.filter(EconomicIndicator.source == source.upper())
-        
-        if category:
-            query = query.filter(EconomicIndicator.category == category.lower())
-        
-        # Obtener solo el más reciente de cada tipo
-        subquery = query.with_entities(
-            EconomicIndicator.indicator_type,
-            func.max(EconomicIndicator.date).label('max_date')
-        ).group_by(EconomicIndicator.indicator_type).subquery()
-        
-        results = db.query(EconomicIndicator).join(
-            subquery,
-            (EconomicIndicator.indicator_type == subquery.c.indicator_type) &
-            (EconomicIndicator.date == subquery.c.max_date)
-        ).limit(20).all()
+        # Búsqueda sobre el valor vigente de cada tipo
+        results = await snapshot_service.search_async(db, q, source=source, category=category, limit=20)
         
         return {
             "status": "success",
@@ -253,26 +220,30 @@ async def search_indicators(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/indicators/stats")
-async def get_indicators_stats(db: Session = Depends(get_db)):
+async def get_indicators_stats(db: AsyncSession = Depends(get_async_db)):
     """Obtener estadísticas de indicadores"""
     try:
-        total_indicators = db.query(EconomicIndicator).filter(
-            EconomicIndicator.is_active == True
-        ).count()
+        total_indicators = await db.scalar(
+            select(func.count(EconomicIndicator.id)).where(EconomicIndicator.is_active == True)
+        )
         
-        sources_stats = db.query(
-            EconomicIndicator.source,
-            func.count(EconomicIndicator.id).label('count')
-        ).filter(
-            EconomicIndicator.is_active == True
-        ).group_by(EconomicIndicator.source).all()
+        sources_stats = (await db.execute(
+            select(
+                EconomicIndicator.source,
+                func.count(EconomicIndicator.id).label('count')
+            ).where(
+                EconomicIndicator.is_active == True
+            ).group_by(EconomicIndicator.source)
+        )).all()
         
-        categories_stats = db.query(
-            EconomicIndicator.category,
-            func.count(EconomicIndicator.id).label('count')
-        ).filter(
-            EconomicIndicator.is_active == True
-        ).group_by(EconomicIndicator.category).all()
+        categories_stats = (await db.execute(
+            select(
+                EconomicIndicator.category,
+                func.count(EconomicIndicator.id).label('count')
+            ).where(
+                EconomicIndicator.is_active == True
+            ).group_by(EconomicIndicator.category)
+        )).all()
         
         return {
             "status": "success",
@@ -0,0 +1,129 @@
+# backend/app/routers/live.py
+"""
+Router de actualizaciones en vivo (Server-Sent Events y WebSocket)
+
+Los clientes se suscriben a categorías (`?topics=economia,mercados`) y
+reciben solo los indicadores que cambiaron en cada ingesta, en lugar de
+hacer polling de los endpoints REST.
+"""
+import asyncio
+import logging
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from ..database import get_async_sessionmaker
+from ..services import live_updates, snapshot_service
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1/live", tags=["Live Updates"])
+
+HEARTBEAT_SECONDS = float(os.getenv("LIVE_HEARTBEAT_SECONDS", "15"))
+SSE_RETRY_MS = 3000
+
+
+def _topics_or_400(topics: Optional[str]) -> List[str]:
+    try:
+        return live_updates.parse_topics(topics)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _snapshot_messages(topics: List[str]) -> List[tuple]:
+    """Estado actual (un mensaje por tópico) para que el cliente arranque sin pedir REST"""
+    async with get_async_sessionmaker()() as db:
+        current = await snapshot_service.get_current_async(db)
+
+    grouped = live_updates.group_by_topic(
+        {column: getattr(row, column) for column in ("indicator_type", "value", "source", "date", "unit", "label")}
+        for row in current
+    )
+    return [
+        (topic, live_updates.encode_message(topic, indicators, event="snapshot"))
+        for topic, indicators in grouped.items()
+        if not topics or topic in topics
+    ]
+
+
+@router.get("/topics")
+async def get_topics():
+    """Tópicos disponibles y estado de las suscripciones"""
+    return {
+        "status": "success",
+        "topics": live_updates.TOPICS,
+        "stats": live_updates.get_stats()
+    }
+
+
+@router.get("/sse")
+async def stream_sse(
+    request: Request,
+    topics: Optional[str] = Query(None, description="Categorías separadas por coma (vacío = todas)"),
+    snapshot: bool = Query(True, description="Enviar el estado actual al conectar")
+):
+    """Stream SSE de indicadores que cambian"""
+    selected = _topics_or_400(topics)
+    initial = await _snapshot_messages(selected) if snapshot else []
+
+    async def events():
+        with live_updates.broadcaster.subscribe(selected) as subscription:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            for _, message in initial:
+                yield f"event: snapshot\ndata: {message}\n\n"
+
+            while not await request.is_disconnected():
+                message = await subscription.get(timeout=HEARTBEAT_SECONDS)
+                if message is None:
+                    yield ": ping\n\n"  # mantiene viva la conexión a través de proxies
+                else:
+                    yield f"event: indicators\ndata: {message}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def stream_websocket(websocket: WebSocket, topics: Optional[str] = None):
+    """
+    WebSocket de indicadores que cambian. El cliente puede cambiar de
+    tópicos enviando {"action": "subscribe" | "unsubscribe", "topics": [...]}
+    """
+    try:
+        selected = live_updates.parse_topics(topics)
+    except ValueError as e:
+        await websocket.close(code=1008, reason=str(e))
+        return
+
+    await websocket.accept()
+    with live_updates.broadcaster.subscribe(selected) as subscription:
+        for _, message in await _snapshot_messages(selected):
+            await websocket.send_text(message)
+
+        async def forward():
+            while True:
+                message = await subscription.get(timeout=HEARTBEAT_SECONDS)
+                await websocket.send_text(message if message is not None else '{"event": "ping"}')
+
+        async def receive():
+            while True:
+                command = await websocket.receive_json()
+                requested = [t for t in command.get("topics", []) if t in live_updates.TOPICS]
+                if command.get("action") == "subscribe":
+                    subscription.update_topics(subscribe=requested)
+                elif command.get("action") == "unsubscribe":
+                    subscription.update_topics(unsubscribe=requested)
+
+        tasks = [asyncio.create_task(forward()), asyncio.create_task(receive())]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() and not isinstance(task.exception(), WebSocketDisconnect):
+                    logger.warning(f"Live websocket closed: {task.exception()}")
+        finally:
+            for task in tasks:
+                task.cancel()
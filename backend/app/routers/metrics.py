@@ -0,0 +1,17 @@
+# backend/app/routers/metrics.py
+"""
+Router de métricas en formato Prometheus (`GET /metrics`)
+"""
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from ..services import metrics_service
+from ..utils.metrics import CONTENT_TYPE
+
+router = APIRouter(tags=["Monitoring"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Exposición de métricas para scraping de Prometheus"""
+    return Response(content=metrics_service.render(), media_type=CONTENT_TYPE)
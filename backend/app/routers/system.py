@@ -2,13 +2,14 @@
 """
 Router de sistema y administración
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 
 from ..database import get_db
-from ..models import Configuration, APIUsage
+from ..models import Configuration, APIUsage, HealthCheck, EconomicIndicator
+from ..services.api_usage import usage_recorder, usage_stats
 from ..services.scheduler import scheduler
 from ..config import settings
 
@@ -155,51 +156,16 @@ async def stop_scheduler_endpoint():
 
 @router.get("/system/api-usage")
 async def get_api_usage_stats(
-    hours: int = 24,
+    hours: int = Query(24, ge=1, le=24 * 365),
     db: Session = Depends(get_db)
 ):
-    """Estadísticas de uso de la API"""
+    """Estadísticas de uso de la API (desde los rollups por minuto/hora)"""
     try:
-        cutoff = datetime.now() - timedelta(hours=hours)
-        
-        # Total requests
-        total_requests = db.query(APIUsage).filter(
-            APIUsage.timestamp >= cutoff
-        ).count()
-        
-        # Requests por endpoint
-        endpoint_stats = db.query(
-            APIUsage.endpoint,
-            func.count(APIUsage.id).label('count'),
-            func.avg(APIUsage.response_time_ms).label('avg_response_time')
-        ).filter(
-            APIUsage.timestamp >= cutoff
-        ).group_by(APIUsage.endpoint).all()
-        
-        # Status codes
-        status_stats = db.query(
-            APIUsage.status_code,
-            func.count(APIUsage.id).label('count')
-        ).filter(
-            APIUsage.timestamp >= cutoff
-        ).group_by(APIUsage.status_code).all()
-        
         return {
             "status": "success",
             "period_hours": hours,
-            "total_requests": total_requests,
-            "endpoints": [
-                {
-                    "endpoint": stat.endpoint,
-                    "requests": stat.count,
-                    "avg_response_time_ms": round(stat.avg_response_time or 0, 2)
-                }
-                for stat in endpoint_stats
-            ],
-            "status_codes": {
-                str(stat.status_code): stat.count 
-                for stat in status_stats
-            }
+            **usage_stats(db, hours),
+            "recorder": usage_recorder.get_stats()
         }
         
     except Exception as e:
@@ -0,0 +1,313 @@
+# backend/app/services/api_usage.py
+"""
+Registro de uso de la API (tabla api_usage) sin tocar la base en el
+camino del request.
+
+El middleware de logging solo agrega una tupla a un ring buffer en
+memoria (`deque` con maxlen: si se llena se pierden los más viejos); una
+task de background lo vacía cada `API_USAGE_FLUSH_INTERVAL` segundos con
+un único INSERT executemany en un thread.
+
+En la misma transacción se suman los rollups por minuto y por hora
+(conteo, suma de latencias e histograma), que es lo que lee
+`/system/api-usage`; las filas crudas solo se guardan
+`API_USAGE_RAW_RETENTION_HOURS` y se purgan desde la misma task.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..database import dialect_insert
+from ..models import APIUsage, APIUsageHour, APIUsageMinute
+from ..utils import histogram
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = float(os.getenv("API_USAGE_FLUSH_INTERVAL", "5"))
+BUFFER_SIZE = int(os.getenv("API_USAGE_BUFFER_SIZE", "10000"))
+ENABLED = os.getenv("API_USAGE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+PRUNE_INTERVAL = float(os.getenv("API_USAGE_PRUNE_INTERVAL", "3600"))
+RAW_RETENTION = timedelta(hours=int(os.getenv("API_USAGE_RAW_RETENTION_HOURS", "48")))
+MINUTE_RETENTION = timedelta(days=int(os.getenv("API_USAGE_MINUTE_RETENTION_DAYS", "7")))
+HOUR_RETENTION = timedelta(days=int(os.getenv("API_USAGE_HOUR_RETENTION_DAYS", "400")))
+
+# Ventanas de hasta estas horas se leen de los rollups por minuto
+MINUTE_ROLLUP_MAX_HOURS = 6
+
+# (timestamp, method, endpoint, status, latency ms, ip, user agent, client id)
+UsageRecord = Tuple[datetime, str, str, int, float, Optional[str], Optional[str], Optional[str]]
+
+COLUMNS = ("timestamp", "method", "endpoint", "status_code", "response_time_ms", "ip_address", "user_agent", "client_id")
+LIMITS = {"endpoint": 100, "method": 10, "ip_address": 45, "user_agent": 500, "client_id": 100}
+
+ROLLUP_KEY = ("bucket", "endpoint", "method", "status_code")
+ROLLUP_SUMS = ("count", "sum_latency_ms") + histogram.BUCKET_COLUMNS
+UPSERT_CHUNK = 500
+
+
+def _minute(timestamp: datetime) -> datetime:
+    return timestamp.replace(second=0, microsecond=0)
+
+
+def _hour(timestamp: datetime) -> datetime:
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+ROLLUPS = ((APIUsageMinute, _minute), (APIUsageHour, _hour))
+
+
+def rollup_rows(rows: List[Dict[str, Any]], truncate: Callable[[datetime], datetime]) -> List[Dict[str, Any]]:
+    """Agregar filas crudas de api_usage por (bucket, endpoint, método, status)"""
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    for row in rows:
+        key = (truncate(row["timestamp"]), row["endpoint"], row["method"], row["status_code"])
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                **dict(zip(ROLLUP_KEY, key)), "count": 0, "sum_latency_ms": 0.0, "histogram": histogram.empty()
+            }
+        latency = row["response_time_ms"] or 0.0
+        group["count"] += 1
+        group["sum_latency_ms"] += latency
+        histogram.observe(group["histogram"], latency)
+
+    result = []
+    for group in groups.values():
+        counts = group.pop("histogram")
+        result.append({**group, **dict(zip(histogram.BUCKET_COLUMNS, counts))})
+    return result
+
+
+def upsert_rollups(db: Session, model, rows: List[Dict[str, Any]]) -> int:
+    """Sumar `rows` a los rollups existentes (sin commit)"""
+    if not rows:
+        return 0
+
+    table = model.__table__
+    insert_stmt = dialect_insert(db.get_bind().dialect.name)
+    if insert_stmt is not None:
+        # Multi-VALUES por partes: acota los parámetros por statement
+        for start in range(0, len(rows), UPSERT_CHUNK):
+            stmt = insert_stmt(table).values(rows[start:start + UPSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(ROLLUP_KEY),
+                set_={column: table.c[column] + stmt.excluded[column] for column in ROLLUP_SUMS},
+            )
+            db.execute(stmt)
+    else:
+        for row in rows:
+            existing = db.get(model, tuple(row[column] for column in ROLLUP_KEY))
+            if existing is None:
+                db.add(model(**row))
+            else:
+                for column in ROLLUP_SUMS:
+                    setattr(existing, column, getattr(existing, column) + row[column])
+    return len(rows)
+
+
+def prune(db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+    """Borrar filas crudas y rollups fuera de su ventana de retención (con commit)"""
+    now = now or datetime.now()
+    deleted = {
+        "api_usage": db.execute(delete(APIUsage).where(APIUsage.timestamp < now - RAW_RETENTION)).rowcount,
+        "api_usage_minute": db.execute(
+            delete(APIUsageMinute).where(APIUsageMinute.bucket < now - MINUTE_RETENTION)
+        ).rowcount,
+        "api_usage_hour": db.execute(
+            delete(APIUsageHour).where(APIUsageHour.bucket < now - HOUR_RETENTION)
+        ).rowcount,
+    }
+    db.commit()
+    return deleted
+
+
+def usage_stats(db: Session, hours: int = 24, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Totales, promedio y percentiles por endpoint y conteo por status desde
+    los rollups: O(buckets x endpoints) en lugar de O(requests).
+    """
+    now = now or datetime.now()
+    if hours <= MINUTE_ROLLUP_MAX_HOURS:
+        model, resolution, cutoff = APIUsageMinute, "minute", _minute(now - timedelta(hours=hours))
+    else:
+        model, resolution, cutoff = APIUsageHour, "hour", _hour(now - timedelta(hours=hours))
+
+    stmt = select(
+        model.endpoint,
+        model.status_code,
+        *(func.sum(getattr(model, column)).label(column) for column in ROLLUP_SUMS)
+    ).where(model.bucket >= cutoff).group_by(model.endpoint, model.status_code)
+
+    overall = histogram.empty()
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    status_codes: Dict[str, int] = {}
+    total = 0
+
+    for row in db.execute(stmt):
+        counts = [getattr(row, column) or 0 for column in histogram.BUCKET_COLUMNS]
+        entry = endpoints.setdefault(row.endpoint, {"requests": 0, "sum_latency_ms": 0.0, "histogram": histogram.empty()})
+        entry["requests"] += row.count
+        entry["sum_latency_ms"] += row.sum_latency_ms or 0.0
+        for index, count in enumerate(counts):
+            entry["histogram"][index] += count
+            overall[index] += count
+        status_codes[str(row.status_code)] = status_codes.get(str(row.status_code), 0) + row.count
+        total += row.count
+
+    def latency(counts: List[int]) -> Dict[str, float]:
+        return {f"p{q}": round(histogram.percentile(counts, q), 2) for q in (50, 95, 99)}
+
+    return {
+        "resolution": resolution,
+        "since": cutoff.isoformat(),
+        "total_requests": total,
+        "latency_ms": latency(overall),
+        "endpoints": sorted(
+            (
+                {
+                    "endpoint": endpoint,
+                    "requests": entry["requests"],
+                    "avg_response_time_ms": round(entry["sum_latency_ms"] / entry["requests"], 2) if entry["requests"] else 0,
+                    **{f"{key}_ms": value for key, value in latency(entry["histogram"]).items()},
+                }
+                for endpoint, entry in endpoints.items()
+            ),
+            key=lambda item: -item["requests"]
+        ),
+        "status_codes": status_codes,
+    }
+
+
+class UsageRecorder:
+    """Ring buffer de requests con flush periódico en bloque"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None,
+                 maxsize: int = BUFFER_SIZE, interval: float = FLUSH_INTERVAL):
+        self._session_factory = session_factory
+        self._buffer: Deque[UsageRecord] = deque(maxlen=maxsize)
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._last_prune = time.monotonic()
+        self.recorded = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def record(self, method: str, endpoint: str, status_code: int, response_time_ms: float,
+               ip_address: Optional[str] = None, user_agent: Optional[str] = None,
+               client_id: Optional[str] = None) -> None:
+        """O(1) y sin I/O: se llama desde el middleware en cada request"""
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((
+            datetime.now(), method, endpoint, status_code, response_time_ms,
+            ip_address, user_agent, client_id
+        ))
+        self.recorded += 1
+
+    def drain(self) -> List[UsageRecord]:
+        records = []
+        while self._buffer:
+            records.append(self._buffer.popleft())
+        return records
+
+    def _rows(self, records: List[UsageRecord]) -> List[Dict[str, Any]]:
+        rows = []
+        for record in records:
+            row = dict(zip(COLUMNS, record))
+            for column, limit in LIMITS.items():
+                if row[column] is not None and len(row[column]) > limit:
+                    row[column] = row[column][:limit]
+            rows.append(row)
+        return rows
+
+    def _session(self) -> Session:
+        if self._session_factory is None:
+            from ..database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def flush(self) -> int:
+        """Escribir lo acumulado (INSERT executemany + upsert de rollups, sync)"""
+        records = self.drain()
+        if not records:
+            return 0
+
+        rows = self._rows(records)
+        db = self._session()
+        try:
+            db.execute(insert(APIUsage.__table__), rows)
+            for model, truncate in ROLLUPS:
+                upsert_rollups(db, model, rollup_rows(rows, truncate))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self.errors += 1
+            logger.warning(f"Could not flush {len(records)} API usage records: {e}")
+            return 0
+        finally:
+            db.close()
+
+        self.flushed += len(records)
+        return len(records)
+
+    def prune(self) -> Dict[str, int]:
+        db = self._session()
+        try:
+            deleted = prune(db)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not prune API usage: {e}")
+            return {}
+        finally:
+            db.close()
+
+        if any(deleted.values()):
+            logger.info(f"🧹 Uso de API purgado: {deleted}")
+        return deleted
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await asyncio.to_thread(self.flush)
+            if time.monotonic() - self._last_prune >= PRUNE_INTERVAL:
+                self._last_prune = time.monotonic()
+                await asyncio.to_thread(self.prune)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"📝 Registro de uso de API cada {self.interval}s")
+
+    async def stop(self) -> None:
+        """Cancelar la task y escribir lo que quedó en el buffer"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "buffered": len(self._buffer),
+            "buffer_size": self._buffer.maxlen,
+            "recorded": self.recorded,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+usage_recorder = UsageRecorder()
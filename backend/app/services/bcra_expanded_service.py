@@ -1,11 +1,13 @@
 # backend/app/services/bcra_expanded_service.py
-import aiohttp
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
 from app.models import EconomicIndicator, HistoricalData
 from app.database import get_db
+from app.services.http_pool import http_pool
+from app.utils.singleflight import singleflight
+from app.services.ingestion import ingest_indicators
 import json
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,7 @@ class BCRAExpandedService:
             "cotizaciones": "https://api.bcra.gob.ar/estadisticascambiarias/v1.0/Cotizaciones",
             "principales": "https://api.bcra.gob.ar/estadisticas/v2.0/principalesvariables"
         }
-        self.session = None
+        self.session = http_pool.client()
         
         # VARIABLES EXPANDIDAS - 50+ variables clave del BCRA
         self.variables_completas = {
@@ -100,13 +102,13 @@ class BCRAExpandedService:
         ]
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # La sesión pertenece a http_pool y se cierra en el shutdown de la app
+        pass
 
+    @singleflight
     async def get_all_bcra_variables(self) -> Dict[str, Any]:
         """Obtener TODAS las variables monetarias disponibles del BCRA"""
         try:
@@ -163,6 +165,7 @@ class BCRAExpandedService:
             logger.error(f"Error fetching all BCRA variables: {e}")
             return {"status": "error", "message": str(e)}
 
+    @singleflight
     async def get_all_cotizaciones(self) -> Dict[str, Any]:
         """Obtener TODAS las cotizaciones disponibles del BCRA"""
         try:
@@ -210,6 +213,7 @@ class BCRAExpandedService:
             logger.error(f"Error fetching all BCRA cotizaciones: {e}")
             return {"status": "error", "message": str(e)}
 
+    @singleflight
     async def get_complete_dashboard(self) -> Dict[str, Any]:
         """Dashboard COMPLETO con todos los datos disponibles del BCRA"""
         try:
@@ -338,7 +342,7 @@ class BCRAExpandedService:
         """Guardar todos los datos expandidos en la base de datos"""
         try:
             db = next(get_db())
-            saved_count = 0
+            records = []
             
             # Guardar por categorías
             categories = [
@@ -349,40 +353,28 @@ class BCRAExpandedService:
             for category in categories:
                 for key, data in dashboard_data.get(category, {}).items():
                     if data.get("value") is not None:
-                        indicator = EconomicIndicator(
-                            indicator_type=key,
-                            value=float(data["value"]),
-                            source="BCRA_EXPANDED",
-                            date=datetime.now(),
-                            is_active=True,
-                            metadata_info=json.dumps({
-                                "label": data.get("label"),
-                                "unit": data.get("unit"),
-                                "category": category
-                            })
-                        )
-                        db.add(indicator)
-                        saved_count += 1
+                        records.append({
+                            "indicator_type": key,
+                            "value": data["value"],
+                            "source": "BCRA_EXPANDED",
+                            "label": data.get("label"),
+                            "unit": data.get("unit"),
+                            "category": category
+                        })
             
             # Guardar cotizaciones principales
             for key, data in dashboard_data.get("exchange_rates", {}).items():
                 if data.get("rate") is not None:
-                    indicator = EconomicIndicator(
-                        indicator_type=f"exchange_{key.lower()}",
-                        value=float(data["rate"]),
-                        source="BCRA_EXPANDED",
-                        date=datetime.now(),
-                        is_active=True,
-                        metadata_info=json.dumps({
-                            "currency_name": data.get("name"),
-                            "category": data.get("category"),
-                            "is_major": data.get("is_major")
-                        })
-                    )
-                    db.add(indicator)
-                    saved_count += 1
+                    records.append({
+                        "indicator_type": f"exchange_{key.lower()}",
+                        "value": data["rate"],
+                        "source": "BCRA_EXPANDED",
+                        "label": data.get("name"),
+                        "category": data.get("category")
+                    })
             
-            db.commit()
+            # Desactivar anteriores + insertar nuevos en una transacción
+            saved_count = ingest_indicators(db, records)
             logger.info(f"✅ Guardados {saved_count} indicadores expandidos en BD")
             return True
             
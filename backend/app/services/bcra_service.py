@@ -5,7 +5,6 @@ Servicio BCRA unificado – compatible con la lógica actual de los routers.
 
 from __future__ import annotations
 
-import aiohttp
 import asyncio
 import logging
 from datetime import datetime, timedelta
@@ -13,6 +12,8 @@ from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from ..config import settings  # sigue funcionando con Pydantic 2
+from .http_pool import PooledSession, http_pool
+from ..utils.singleflight import singleflight
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,8 @@ class BCRAService:
             "monetarias": "https://api.bcra.gob.ar/estadisticas/v3.0/Monetarias",
             "cotizaciones": "https://api.bcra.gob.ar/estadisticascambiarias/v1.0/Cotizaciones",
         }
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Vista del pool compartido: no abre conexiones propias
+        self.session: Optional[PooledSession] = http_pool.client(timeout=30)
 
         # Variables esenciales para el MVP / demo
         self.essential_variables: Dict[int, Dict[str, str]] = {
@@ -47,19 +49,16 @@ class BCRAService:
     # Async context-manager helpers
     # --------------------------------------------------------------------- #
     async def __aenter__(self) -> "BCRAService":
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            connector=aiohttp.TCPConnector(limit=10),
-        )
         return self
 
     async def __aexit__(self, *_exc) -> None:
-        if self.session:
-            await self.session.close()
+        # La sesión pertenece a `http_pool` y se cierra en el shutdown de la app
+        pass
 
     # --------------------------------------------------------------------- #
     # API públicas usadas por los routers
     # --------------------------------------------------------------------- #
+    @singleflight
     async def get_current_indicators(self) -> Dict[str, Any]:
         """
         Devuelve todas las variables esenciales + cotizaciones oficiales.
@@ -76,6 +75,7 @@ class BCRAService:
             logger.error("Error fetching current indicators: %s", exc)
             return self._get_fallback_data()
 
+    @singleflight
     async def get_historical_data(
         self,
         variable_id: int,
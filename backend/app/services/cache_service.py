@@ -1,25 +1,44 @@
 # backend/app/services/cache_service.py
-import redis
-import json
-from typing import Any, Optional
+"""
+Cache de la aplicación: LRU en proceso + Redis opcional, configurado desde settings.
+Ver `app.utils.cache` para la implementación de cada nivel.
+"""
+import logging
+
 from app.config import settings
+from app.utils.cache import LRUCache, RedisBackend, TwoTierCache, get_serializer
+
+logger = logging.getLogger(__name__)
+
+
+def _build_backend():
+    """Backend Redis si hay REDIS_URL y la librería está instalada"""
+    url = getattr(settings, "REDIS_URL", None)
+    if not url:
+        return None
+
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        logger.warning("redis no instalado, cache solo en memoria")
+        return None
+
+    client = aioredis.from_url(url, socket_timeout=getattr(settings, "REDIS_TIMEOUT", 0.5))
+    return RedisBackend(client, prefix=getattr(settings, "CACHE_PREFIX", "argfy:"))
+
+
+class CacheService(TwoTierCache):
+    """Cache de dos niveles con la configuración de la aplicación"""
+
+    def __init__(self, backend=None):
+        super().__init__(
+            local=LRUCache(
+                maxsize=getattr(settings, "CACHE_MAX_ENTRIES", 1024),
+                default_ttl=settings.CACHE_TTL,
+            ),
+            backend=backend if backend is not None else _build_backend(),
+            serializer=get_serializer(getattr(settings, "CACHE_SERIALIZER", "orjson")),
+        )
 
-class CacheService:
-    def __init__(self):
-        self.redis_client = redis.from_url(settings.REDIS_URL)
-    
-    def get(self, key: str) -> Optional[Any]:
-        try:
-            value = self.redis_client.get(key)
-            return json.loads(value) if value else None
-        except:
-            return None
-    
-    def set(self, key: str, value: Any, ttl: int = settings.CACHE_TTL):
-        try:
-            self.redis_client.setex(key, ttl, json.dumps(value))
-            return True
-        except:
-            return False
 
 cache = CacheService()
\ No newline at end of file
@@ -0,0 +1,89 @@
+# backend/app/services/circuit_breakers.py
+"""
+Circuit breakers por fuente externa, compartidos por todos los servicios.
+
+`http_pool` envuelve cada request del pool aiohttp en `guarded()`: si el
+breaker de la fuente está abierto la llamada falla al instante con
+`CircuitOpenError` (que los servicios manejan como cualquier error y
+sirven cache/fallback) en lugar de esperar 10–30 s de timeout. El estado
+se expone en `/health/detailed`.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+from ..utils.circuit_breaker import OPEN, BreakerRegistry, CircuitBreaker, CircuitOpenError
+from .metrics_service import source_for_host
+
+logger = logging.getLogger(__name__)
+
+
+def _log_transition(name: str, previous: str, state: str) -> None:
+    if state == OPEN:
+        logger.warning(f"🔌 Circuito {name} abierto ({previous} → {state})")
+    else:
+        logger.info(f"🔌 Circuito {name}: {previous} → {state}")
+
+
+breakers = BreakerRegistry(
+    window=int(os.getenv("CIRCUIT_WINDOW", "20")),
+    min_calls=int(os.getenv("CIRCUIT_MIN_CALLS", "5")),
+    failure_rate=float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5")),
+    slow_call_seconds=float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "10")),
+    slow_call_rate=float(os.getenv("CIRCUIT_SLOW_CALL_RATE", "0.8")),
+    open_seconds=float(os.getenv("CIRCUIT_OPEN_SECONDS", "30")),
+    on_state_change=_log_transition,
+)
+
+
+def breaker_for_url(url: Any, registry: Optional[BreakerRegistry] = None) -> CircuitBreaker:
+    """Breaker de la fuente conocida del host; targets de scraping, uno por host"""
+    host = urlsplit(str(url)).hostname
+    source = source_for_host(host)
+    return (registry or breakers).get((host or "other") if source == "other" else source)
+
+
+class GuardedRequest:
+    """
+    Envuelve el `_RequestContextManager` de aiohttp (sirve con `async with`
+    y con `await`). Respuestas 5xx y excepciones cuentan como falla; una
+    cancelación (deadline del llamador, hedging) no cuenta.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, request: Callable[[], Any]):
+        self._breaker = breaker
+        self._request = request
+        self._context = None
+
+    async def _send(self, send: Callable[[Any], Awaitable[Any]]):
+        self._breaker.check()
+        start = time.perf_counter()
+        try:
+            self._context = self._request()
+            response = await send(self._context)
+        except asyncio.CancelledError:
+            self._breaker.release()
+            raise
+        except Exception:
+            self._breaker.record(False, time.perf_counter() - start)
+            raise
+        self._breaker.record(response.status < 500, time.perf_counter() - start)
+        return response
+
+    async def __aenter__(self):
+        return await self._send(lambda context: context.__aenter__())
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._context is not None:
+            return await self._context.__aexit__(exc_type, exc, tb)
+
+    def __await__(self):
+        return self._send(lambda context: context).__await__()
+
+
+def guarded(url: Any, request: Callable[[], Any]) -> GuardedRequest:
+    return GuardedRequest(breaker_for_url(url), request)
@@ -1,14 +1,28 @@
 # backend/app/services/dolar_blue_service.py
 import asyncio
-import aiohttp
+import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
 from dataclasses import dataclass
 import json
 
+from .cache_service import cache
+from . import live_updates
+from .http_pool import http_pool
+from ..utils.hedging import LatencyTracker, hedged
+from ..utils.singleflight import singleflight
+
 logger = logging.getLogger(__name__)
 
+# Latencia observada por fuente (compartida entre instancias del servicio):
+# get_blue_rate dispara la siguiente fuente cuando la actual supera su p90
+blue_latency = LatencyTracker(
+    default=float(os.getenv("DOLAR_HEDGE_DEFAULT_DELAY", "1.0")),
+    floor=float(os.getenv("DOLAR_HEDGE_MIN_DELAY", "0.05")),
+    ceiling=float(os.getenv("DOLAR_HEDGE_MAX_DELAY", "5.0")),
+)
+
 @dataclass
 class DolarRate:
     """Estructura para cotizaciones del dólar"""
@@ -26,23 +40,32 @@ class DolarRate:
             'source': self.source,
             'timestamp': self.timestamp.isoformat()
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DolarRate':
+        return cls(
+            name=data['name'],
+            buy=data['buy'],
+            sell=data['sell'],
+            source=data['source'],
+            timestamp=datetime.fromisoformat(data['timestamp'])
+        )
 
 class DolarBlueService:
     """Servicio para obtener cotizaciones del dólar blue de múltiples fuentes"""
     
     def __init__(self):
-        self.session = None
-        self._cache = {}
+        self.session = http_pool.client()
         self._cache_ttl = 120  # 2 minutos para dólar blue
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # La sesión pertenece a http_pool y se cierra en el shutdown de la app
+        pass
     
+    @singleflight
     async def get_all_rates(self) -> Dict[str, DolarRate]:
         """Obtiene todas las cotizaciones disponibles de múltiples fuentes"""
         rates = {}
@@ -62,39 +85,49 @@ class DolarBlueService:
             elif isinstance(result, Exception):
                 logger.error(f"Error fetching dollar rates: {result}")
         
+        # Empujar a los suscriptores en vivo solo las cotizaciones que cambiaron
+        live_updates.publish_changes([
+            {
+                "indicator_type": f"dolar_{key}",
+                "value": rate.sell,
+                "source": rate.source,
+                "date": rate.timestamp,
+                "unit": "ARS",
+                "label": rate.name,
+            }
+            for key, rate in rates.items()
+        ])
+        
         return rates
     
+    @singleflight
     async def get_blue_rate(self) -> Optional[DolarRate]:
         """Obtiene la cotización del dólar blue (mejor fuente disponible)"""
         cache_key = "dolar_blue_rate"
         
         # Check cache
-        if cache_key in self._cache:
-            cache_time, cache_data = self._cache[cache_key]
-            if (datetime.now() - cache_time).total_seconds() < self._cache_ttl:
-                return cache_data
+        cached = await cache.get(cache_key)
+        if cached:
+            return DolarRate.from_dict(cached)
         
-        # Try multiple sources in order of preference
+        # Fuentes en orden de preferencia, con hedging: si la actual no
+        # responde dentro de su p90 se dispara la siguiente y gana la primera
         sources = [
-            self._fetch_bluelytics,
-            self._fetch_dolarapi,
-            self._fetch_dolarsi
+            ("Bluelytics", self._fetch_bluelytics),
+            ("DolarAPI", self._fetch_dolarapi),
+            ("DolarSi", self._fetch_dolarsi)
         ]
         
-        for source_func in sources:
-            try:
-                rates = await source_func()
-                if 'blue' in rates:
-                    blue_rate = rates['blue']
-                    # Cache the result
-                    self._cache[cache_key] = (datetime.now(), blue_rate)
-                    return blue_rate
-            except Exception as e:
-                logger.error(f"Error in source {source_func.__name__}: {e}")
-                continue
+        result = await hedged(sources, blue_latency, is_valid=lambda rates: 'blue' in rates)
+        if result is None:
+            logger.error("All dollar blue sources failed")
+            return None
         
-        logger.error("All dollar blue sources failed")
-        return None
+        _, rates = result
+        blue_rate = rates['blue']
+        # Cache the result
+        await cache.set(cache_key, blue_rate.to_dict(), ttl=self._cache_ttl)
+        return blue_rate
     
     async def _fetch_bluelytics(self) -> Dict[str, DolarRate]:
         """Fetch from Bluelytics API (preferred source)"""
@@ -264,6 +297,7 @@ class DolarBlueService:
             
         return {}
     
+    @singleflight
     async def get_historical_blue(self, days: int = 30) -> List[Dict]:
         """Intenta obtener datos históricos del dólar blue"""
         try:
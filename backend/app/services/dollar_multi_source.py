@@ -1,5 +1,4 @@
 # backend/app/services/dollar_multi_source.py
-import aiohttp
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -8,13 +7,17 @@ import statistics
 from bs4 import BeautifulSoup
 import json
 
+from .http_pool import http_pool
+from ..utils.singleflight import singleflight
+
 logger = logging.getLogger(__name__)
 
 class DollarMultiSourceService:
     """Servicio para obtener dólar blue y tipos de cambio de MÚLTIPLES fuentes"""
     
     def __init__(self):
-        self.session = None
+        # Vista del pool compartido de conexiones
+        self.session = http_pool.client(timeout=10)
         
         # Fuentes de APIs para dólar blue
         self.api_sources = {
@@ -56,16 +59,13 @@ class DollarMultiSourceService:
         ]
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10),
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # La sesión pertenece a http_pool y se cierra en el shutdown de la app
+        pass
 
+    @singleflight
     async def get_all_dollar_rates(self) -> Dict[str, Any]:
         """Obtener todos los tipos de dólar de múltiples fuentes"""
         try:
@@ -4,28 +4,97 @@ Servicio expandido para obtener TODOS los datos económicos del demo
 """
 
 import asyncio
-import aiohttp
-import httpx
+import functools
+import os
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 from bs4 import BeautifulSoup
 import pandas as pd
 import json
 
-from ..config.indicators_mapping import ALL_INDICATORS, CATEGORIES
+from ..config.indicators_mapping import ALL_INDICATORS, CATEGORIES, get_freshness_policy
 from ..models import EconomicIndicator, HistoricalData
 from ..database import get_db
+from .http_pool import http_pool
+from ..utils.fanout import OK, fan_out, status_map
+from ..utils.singleflight import singleflight
+from ..utils.swr import stale_while_revalidate
 
 logger = logging.getLogger(__name__)
 
+
+# Fan-out por indicador: presupuesto total, deadline por indicador y
+# requests simultáneos a fuentes externas
+FETCH_BUDGET = float(os.getenv("EXPANDED_FETCH_BUDGET", "8"))
+INDICATOR_DEADLINE = float(os.getenv("EXPANDED_INDICATOR_DEADLINE", "5"))
+MAX_CONCURRENCY = int(os.getenv("EXPANDED_MAX_CONCURRENCY", "8"))
+
+# Registro de fetchers por indicador: método del servicio y argumentos.
+# Un indicador individual solo consulta su propia fuente.
+INDICATOR_FETCHERS = {
+    "ipc": ("get_ipc_data", ()),
+    "pbi": ("get_pbi_data", ()),
+    "emae": ("get_emae_data", ()),
+    "desempleo": ("get_desempleo_data", ()),
+    "reservas_bcra": ("get_reservas_bcra", ()),
+    "dolar_blue": ("get_dolar_blue", ()),
+    "plazo_fijo_30": ("get_bcra_variable", (29,)),  # Plazo fijo 30 días
+    "tasa_tarjeta_credito": ("get_bcra_variable", (31,)),
+    "depositos_privados": ("get_bcra_variable", (18,)),
+    "prestamos_sector_privado": ("get_bcra_variable", (19,)),
+    "merval": ("get_merval_data", ()),
+}
+
+# Indicadores sin fuente integrada todavía (valores demo fijos)
+STATIC_INDICATORS = {
+    # Gobierno: implementar scraping de MECON, AFIP, etc.
+    "resultado_fiscal": {"value": -2.1, "source": "DEMO", "unit": "% PBI"},
+    "deuda_publica": {"value": 89.4, "source": "DEMO", "unit": "% PBI"},
+    "gasto_publico": {"value": 41.2, "source": "DEMO", "unit": "% PBI"},
+    "ingresos_tributarios": {"value": 28.5, "source": "DEMO", "unit": "% PBI"},
+    "empleo_publico": {"value": 3400000, "source": "DEMO", "unit": "empleados"},
+    "transferencias_sociales": {"value": 8.7, "source": "DEMO", "unit": "% PBI"},
+    # Finanzas
+    "morosidad_bancaria": {"value": 3.1, "source": "DEMO", "unit": "%"},
+    "liquidez_bancaria": {"value": 64.2, "source": "DEMO", "unit": "%"},
+    # Mercados: implementar integración con BYMA
+    "rendimiento_al30": {"value": 15.2, "source": "DEMO", "unit": "%"},
+    "precio_gd30": {"value": 453.2, "source": "DEMO", "unit": "ARS"},
+    "volumen_acciones_cedears": {"value": 2800000000, "source": "DEMO", "unit": "ARS"},
+    "dolar_ccl": {"value": 1287, "source": "DEMO", "unit": "ARS"},
+    "panel_general_byma": {"value": 842, "source": "DEMO", "unit": "especies"},
+    # Tecnología (principalmente manuales)
+    "exportaciones_sbc": {"value": 7800000000, "source": "DEMO", "unit": "USD"},
+    "empleo_it": {"value": 15.2, "source": "DEMO", "unit": "%"},
+    "inversion_id": {"value": 0.54, "source": "DEMO", "unit": "% PBI"},
+    "penetracion_internet": {"value": 87.2, "source": "DEMO", "unit": "%"},
+    "vc_startups": {"value": 542000000, "source": "DEMO", "unit": "USD"},
+    "facturacion_software": {"value": 3200000000, "source": "DEMO", "unit": "USD"},
+    # Industria
+    "ipi_manufacturero": {"value": -8.5, "source": "DEMO", "unit": "%"},
+    "pmi": {"value": 43.2, "source": "DEMO", "unit": "índice"},
+    "produccion_automotriz": {"value": -12.1, "source": "DEMO", "unit": "%"},
+    "exportaciones_moi": {"value": 12800000000, "source": "DEMO", "unit": "USD"},
+    "produccion_acero": {"value": -15.3, "source": "DEMO", "unit": "%"},
+    "costo_construccion": {"value": 42.8, "source": "DEMO", "unit": "%"},
+}
+
+# Claves de una categoría que no son indicadores
+META_KEYS = ("timestamp", "category", "source_status")
+
+
+def _is_live(result: Dict) -> bool:
+    """Solo se cachean datos reales, nunca el fallback demo"""
+    return isinstance(result, dict) and result.get("status") == "success"
+
 class ExpandedDataService:
     """Servicio para obtener TODOS los indicadores de la plataforma"""
     
     def __init__(self):
-        self.session = None
-        self.httpx_client = None
+        # Vista del pool compartido de conexiones
+        self.session = http_pool.client()
         self.requests_session = requests.Session()
         
         # URLs base para diferentes fuentes
@@ -38,47 +107,61 @@ class ExpandedDataService:
         }
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        self.httpx_client = httpx.AsyncClient()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
-        if self.httpx_client:
-            await self.httpx_client.aclose()
+        # La sesión pertenece a http_pool y se cierra en el shutdown de la app
+        pass
+
+    # FETCH POR INDICADOR
+    async def fetch_indicators(self, indicator_ids: List[str],
+                               budget: float = FETCH_BUDGET) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """
+        Valores de `indicator_ids` y estado por fuente. Solo se consultan las
+        fuentes de esos indicadores, en paralelo (hasta MAX_CONCURRENCY) y
+        dentro de `budget` segundos; los que no llegan quedan "unavailable".
+        """
+        calls = {}
+        for indicator_id in indicator_ids:
+            if indicator_id in INDICATOR_FETCHERS:
+                method, args = INDICATOR_FETCHERS[indicator_id]
+                calls[indicator_id] = functools.partial(getattr(self, method), *args)
+
+        outcomes = await fan_out(calls, budget=budget, default_deadline=INDICATOR_DEADLINE,
+                                 concurrency=MAX_CONCURRENCY)
+
+        data = {}
+        for indicator_id in indicator_ids:
+            if indicator_id in outcomes:
+                outcome = outcomes[indicator_id]
+                data[indicator_id] = outcome.value if outcome.status == OK else {
+                    "value": None, "source": "UNAVAILABLE", "status": outcome.status
+                }
+            elif indicator_id in STATIC_INDICATORS:
+                data[indicator_id] = dict(STATIC_INDICATORS[indicator_id])
+        return data, status_map(outcomes)
+
+    async def get_indicator(self, indicator_id: str) -> Tuple[Dict, Optional[Dict]]:
+        """Un indicador consultando solo su fuente (estado None si es estático)"""
+        data, sources = await self.fetch_indicators([indicator_id])
+        return data.get(indicator_id, {}), sources.get(indicator_id)
+
+    async def _get_category(self, category: str) -> Dict[str, Any]:
+        data, sources = await self.fetch_indicators(CATEGORIES[category]["indicators"])
+        return {
+            **data,
+            "timestamp": datetime.now().isoformat(),
+            "category": category,
+            "source_status": sources
+        }
 
     # SECCIÓN 1: DATOS ECONÓMICOS
+    @singleflight
     async def get_economic_indicators(self) -> Dict[str, Any]:
         """Obtener todos los indicadores económicos"""
-        try:
-            # Ejecutar en paralelo
-            tasks = [
-                self.get_ipc_data(),
-                self.get_pbi_data(),
-                self.get_emae_data(),
-                self.get_desempleo_data(),
-                self.get_reservas_bcra(),
-                self.get_dolar_blue()
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            return {
-                "ipc": results[0],
-                "pbi": results[1], 
-                "emae": results[2],
-                "desempleo": results[3],
-                "reservas_bcra": results[4],
-                "dolar_blue": results[5],
-                "timestamp": datetime.now().isoformat(),
-                "category": "economia"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting economic indicators: {e}")
-            return {"status": "error", "message": str(e)}
+        return await self._get_category("economia")
 
+    @stale_while_revalidate("expanded:ipc", get_freshness_policy("ipc"), is_valid=_is_live)
     async def get_ipc_data(self) -> Dict:
         """IPC - Inflación mensual del INDEC"""
         try:
@@ -107,6 +190,7 @@ class ExpandedDataService:
             "status": "demo"
         }
 
+    @stale_while_revalidate("expanded:pbi", get_freshness_policy("pbi"), is_valid=_is_live)
     async def get_pbi_data(self) -> Dict:
         """PBI - Crecimiento del PBI"""
         try:
@@ -155,6 +239,7 @@ class ExpandedDataService:
             "status": "demo"
         }
 
+    @stale_while_revalidate("expanded:reservas_bcra", get_freshness_policy("reservas_bcra"), is_valid=_is_live)
     async def get_reservas_bcra(self) -> Dict:
         """Reservas internacionales del BCRA"""
         try:
@@ -182,6 +267,7 @@ class ExpandedDataService:
             "status": "demo"
         }
 
+    @stale_while_revalidate("expanded:dolar_blue", get_freshness_policy("dolar_blue"), is_valid=_is_live)
     async def get_dolar_blue(self) -> Dict:
         """Dólar blue de Bluelytics"""
         try:
@@ -212,47 +298,15 @@ class ExpandedDataService:
     # SECCIÓN 2: DATOS DE GOBIERNO
     async def get_government_indicators(self) -> Dict[str, Any]:
         """Obtener todos los indicadores de gobierno"""
-        # Implementar scraping de MECON, AFIP, etc.
-        return {
-            "resultado_fiscal": {"value": -2.1, "source": "DEMO", "unit": "% PBI"},
-            "deuda_publica": {"value": 89.4, "source": "DEMO", "unit": "% PBI"},
-            "gasto_publico": {"value": 41.2, "source": "DEMO", "unit": "% PBI"},
-            "ingresos_tributarios": {"value": 28.5, "source": "DEMO", "unit": "% PBI"},
-            "empleo_publico": {"value": 3400000, "source": "DEMO", "unit": "empleados"},
-            "transferencias_sociales": {"value": 8.7, "source": "DEMO", "unit": "% PBI"},
-            "timestamp": datetime.now().isoformat(),
-            "category": "gobierno"
-        }
+        return await self._get_category("gobierno")
 
     # SECCIÓN 3: DATOS FINANCIEROS
+    @singleflight
     async def get_financial_indicators(self) -> Dict[str, Any]:
         """Obtener todos los indicadores financieros del BCRA"""
-        try:
-            # Usar API del BCRA para tasas
-            tasks = [
-                self.get_bcra_variable(29),  # Plazo fijo 30 días
-                self.get_bcra_variable(31),  # Tasa tarjeta crédito
-                self.get_bcra_variable(18),  # Depósitos privados
-                self.get_bcra_variable(19),  # Préstamos sector privado
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            return {
-                "plazo_fijo_30": results[0] if not isinstance(results[0], Exception) else {"value": 118, "source": "DEMO"},
-                "tasa_tarjeta_credito": results[1] if not isinstance(results[1], Exception) else {"value": 195, "source": "DEMO"},
-                "depositos_privados": results[2] if not isinstance(results[2], Exception) else {"value": 45200000, "source": "DEMO"},
-                "prestamos_sector_privado": results[3] if not isinstance(results[3], Exception) else {"value": 28700000, "source": "DEMO"},
-                "morosidad_bancaria": {"value": 3.1, "source": "DEMO", "unit": "%"},
-                "liquidez_bancaria": {"value": 64.2, "source": "DEMO", "unit": "%"},
-                "timestamp": datetime.now().isoformat(),
-                "category": "finanzas"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting financial indicators: {e}")
-            return self.get_demo_financial_data()
+        return await self._get_category("finanzas")
 
+    @stale_while_revalidate("expanded:bcra_variable", get_freshness_policy("plazo_fijo_30"), is_valid=_is_live)
     async def get_bcra_variable(self, variable_id: int) -> Dict:
         """Helper para obtener variables específicas del BCRA"""
         try:
@@ -274,32 +328,10 @@ class ExpandedDataService:
         return {"value": 0, "source": "ERROR", "status": "error"}
 
     # SECCIÓN 4: DATOS DE MERCADOS
+    @singleflight
     async def get_market_indicators(self) -> Dict[str, Any]:
         """Obtener todos los indicadores de mercados"""
-        try:
-            # Implementar integración con BYMA
-            tasks = [
-                self.get_merval_data(),
-                self.get_bonds_data(),
-                self.get_ccl_data()
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            return {
-                "merval": results[0] if not isinstance(results[0], Exception) else {"value": 1847523, "source": "DEMO"},
-                "rendimiento_al30": {"value": 15.2, "source": "DEMO", "unit": "%"},
-                "precio_gd30": {"value": 453.2, "source": "DEMO", "unit": "ARS"},
-                "volumen_acciones_cedears": {"value": 2800000000, "source": "DEMO", "unit": "ARS"},
-                "dolar_ccl": {"value": 1287, "source": "DEMO", "unit": "ARS"},
-                "panel_general_byma": {"value": 842, "source": "DEMO", "unit": "especies"},
-                "timestamp": datetime.now().isoformat(),
-                "category": "mercados"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting market indicators: {e}")
-            return self.get_demo_market_data()
+        return await self._get_category("mercados")
 
     async def get_merval_data(self) -> Dict:
         """Obtener datos del MERVAL desde BYMA"""
@@ -322,68 +354,45 @@ class ExpandedDataService:
     # SECCIÓN 5: TECNOLOGÍA
     async def get_tech_indicators(self) -> Dict[str, Any]:
         """Obtener indicadores de tecnología (principalmente manuales)"""
-        return {
-            "exportaciones_sbc": {"value": 7800000000, "source": "DEMO", "unit": "USD"},
-            "empleo_it": {"value": 15.2, "source": "DEMO", "unit": "%"},
-            "inversion_id": {"value": 0.54, "source": "DEMO", "unit": "% PBI"},
-            "penetracion_internet": {"value": 87.2, "source": "DEMO", "unit": "%"},
-            "vc_startups": {"value": 542000000, "source": "DEMO", "unit": "USD"},
-            "facturacion_software": {"value": 3200000000, "source": "DEMO", "unit": "USD"},
-            "timestamp": datetime.now().isoformat(),
-            "category": "tecnologia"
-        }
+        return await self._get_category("tecnologia")
 
     # SECCIÓN 6: INDUSTRIA
     async def get_industry_indicators(self) -> Dict[str, Any]:
         """Obtener indicadores de industria"""
-        return {
-            "ipi_manufacturero": {"value": -8.5, "source": "DEMO", "unit": "%"},
-            "pmi": {"value": 43.2, "source": "DEMO", "unit": "índice"},
-            "produccion_automotriz": {"value": -12.1, "source": "DEMO", "unit": "%"},
-            "exportaciones_moi": {"value": 12800000000, "source": "DEMO", "unit": "USD"},
-            "produccion_acero": {"value": -15.3, "source": "DEMO", "unit": "%"},
-            "costo_construccion": {"value": 42.8, "source": "DEMO", "unit": "%"},
-            "timestamp": datetime.now().isoformat(),
-            "category": "industria"
-        }
+        return await self._get_category("industria")
 
     # MÉTODO PRINCIPAL
+    @singleflight
     async def get_all_indicators(self) -> Dict[str, Any]:
-        """Obtener TODOS los indicadores de todas las categorías"""
-        try:
-            tasks = [
-                self.get_economic_indicators(),
-                self.get_government_indicators(),
-                self.get_financial_indicators(),
-                self.get_market_indicators(),
-                self.get_tech_indicators(),
-                self.get_industry_indicators()
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Compilar todos los datos
-            all_data = {}
-            categories = ["economia", "gobierno", "finanzas", "mercados", "tecnologia", "industria"]
-            
-            for i, result in enumerate(results):
-                if not isinstance(result, Exception):
-                    category = categories[i]
-                    all_data[category] = result
-                else:
-                    logger.error(f"Error in category {categories[i]}: {result}")
-            
-            return {
-                "status": "success",
-                "data": all_data,
-                "total_indicators": sum(len(cat_data) - 2 for cat_data in all_data.values()),  # -2 for timestamp and category
-                "timestamp": datetime.now().isoformat(),
-                "version": "1.0.0"
+        """
+        Obtener TODOS los indicadores de todas las categorías: un único
+        fan-out con concurrencia acotada y deadline global
+        """
+        indicator_ids = [
+            indicator_id for category in CATEGORIES.values() for indicator_id in category["indicators"]
+        ]
+        data, sources = await self.fetch_indicators(indicator_ids)
+
+        all_data = {}
+        timestamp = datetime.now().isoformat()
+        for category, info in CATEGORIES.items():
+            all_data[category] = {
+                **{indicator_id: data[indicator_id] for indicator_id in info["indicators"] if indicator_id in data},
+                "timestamp": timestamp,
+                "category": category,
+                "source_status": {
+                    indicator_id: sources[indicator_id] for indicator_id in info["indicators"] if indicator_id in sources
+                }
             }
-            
-        except Exception as e:
-            logger.error(f"Error getting all indicators: {e}")
-            return {"status": "error", "message": str(e)}
+
+        return {
+            "status": "success",
+            "data": all_data,
+            "total_indicators": len(data),
+            "partial": any(status["status"] != OK for status in sources.values()),
+            "timestamp": timestamp,
+            "version": "1.0.0"
+        }
 
     # MÉTODOS DE DATOS HISTÓRICOS
     async def get_historical_data(self, indicator: str, days: int = 30) -> Dict[str, Any]:
@@ -446,33 +455,6 @@ class ExpandedDataService:
             "source": "DEMO_HISTORICAL"
         }
 
-    # MÉTODOS DE UTILIDAD
-    def get_demo_financial_data(self):
-        """Datos demo para indicadores financieros"""
-        return {
-            "plazo_fijo_30": {"value": 118, "source": "DEMO", "unit": "%"},
-            "tasa_tarjeta_credito": {"value": 195, "source": "DEMO", "unit": "%"},
-            "depositos_privados": {"value": 45200000, "source": "DEMO", "unit": "millones ARS"},
-            "prestamos_sector_privado": {"value": 28700000, "source": "DEMO", "unit": "millones ARS"},
-            "morosidad_bancaria": {"value": 3.1, "source": "DEMO", "unit": "%"},
-            "liquidez_bancaria": {"value": 64.2, "source": "DEMO", "unit": "%"},
-            "timestamp": datetime.now().isoformat(),
-            "category": "finanzas"
-        }
-
-    def get_demo_market_data(self):
-        """Datos demo para indicadores de mercado"""
-        return {
-            "merval": {"value": 1847523, "source": "DEMO", "unit": "puntos"},
-            "rendimiento_al30": {"value": 15.2, "source": "DEMO", "unit": "%"},
-            "precio_gd30": {"value": 453.2, "source": "DEMO", "unit": "ARS"},
-            "volumen_acciones_cedears": {"value": 2800000000, "source": "DEMO", "unit": "ARS"},
-            "dolar_ccl": {"value": 1287, "source": "DEMO", "unit": "ARS"},
-            "panel_general_byma": {"value": 842, "source": "DEMO", "unit": "especies"},
-            "timestamp": datetime.now().isoformat(),
-            "category": "mercados"
-        }
-
 
 # SCRIPT DE TESTING
 async def test_expanded_service():
@@ -486,7 +468,7 @@ async def test_expanded_service():
             print(f"✅ Total indicators: {all_data.get('total_indicators')}")
             
             for category, data in all_data.get("data", {}).items():
-                indicator_count = len(data) - 2  # -2 for timestamp and category
+                indicator_count = len([key for key in data if key not in META_KEYS])
                 print(f"  📊 {category}: {indicator_count} indicators")
         
         # Test datos históricos
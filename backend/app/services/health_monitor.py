@@ -0,0 +1,248 @@
+# backend/app/services/health_monitor.py
+"""
+Estado de salud muestreado en background.
+
+Una task toma cada `HEALTH_SAMPLE_INTERVAL` segundos las métricas del
+sistema (psutil, sin bloquear: `cpu_percent(interval=None)` mide contra
+la muestra anterior) y un `SELECT 1`, y cada `HEALTH_UPSTREAM_INTERVAL`
+segundos verifica en paralelo que las fuentes externas respondan. Los
+endpoints de health solo leen el último snapshot, así que responden en
+O(1) sin tocar la base ni la red aunque los consulte un balanceador cada
+pocos segundos.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text
+
+from .circuit_breakers import breakers
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+SAMPLE_INTERVAL = float(os.getenv("HEALTH_SAMPLE_INTERVAL", "5"))
+UPSTREAM_INTERVAL = float(os.getenv("HEALTH_UPSTREAM_INTERVAL", "60"))
+UPSTREAM_TIMEOUT = float(os.getenv("HEALTH_UPSTREAM_TIMEOUT", "3"))
+PERSIST_INTERVAL = float(os.getenv("HEALTH_PERSIST_INTERVAL", "300"))
+
+CPU_DEGRADED_PERCENT = 80
+MEMORY_DEGRADED_PERCENT = 80
+
+# Un endpoint liviano por fuente: "reachable" = responde sin 5xx
+UPSTREAM_CHECKS = {
+    "BCRA": "https://api.bcra.gob.ar/estadisticas/v3.0/Monetarias",
+    "Bluelytics": "https://api.bluelytics.com.ar/v2/latest",
+    "DolarAPI": "https://dolarapi.com/v1/dolares",
+    "DolarSi": "https://www.dolarsi.com/api/api.php?type=valoresprincipales",
+    "INDEC": "https://apis.datos.gob.ar/series/api/series/?ids=148.3_INIVELNAL_DICI_M_26&limit=1",
+    "BYMA": "https://open.bymadata.com.ar/vanoms-be-core/rest/api/bymadata/free/index",
+}
+
+
+def sample_system() -> Dict[str, Any]:
+    """Métricas del sistema sin bloquear (la primera lectura de CPU da 0.0)"""
+    if not PSUTIL_AVAILABLE:
+        return {"available": False}
+
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage("/")
+    process = psutil.Process()
+    return {
+        "available": True,
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "memory_percent": memory.percent,
+        "disk_percent": disk.percent,
+        "process_rss_mb": round(process.memory_info().rss / 1024 / 1024, 1),
+        "load_average": list(os.getloadavg()) if hasattr(os, "getloadavg") else None,
+    }
+
+
+class HealthMonitor:
+    """Sampler de background con el último snapshot de salud en memoria"""
+
+    def __init__(self, session_factory: Optional[Callable] = None,
+                 interval: float = SAMPLE_INTERVAL,
+                 upstream_interval: float = UPSTREAM_INTERVAL,
+                 upstream_checks: Optional[Dict[str, str]] = None):
+        self._session_factory = session_factory
+        self.interval = interval
+        self.upstream_interval = upstream_interval
+        self.upstream_checks = dict(UPSTREAM_CHECKS if upstream_checks is None else upstream_checks)
+        self._task: Optional[asyncio.Task] = None
+        self._upstream_task: Optional[asyncio.Task] = None
+        self._system: Dict[str, Any] = {}
+        self._database: Dict[str, Any] = {}
+        self._upstreams: Dict[str, Dict[str, Any]] = {}
+        self._sampled_at: Optional[float] = None
+        self._upstreams_checked_at = 0.0
+        self._persisted_at = time.monotonic()
+
+    # --------------------------------------------------------------------- #
+    # Muestreo
+    # --------------------------------------------------------------------- #
+    def _session(self):
+        if self._session_factory is None:
+            from ..database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def check_database(self) -> Dict[str, Any]:
+        start = time.perf_counter()
+        db = self._session()
+        try:
+            db.execute(text("SELECT 1"))
+            return {"healthy": True, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return {"healthy": False, "error": str(e)}
+        finally:
+            db.close()
+
+    def _sample(self) -> None:
+        """Muestra síncrona (corre en un thread)"""
+        try:
+            self._system = sample_system()
+        except Exception as e:
+            logger.error(f"System metrics error: {e}")
+            self._system = {"available": False, "error": str(e)}
+        self._database = self.check_database()
+        self._sampled_at = time.monotonic()
+
+    async def _check_upstream(self, session, source: str, url: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            async with session.get(url, allow_redirects=True) as response:
+                return {
+                    "reachable": response.status < 500,
+                    "status_code": response.status,
+                    "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+                    "checked_at": datetime.now().isoformat(),
+                }
+        except Exception as e:
+            return {
+                "reachable": False,
+                "error": type(e).__name__,
+                "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+                "checked_at": datetime.now().isoformat(),
+            }
+
+    async def check_upstreams(self, session=None) -> Dict[str, Dict[str, Any]]:
+        """Verificar todas las fuentes en paralelo (timeout corto por fuente)"""
+        if session is None:
+            from .http_pool import http_pool
+            # Sin breakers ni reintentos: el health check mide la fuente tal cual
+            session = http_pool.client(timeout=UPSTREAM_TIMEOUT, circuit_breaker=False, retries=False)
+
+        sources = list(self.upstream_checks)
+        results = await asyncio.gather(*(
+            self._check_upstream(session, source, self.upstream_checks[source]) for source in sources
+        ))
+        self._upstreams = dict(zip(sources, results))
+        self._upstreams_checked_at = time.monotonic()
+        return self._upstreams
+
+    def _persist(self) -> None:
+        """Guardar un HealthCheck para /health/history (cada PERSIST_INTERVAL)"""
+        from ..models import HealthCheck
+
+        snapshot = self.snapshot()
+        db = self._session()
+        try:
+            db.add(HealthCheck(
+                status=snapshot["status"],
+                services=str({"database": snapshot["database"].get("healthy", False), **{
+                    source: result.get("reachable", False) for source, result in snapshot["upstreams"].items()
+                }}),
+                cpu_percent=self._system.get("cpu_percent"),
+                memory_percent=self._system.get("memory_percent"),
+                disk_percent=self._system.get("disk_percent"),
+                timestamp=datetime.now()
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to save health check: {e}")
+        finally:
+            db.close()
+
+    async def tick(self) -> None:
+        await asyncio.to_thread(self._sample)
+        now = time.monotonic()
+        upstream_idle = self._upstream_task is None or self._upstream_task.done()
+        if self.upstream_checks and upstream_idle and now - self._upstreams_checked_at >= self.upstream_interval:
+            # En background: un upstream lento no atrasa la próxima muestra
+            self._upstream_task = asyncio.create_task(self.check_upstreams())
+        if now - self._persisted_at >= PERSIST_INTERVAL:
+            self._persisted_at = now
+            await asyncio.to_thread(self._persist)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Health sampler error: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if PSUTIL_AVAILABLE:
+            psutil.cpu_percent(interval=None)  # línea base para la primera muestra
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🩺 Health sampler cada {self.interval}s")
+
+    async def stop(self) -> None:
+        for task in (self._task, self._upstream_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._upstream_task = None
+
+    # --------------------------------------------------------------------- #
+    # Lectura (endpoints)
+    # --------------------------------------------------------------------- #
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Último estado muestreado; no hace I/O"""
+        age = time.monotonic() - self._sampled_at if self._sampled_at is not None else None
+        system = self._system or sample_system()
+
+        if self._database and not self._database.get("healthy"):
+            status = "unhealthy"
+        elif age is None or age > 3 * self.interval:
+            status = "degraded"  # sampler detenido o atrasado
+        elif (system.get("cpu_percent", 0) > CPU_DEGRADED_PERCENT
+              or system.get("memory_percent", 0) > MEMORY_DEGRADED_PERCENT
+              or breakers.open_circuits()):
+            status = "degraded"
+        else:
+            status = "healthy"
+
+        return {
+            "status": status,
+            "sample_age_seconds": round(age, 3) if age is not None else None,
+            "system": system,
+            "database": self._database,
+            "upstreams": self._upstreams,
+            "circuit_breakers": breakers.snapshot(),
+        }
+
+
+health_monitor = HealthMonitor()
@@ -0,0 +1,206 @@
+# backend/app/services/http_pool.py
+"""
+Pool de conexiones HTTP compartido por todos los servicios de datos.
+
+Se crea una única `aiohttp.ClientSession` (y un `httpx.AsyncClient` si está
+disponible) por proceso, gestionada desde `main.lifespan`. Los servicios
+reciben un `PooledSession` liviano con su propio timeout y headers, de modo
+que las conexiones keep-alive a BCRA, INDEC, Bluelytics, etc. se reutilizan
+entre requests en lugar de abrir un handshake TCP+TLS nuevo cada vez.
+Cada request pasa por el circuit breaker de su fuente (ver
+`circuit_breakers`) y los GET se reintentan ante fallas transitorias (ver
+`retries`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from ..config import settings
+from .circuit_breakers import guarded
+from .metrics_service import httpx_event_hooks, trace_config
+from .retries import RETRY_METHODS, RetryingRequest
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+
+class HTTPClientPool:
+    """
+    Pool de conexiones app-scoped con límites por host, keep-alive y caché DNS.
+    """
+
+    def __init__(self) -> None:
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._httpx_client: Optional["httpx.AsyncClient"] = None
+        self._lock = asyncio.Lock()
+        self._shut_down = False
+
+    # --------------------------------------------------------------------- #
+    # Ciclo de vida (llamado desde main.lifespan)
+    # --------------------------------------------------------------------- #
+    async def start(self) -> None:
+        """Crear las sesiones compartidas si todavía no existen"""
+        async with self._lock:
+            self._shut_down = False
+            if self._session is None or self._session.closed:
+                self._session = self._create_session()
+                logger.info("✅ HTTP pool iniciado")
+
+    async def close(self) -> None:
+        """
+        Cerrar las sesiones compartidas y liberar los sockets. Después del
+        close el pool no se reabre solo (hasta un nuevo `start()`): un
+        request tardío falla en lugar de dejar un connector sin cerrar.
+        """
+        async with self._lock:
+            self._shut_down = True
+            if self._session and not self._session.closed:
+                await self._session.close()
+            if self._httpx_client is not None:
+                await self._httpx_client.aclose()
+            self._session = None
+            self._httpx_client = None
+            logger.info("⏹️ HTTP pool cerrado")
+
+    # --------------------------------------------------------------------- #
+    # Acceso a las sesiones
+    # --------------------------------------------------------------------- #
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Sesión aiohttp compartida. Se crea en forma perezosa para que los
+        scripts que usan los servicios fuera de la app sigan funcionando.
+        """
+        self._check_open()
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    @property
+    def httpx_client(self) -> "httpx.AsyncClient":
+        """Cliente httpx compartido (solo si httpx está instalado)"""
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx not available")
+        self._check_open()
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(getattr(settings, "HTTP_TIMEOUT", 30)),
+                limits=httpx.Limits(
+                    max_connections=getattr(settings, "HTTP_POOL_LIMIT", 100),
+                    max_keepalive_connections=getattr(settings, "HTTP_POOL_LIMIT_PER_HOST", 20),
+                    keepalive_expiry=getattr(settings, "HTTP_KEEPALIVE_TIMEOUT", 30),
+                ),
+                event_hooks=httpx_event_hooks(),
+            )
+        return self._httpx_client
+
+    def _check_open(self) -> None:
+        if self._shut_down:
+            raise RuntimeError("HTTP pool is closed (application shutting down)")
+
+    def client(
+        self,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        circuit_breaker: bool = True,
+        retries: bool = True,
+    ) -> "PooledSession":
+        """
+        Vista de la sesión compartida con timeout y headers propios del
+        servicio. `circuit_breaker=False` / `retries=False` omiten breakers y
+        reintentos (health checks).
+        """
+        return PooledSession(self, timeout=timeout, headers=headers,
+                             circuit_breaker=circuit_breaker, retries=retries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estado del connector para monitoreo"""
+        if self._session is None or self._session.closed:
+            return {"active": False}
+        connector = self._session.connector
+        return {
+            "active": True,
+            "limit": connector.limit if connector else None,
+            "limit_per_host": connector.limit_per_host if connector else None,
+        }
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=getattr(settings, "HTTP_POOL_LIMIT", 100),
+            limit_per_host=getattr(settings, "HTTP_POOL_LIMIT_PER_HOST", 20),
+            keepalive_timeout=getattr(settings, "HTTP_KEEPALIVE_TIMEOUT", 30),
+            ttl_dns_cache=getattr(settings, "HTTP_DNS_TTL", 300),
+            use_dns_cache=True,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=getattr(settings, "HTTP_TIMEOUT", 30)),
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            trace_configs=[trace_config()],  # latencia/errores por fuente en /metrics
+        )
+
+
+class PooledSession:
+    """
+    Adaptador con la misma interfaz que `aiohttp.ClientSession` para los
+    servicios: aplica timeout/headers por defecto y delega en el pool.
+    """
+
+    def __init__(
+        self,
+        pool: HTTPClientPool,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        circuit_breaker: bool = True,
+        retries: bool = True,
+    ) -> None:
+        self._pool = pool
+        self._timeout = aiohttp.ClientTimeout(total=timeout) if timeout else None
+        self._headers = headers or {}
+        self._circuit_breaker = circuit_breaker
+        self._retries = retries
+
+    def request(self, method: str, url: str, **kwargs: Any):
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        if self._headers:
+            kwargs["headers"] = {**self._headers, **(kwargs.get("headers") or {})}
+
+        def send():
+            if not self._circuit_breaker:
+                return self._pool.session.request(method, url, **kwargs)
+            return guarded(url, lambda: self._pool.session.request(method, url, **kwargs))
+
+        if self._retries and method.upper() in RETRY_METHODS:
+            return RetryingRequest(url, send)
+        return send()
+
+    def get(self, url: str, **kwargs: Any):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any):
+        return self.request("POST", url, **kwargs)
+
+    @property
+    def closed(self) -> bool:
+        return False
+
+    async def close(self) -> None:
+        """No-op: la sesión pertenece al pool y se cierra en el shutdown"""
+
+
+# Instancia global
+http_pool = HTTPClientPool()
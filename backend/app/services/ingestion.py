@@ -0,0 +1,114 @@
+# backend/app/services/ingestion.py
+"""
+Ingesta en bloque de indicadores.
+
+Reemplaza el patrón "UPDATE is_active=False + INSERT" por indicador (2N
+statements por refresh) con tres statements set-based en una transacción:
+
+1. UPDATE ... SET is_active=False WHERE indicator_type IN (...) AND is_active
+2. INSERT executemany de las filas nuevas (con RETURNING id si el driver lo soporta)
+3. INSERT ... ON CONFLICT sobre el snapshot `current_indicators`
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from ..models import EconomicIndicator
+from . import live_updates, snapshot_service, timeseries_store
+
+logger = logging.getLogger(__name__)
+
+OPTIONAL_COLUMNS = ("unit", "label", "category")
+
+
+def _normalize(records: Iterable[Mapping[str, Any]], now: datetime) -> List[Dict[str, Any]]:
+    """Filas listas para insertar; si un tipo viene repetido gana el último"""
+    rows: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        value = record.get("value")
+        if value is None:
+            continue
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Skipping {record.get('indicator_type')}: invalid value {value!r}")
+            continue
+
+        row = {
+            "indicator_type": record["indicator_type"],
+            "value": value,
+            "source": record.get("source") or "UNKNOWN",
+            "date": record.get("date") or now,
+            "is_active": True,
+        }
+        for column in OPTIONAL_COLUMNS:
+            row[column] = record.get(column)
+        rows[row["indicator_type"]] = row
+    return list(rows.values())
+
+
+def _insert_rows(db: Session, rows: List[Dict[str, Any]]) -> List[Optional[int]]:
+    table = EconomicIndicator.__table__
+    dialect = db.get_bind().dialect
+    if getattr(dialect, "insert_executemany_returning_sort_by_parameter_order", False):
+        stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        return list(db.execute(stmt, rows).scalars())
+
+    db.execute(insert(table), rows)
+    return [None] * len(rows)
+
+
+def ingest_indicators(
+    db: Session,
+    records: Iterable[Mapping[str, Any]],
+    now: Optional[datetime] = None,
+    commit: bool = True
+) -> int:
+    """
+    Guardar un lote de indicadores como los nuevos valores activos.
+
+    Cada record es un dict con `indicator_type`, `value`, `source` y
+    opcionalmente `date`, `unit`, `label`, `category`. Devuelve la cantidad
+    de filas insertadas.
+    """
+    rows = _normalize(records, now or datetime.now())
+    if not rows:
+        return 0
+
+    try:
+        db.execute(
+            update(EconomicIndicator)
+            .where(
+                EconomicIndicator.indicator_type.in_([row["indicator_type"] for row in rows]),
+                EconomicIndicator.is_active == True
+            )
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+
+        ids = _insert_rows(db, rows)
+
+        snapshot_service.record_rows(db, [
+            {
+                "indicator_id": indicator_id,
+                **{column: row[column] for column in ("indicator_type", "value", "source", "date")},
+                **{column: row[column] for column in OPTIONAL_COLUMNS},
+            }
+            for row, indicator_id in zip(rows, ids)
+        ])
+
+        if commit:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    if commit:
+        timeseries_store.record_points(rows)
+        live_updates.publish_changes(rows)
+
+    return len(rows)
@@ -5,20 +5,35 @@ Reemplaza los datos demo con datos reales de múltiples APIs
 """
 
 import asyncio
-import aiohttp
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import json
 import os
 
 # Import our custom services
 from .bcra_real_service import BCRARealService
 from .dolar_blue_service import DolarBlueService
+from .cache_service import cache
+from .http_pool import http_pool
+from ..config.indicators_mapping import get_freshness_policy
+from ..utils.fanout import Collected, collect
+from ..utils.singleflight import singleflight
+from ..utils.swr import stale_while_revalidate
 
 logger = logging.getLogger(__name__)
 
+# Presupuesto total de fetch_current_indicators y deadline por fuente (segundos)
+RESPONSE_BUDGET = float(os.getenv("INTEGRATED_RESPONSE_BUDGET", "10"))
+SOURCE_DEADLINES = {
+    'bcra': 8.0,
+    'dolar': 5.0,
+    'inflation': 8.0,
+    'riesgo_pais': 6.0,
+    'market': 6.0,
+}
+
 @dataclass
 class EconomicData:
     """Estructura unificada para datos económicos"""
@@ -40,18 +55,38 @@ class EconomicData:
             'metadata_info': json.dumps(self.metadata or {})
         }
 
+def _is_live(value) -> bool:
+    """Un resultado vacío o con fallback demo no reemplaza al último dato real"""
+    items = value if isinstance(value, list) else [value]
+    return bool(items) and all(
+        item is not None and not (item.metadata or {}).get('is_fallback') for item in items
+    )
+
+def _annotate_freshness(value, result):
+    """Copia los EconomicData agregando edad y flag `stale` en metadata"""
+    def annotate(item):
+        if item is None:
+            return None
+        return replace(item, metadata={
+            **(item.metadata or {}),
+            'age_seconds': round(result.age, 1),
+            'stale': result.stale
+        })
+
+    if isinstance(value, list):
+        return [annotate(item) for item in value]
+    return annotate(value)
+
 class IntegratedDataService:
     """Servicio principal que integra todas las fuentes de datos reales"""
     
     def __init__(self):
         self.bcra_service = None
         self.dolar_service = None
-        self.session = None
-        self._cache = {}
+        self.session = http_pool.client()
         self._cache_ttl = 300  # 5 minutos cache general
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         self.bcra_service = BCRARealService()
         await self.bcra_service.__aenter__()
         self.dolar_service = DolarBlueService()
@@ -63,41 +98,39 @@ class IntegratedDataService:
             await self.bcra_service.__aexit__(exc_type, exc_val, exc_tb)
         if self.dolar_service:
             await self.dolar_service.__aexit__(exc_type, exc_val, exc_tb)
-        if self.session:
-            await self.session.close()
     
     async def get_all_current_indicators(self) -> List[EconomicData]:
         """Obtiene todos los indicadores actuales de todas las fuentes"""
-        indicators = []
+        result = await self.fetch_current_indicators()
+        return list(result.values)
+    
+    @singleflight
+    async def fetch_current_indicators(self) -> Collected:
+        """
+        Indicadores actuales con el estado por fuente. Las fuentes se
+        consultan en paralelo con deadline propio y un presupuesto total
+        (RESPONSE_BUDGET): las que no llegan quedan fuera del resultado y
+        marcadas en `source_status`.
+        """
+        sources = {
+            'bcra': self._fetch_bcra_indicators,             # USD oficial, reservas, tasa, etc.
+            'dolar': self._fetch_dolar_indicators,           # blue, MEP, CCL
+            'inflation': self._fetch_inflation_indicators,   # INDEC
+            'riesgo_pais': self._fetch_riesgo_pais,          # scraping
+            'market': self._fetch_market_indicators,         # MERVAL, etc.
+        }
+        result = await collect(sources, budget=RESPONSE_BUDGET, deadlines=SOURCE_DEADLINES)
         
-        try:
-            # 1. Datos del BCRA (USD oficial, reservas, tasa, etc.)
-            bcra_data = await self._fetch_bcra_indicators()
-            indicators.extend(bcra_data)
-            
-            # 2. Cotizaciones dólar (blue, MEP, CCL)
-            dolar_data = await self._fetch_dolar_indicators()
-            indicators.extend(dolar_data)
-            
-            # 3. Datos de inflación (INDEC)
-            inflation_data = await self._fetch_inflation_indicators()
-            indicators.extend(inflation_data)
-            
-            # 4. Riesgo país (scraping)
-            riesgo_data = await self._fetch_riesgo_pais()
-            if riesgo_data:
-                indicators.append(riesgo_data)
-            
-            # 5. Datos de mercado (MERVAL, etc.)
-            market_data = await self._fetch_market_indicators()
-            indicators.extend(market_data)
-            
-            logger.info(f"Fetched {len(indicators)} real indicators")
-            return indicators
-            
-        except Exception as e:
-            logger.error(f"Error fetching all indicators: {e}")
-            return self._get_fallback_indicators()
+        failed = [name for name, status in result.source_status.items() if status['status'] != 'ok']
+        if failed:
+            logger.warning(f"Sources without data within deadline: {', '.join(failed)}")
+        
+        if not result.values:
+            logger.error("No source returned data, using fallback indicators")
+            return Collected(tuple(self._get_fallback_indicators()), result.source_status)
+        
+        logger.info(f"Fetched {len(result.values)} real indicators")
+        return result
     
     async def _fetch_bcra_indicators(self) -> List[EconomicData]:
         """Obtiene indicadores del BCRA"""
@@ -161,6 +194,8 @@ class IntegratedDataService:
         
         return indicators
     
+    @stale_while_revalidate('integrated:inflation', get_freshness_policy('ipc'),
+                            is_valid=_is_live, annotate=_annotate_freshness)
     async def _fetch_inflation_indicators(self) -> List[EconomicData]:
         """Obtiene datos de inflación del INDEC"""
         indicators = []
@@ -219,6 +254,8 @@ class IntegratedDataService:
         
         return indicators
     
+    @stale_while_revalidate('integrated:riesgo_pais', get_freshness_policy('riesgo_pais'),
+                            is_valid=_is_live, annotate=_annotate_freshness)
     async def _fetch_riesgo_pais(self) -> Optional[EconomicData]:
         """Obtiene riesgo país mediante scraping"""
         try:
@@ -259,6 +296,8 @@ class IntegratedDataService:
             metadata={'is_fallback': True}
         )
     
+    @stale_while_revalidate('integrated:market', get_freshness_policy('merval'),
+                            is_valid=_is_live, annotate=_annotate_freshness)
     async def _fetch_market_indicators(self) -> List[EconomicData]:
         """Obtiene indicadores de mercado (MERVAL, etc.)"""
         indicators = []
@@ -308,7 +347,19 @@ class IntegratedDataService:
         return indicators
     
     async def get_historical_data(self, indicator_type: str, days: int = 30) -> List[Dict]:
-        """Obtiene datos históricos para un indicador específico"""
+        """Obtiene datos históricos para un indicador específico (cacheados)"""
+        cache_key = f"integrated:historical:{indicator_type}:{days}"
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        data = await self._fetch_historical_data(indicator_type, days)
+        if data:
+            await cache.set(cache_key, data, ttl=self._cache_ttl)
+        return data
+    
+    async def _fetch_historical_data(self, indicator_type: str, days: int) -> List[Dict]:
+        """Obtiene datos históricos desde la fuente correspondiente"""
         try:
             # Determinar la fuente según el tipo de indicador
             if indicator_type.startswith('dolar_'):
@@ -422,7 +473,8 @@ class IntegratedDataService:
         start_time = datetime.now()
         
         try:
-            indicators = await self.get_all_current_indicators()
+            result = await self.fetch_current_indicators()
+            indicators = result.values
             
             # Estadísticas del refresh
             sources = {}
@@ -438,6 +490,8 @@ class IntegratedDataService:
                 'success': True,
                 'total_indicators': len(indicators),
                 'sources': sources,
+                'source_status': result.source_status,
+                'partial': result.partial,
                 'duration_seconds': duration,
                 'timestamp': datetime.now().isoformat(),
                 'real_data_percentage': (sum(1 for i in indicators if 'fallback' not in i.source.lower()) / len(indicators)) * 100 if indicators else 0
@@ -0,0 +1,111 @@
+# backend/app/services/live_updates.py
+"""
+Actualizaciones en vivo de indicadores (fuente de /api/v1/live SSE y WS).
+
+Las ingestas (scheduler, refresh, BCRA expandido) y los servicios de dólar
+publican acá sus valores; solo se emiten los indicadores cuyo valor cambió
+desde la última publicación, agrupados en un mensaje por categoría
+(tópicos = categorías de `indicators_mapping.CATEGORIES`).
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from ..config.indicators_mapping import CATEGORIES
+from ..utils.pubsub import Broadcaster
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_TOPIC = "otros"
+TOPICS = [*CATEGORIES, FALLBACK_TOPIC]
+TOPIC_BY_INDICATOR = {
+    indicator: category
+    for category, info in CATEGORIES.items()
+    for indicator in info["indicators"]
+}
+
+broadcaster = Broadcaster(queue_size=int(os.getenv("LIVE_QUEUE_SIZE", "100")))
+
+# indicator_type -> último valor publicado
+_last_values: Dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def topic_for(indicator_type: str) -> str:
+    return TOPIC_BY_INDICATOR.get(indicator_type, FALLBACK_TOPIC)
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def indicator_event(record: Mapping[str, Any]) -> Dict[str, Any]:
+    """Forma pública de un indicador en los mensajes en vivo"""
+    return {
+        "indicator_type": record["indicator_type"],
+        "value": record["value"],
+        "source": record.get("source"),
+        "date": _isoformat(record.get("date")),
+        "unit": record.get("unit"),
+        "label": record.get("label"),
+        "topic": topic_for(record["indicator_type"]),
+    }
+
+
+def encode_message(topic: str, indicators: List[Dict[str, Any]], event: str = "indicators") -> str:
+    """Serializar una vez; el mismo string se reparte a todos los suscriptores"""
+    return json.dumps({
+        "event": event,
+        "topic": topic,
+        "data": indicators,
+        "timestamp": datetime.now().isoformat(),
+    }, ensure_ascii=False)
+
+
+def group_by_topic(records: Iterable[Mapping[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        event = indicator_event(record)
+        grouped.setdefault(event["topic"], []).append(event)
+    return grouped
+
+
+def publish_changes(records: Iterable[Mapping[str, Any]]) -> int:
+    """Publicar los indicadores que cambiaron; devuelve cuántos se emitieron"""
+    changed = []
+    with _lock:
+        for record in records:
+            value = record.get("value")
+            if value is None or _last_values.get(record["indicator_type"]) == value:
+                continue
+            _last_values[record["indicator_type"]] = value
+            changed.append(record)
+
+    for topic, indicators in group_by_topic(changed).items():
+        try:
+            broadcaster.publish(topic, encode_message(topic, indicators))
+        except Exception as e:
+            logger.warning(f"Could not publish live update for {topic}: {e}")
+
+    if changed:
+        logger.debug(f"📡 {len(changed)} indicadores publicados en vivo")
+    return len(changed)
+
+
+def parse_topics(topics: Optional[str]) -> List[str]:
+    """'economia,mercados' -> tópicos válidos (vacío = todos)"""
+    if not topics:
+        return []
+    requested = [topic.strip() for topic in topics.split(",") if topic.strip()]
+    unknown = [topic for topic in requested if topic not in TOPICS]
+    if unknown:
+        raise ValueError(f"Unknown topics: {', '.join(unknown)}")
+    return requested
+
+
+def get_stats() -> Dict[str, Any]:
+    return {**broadcaster.get_stats(), "tracked_indicators": len(_last_values)}
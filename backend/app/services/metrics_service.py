@@ -0,0 +1,211 @@
+# backend/app/services/metrics_service.py
+"""
+Métricas de la aplicación para `/metrics` (Prometheus).
+
+Instrumentación:
+- requests HTTP por ruta (LoggingMiddleware → `observe_request`)
+- fetches a fuentes externas por fuente (TraceConfig del pool aiohttp y
+  event hooks de httpx → `observe_upstream`)
+- duración de tareas del scheduler (`observe_task`)
+- duración de queries por operación (eventos de SQLAlchemy, `instrument_db`)
+- hit ratio de cachés y estado del registro de uso (collectors en el scrape)
+"""
+
+import logging
+from time import perf_counter
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..utils.metrics import Registry
+
+logger = logging.getLogger(__name__)
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "argfy_http_requests_total", "Requests HTTP atendidos", ("method", "route", "status")
+)
+http_latency = registry.histogram(
+    "argfy_http_request_duration_seconds", "Latencia de requests HTTP", ("method", "route")
+)
+upstream_requests = registry.counter(
+    "argfy_upstream_requests_total", "Requests a fuentes externas", ("source", "status")
+)
+upstream_errors = registry.counter(
+    "argfy_upstream_errors_total", "Errores de fuentes externas (HTTP >= 500 o excepción)", ("source", "reason")
+)
+upstream_retries = registry.counter(
+    "argfy_upstream_retries_total", "Reintentos a fuentes externas", ("source", "reason")
+)
+upstream_latency = registry.histogram(
+    "argfy_upstream_request_duration_seconds", "Latencia de fuentes externas", ("source",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+task_duration = registry.histogram(
+    "argfy_scheduler_task_duration_seconds", "Duración de tareas del scheduler", ("task", "status"),
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0)
+)
+db_latency = registry.histogram(
+    "argfy_db_query_duration_seconds", "Duración de queries SQL", ("operation",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+)
+
+# Host → fuente (por sufijo); el resto va a "other" para acotar cardinalidad
+UPSTREAM_SOURCES = (
+    ("bcra.gob.ar", "BCRA"),
+    ("bluelytics.com.ar", "Bluelytics"),
+    ("dolarapi.com", "DolarAPI"),
+    ("dolarsi.com", "DolarSi"),
+    ("indec.gob.ar", "INDEC"),
+    ("apis.datos.gob.ar", "INDEC"),  # series de tiempo (IPC, EMAE, desempleo)
+    ("bymadata.com.ar", "BYMA"),
+    ("finance.yahoo.com", "Yahoo"),
+)
+
+DB_OPERATIONS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+def source_for_host(host: Optional[str]) -> str:
+    if host:
+        for suffix, source in UPSTREAM_SOURCES:
+            if host == suffix or host.endswith("." + suffix):
+                return source
+    return "other"
+
+
+def source_for_url(url: str) -> str:
+    return source_for_host(urlsplit(url).hostname)
+
+
+def observe_request(method: str, route: str, status_code: int, duration_ms: float) -> None:
+    http_requests.inc(method, route, str(status_code))
+    http_latency.observe(duration_ms / 1000, method, route)
+
+
+def observe_upstream(source: str, duration: float, status: Optional[int] = None,
+                     error: Optional[BaseException] = None) -> None:
+    """Registrar un fetch a una fuente externa (duración en segundos)"""
+    upstream_latency.observe(duration, source)
+    if error is not None:
+        upstream_requests.inc(source, "error")
+        upstream_errors.inc(source, type(error).__name__)
+        return
+    upstream_requests.inc(source, str(status))
+    if status is not None and status >= 500:
+        upstream_errors.inc(source, "http_5xx")
+
+
+def observe_task(name: str, duration: float, status: str) -> None:
+    task_duration.observe(duration, name, status)
+
+
+# --------------------------------------------------------------------- #
+# Clientes HTTP
+# --------------------------------------------------------------------- #
+def trace_config() -> aiohttp.TraceConfig:
+    """TraceConfig para la ClientSession compartida (ver http_pool)"""
+    config = aiohttp.TraceConfig()
+
+    async def on_request_start(session, context, params):
+        context.start = perf_counter()
+
+    async def on_request_end(session, context, params):
+        observe_upstream(source_for_host(params.url.host), perf_counter() - context.start,
+                         status=params.response.status)
+
+    async def on_request_exception(session, context, params):
+        observe_upstream(source_for_host(params.url.host), perf_counter() - context.start,
+                         error=params.exception)
+
+    config.on_request_start.append(on_request_start)
+    config.on_request_end.append(on_request_end)
+    config.on_request_exception.append(on_request_exception)
+    return config
+
+
+def httpx_event_hooks() -> dict:
+    """event_hooks para httpx.AsyncClient (las excepciones no pasan por los hooks)"""
+
+    async def on_request(request):
+        request.extensions["argfy_start"] = perf_counter()
+
+    async def on_response(response):
+        start = response.request.extensions.get("argfy_start")
+        if start is not None:
+            observe_upstream(source_for_host(response.request.url.host), perf_counter() - start,
+                             status=response.status_code)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+# --------------------------------------------------------------------- #
+# Base de datos
+# --------------------------------------------------------------------- #
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._argfy_query_start = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_argfy_query_start", None)
+    if start is None:
+        return
+    operation = statement.lstrip()[:6].upper()
+    db_latency.observe(perf_counter() - start, operation if operation in DB_OPERATIONS else "OTHER")
+
+
+def instrument_db() -> None:
+    """Medir todas las queries de todos los engines (también los async)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# --------------------------------------------------------------------- #
+# Collectors (se evalúan en cada scrape)
+# --------------------------------------------------------------------- #
+def _hit_ratio(hits: float, misses: float) -> float:
+    return round(hits / (hits + misses), 4) if hits + misses else 0.0
+
+
+@registry.collector
+def _cache_metrics() -> Iterable:
+    from . import snapshot_service
+
+    versions = snapshot_service._versions.get_stats()
+    hits = [({"cache": "snapshot_version", "tier": "l1"}, versions["hits"])]
+    misses = [({"cache": "snapshot_version"}, versions["misses"])]
+    ratios = [({"cache": "snapshot_version"}, _hit_ratio(versions["hits"], versions["misses"]))]
+
+    try:
+        from .cache_service import cache
+        stats = cache.get_stats()
+        hits += [
+            ({"cache": "app", "tier": "l1"}, stats["l1"]["hits"]),
+            ({"cache": "app", "tier": "l2"}, stats["l2"]["hits"]),
+        ]
+        misses.append(({"cache": "app"}, stats["misses"]))
+        ratios.append(({"cache": "app"}, stats["hit_ratio"]))
+    except Exception:
+        pass  # settings no disponibles (scripts / tests)
+
+    yield ("argfy_cache_hits_total", "counter", "Hits de caché por nivel", hits)
+    yield ("argfy_cache_misses_total", "counter", "Misses de caché", misses)
+    yield ("argfy_cache_hit_ratio", "gauge", "Hit ratio de caché desde el arranque", ratios)
+
+
+@registry.collector
+def _api_usage_metrics() -> Iterable:
+    from .api_usage import usage_recorder
+
+    stats = usage_recorder.get_stats()
+    yield ("argfy_api_usage_buffered", "gauge", "Requests pendientes de flush", [({}, stats["buffered"])])
+    yield ("argfy_api_usage_dropped_total", "counter", "Requests descartados por buffer lleno", [({}, stats["dropped"])])
+
+
+def render() -> str:
+    return registry.render()
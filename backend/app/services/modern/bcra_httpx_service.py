@@ -13,6 +13,8 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+from ..http_pool import http_pool
+
 class BCRAHTTPXService:
     """Servicio BCRA con httpx (con fallback)"""
     
@@ -22,12 +24,13 @@ class BCRAHTTPXService:
         
     async def __aenter__(self):
         if HTTPX_AVAILABLE:
-            self.client = httpx.AsyncClient(timeout=10.0)
+            # Cliente httpx compartido del pool (keep-alive entre requests)
+            self.client = http_pool.httpx_client
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.client:
-            await self.client.aclose()
+        # El cliente pertenece a http_pool y se cierra en el shutdown de la app
+        pass
     
     async def get_exchange_rates(self) -> Dict:
         """Obtener cotizaciones con httpx"""
@@ -36,7 +39,7 @@ class BCRAHTTPXService:
         
         try:
             url = f"{self.base_url}/estadisticascambiarias/v1.0/Cotizaciones"
-            response = await self.client.get(url)
+            response = await self.client.get(url, timeout=10.0)
             
             if response.status_code == 200:
                 return {
@@ -58,7 +61,7 @@ class BCRAHTTPXService:
         
         try:
             url = f"{self.base_url}/estadisticas/v2.0/principalesvariables"
-            response = await self.client.get(url)
+            response = await self.client.get(url, timeout=10.0)
             
             if response.status_code == 200:
                 return {
@@ -6,6 +6,8 @@ from datetime import datetime
 from typing import Dict, List
 import logging
 
+from ..http_pool import http_pool
+
 logger = logging.getLogger(__name__)
 
 class BCRAMassiveService:
@@ -13,15 +15,14 @@ class BCRAMassiveService:
     
     def __init__(self):
         self.base_url = "https://api.bcra.gob.ar"
-        self.session = None
+        self.session = http_pool.client(timeout=10)
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # La sesion pertenece a http_pool y se cierra en el shutdown de la app
+        pass
     
     async def get_all_variables_massive(self) -> Dict:
         """Obtener TODAS las variables BCRA en paralelo masivo"""
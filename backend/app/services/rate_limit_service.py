@@ -0,0 +1,53 @@
+# backend/app/services/rate_limit_service.py
+"""
+Rate limiting de la aplicación: token bucket en proceso o ventana
+deslizante en Redis, configurado desde settings.
+Ver `app.utils.rate_limit` y `app.middleware.rate_limit_middleware`.
+"""
+import logging
+from typing import Any, Dict
+
+from app.config import settings
+from app.utils.rate_limit import Quota, RedisSlidingWindowLimiter, TokenBucketLimiter
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60
+
+
+def _build_limiter():
+    """Limitador Redis si RATE_LIMIT_BACKEND=redis y hay REDIS_URL; si no, en memoria"""
+    url = getattr(settings, "REDIS_URL", None)
+    if getattr(settings, "RATE_LIMIT_BACKEND", "memory") != "redis" or not url:
+        return TokenBucketLimiter()
+
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        logger.warning("redis no instalado, rate limiting en memoria")
+        return TokenBucketLimiter()
+
+    client = aioredis.from_url(url, socket_timeout=getattr(settings, "REDIS_TIMEOUT", 0.5))
+    prefix = f"{getattr(settings, 'CACHE_PREFIX', 'argfy:')}ratelimit:"
+    return RedisSlidingWindowLimiter(client, prefix=prefix)
+
+
+limiter = _build_limiter()
+
+
+def middleware_options() -> Dict[str, Any]:
+    """Argumentos para `app.add_middleware(RateLimitMiddleware, ...)`"""
+    return {
+        "limiter": limiter,
+        "default_quota": Quota(getattr(settings, "RATE_LIMIT_PER_MINUTE", 60), WINDOW_SECONDS),
+        "route_quotas": {
+            prefix: Quota(limit, WINDOW_SECONDS)
+            for prefix, limit in getattr(settings, "RATE_LIMIT_ROUTES", {}).items()
+        },
+        "client_quotas": {
+            f"key:{api_key}": Quota(limit, WINDOW_SECONDS)
+            for api_key, limit in getattr(settings, "RATE_LIMIT_CLIENTS", {}).items()
+        },
+        "trust_forwarded": getattr(settings, "RATE_LIMIT_TRUST_FORWARDED", False),
+        "enabled": getattr(settings, "RATE_LIMIT_ENABLED", True),
+    }
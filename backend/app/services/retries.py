@@ -0,0 +1,86 @@
+# backend/app/services/retries.py
+"""
+Reintentos de GETs idempotentes del pool HTTP compartido.
+
+`http_pool` envuelve los GET/HEAD en `RetryingRequest`: errores de conexión,
+timeouts y respuestas 429/5xx se reintentan con decorrelated jitter y
+`Retry-After` (ver utils/retry.py), descontando de un presupuesto global
+para no amplificar la carga durante una caída. Cada intento pasa por el
+circuit breaker de la fuente; un circuito abierto no se reintenta.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Optional
+
+import aiohttp
+
+from ..utils.retry import RetryBudget, RetryPolicy, parse_retry_after
+from .metrics_service import source_for_url, upstream_retries
+
+logger = logging.getLogger(__name__)
+
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+retry_policy = RetryPolicy(
+    max_attempts=int(os.getenv("HTTP_RETRY_MAX_ATTEMPTS", "3")),
+    base=float(os.getenv("HTTP_RETRY_BASE_DELAY", "0.2")),
+    cap=float(os.getenv("HTTP_RETRY_MAX_DELAY", "5")),
+    max_retry_after=float(os.getenv("HTTP_RETRY_MAX_RETRY_AFTER", "10")),
+    budget=RetryBudget(
+        ratio=float(os.getenv("HTTP_RETRY_BUDGET_RATIO", "0.1")),
+        max_tokens=float(os.getenv("HTTP_RETRY_BUDGET_TOKENS", "10")),
+    ),
+)
+
+
+class RetryingRequest:
+    """
+    Envuelve un request (awaitable que devuelve la respuesta) y lo repite
+    según `policy`. Sirve con `async with` y con `await`, como aiohttp.
+    """
+
+    def __init__(self, url: Any, send: Callable[[], Any], policy: Optional[RetryPolicy] = None):
+        self._url = url
+        self._send = send
+        self._policy = policy or retry_policy
+        self._response = None
+
+    async def _run(self):
+        policy = self._policy
+        policy.budget.deposit()
+        attempt, wait = 0, 0.0
+        while True:
+            attempt += 1
+            try:
+                response = await self._send()
+            except RETRY_EXCEPTIONS as e:
+                wait = policy.delay(attempt, wait)
+                if wait is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                if response.status not in policy.retry_statuses:
+                    return response
+                wait = policy.delay(attempt, wait, parse_retry_after(response.headers.get("Retry-After")))
+                if wait is None:
+                    return response  # el llamador ve el último status
+                response.release()
+                reason = str(response.status)
+
+            upstream_retries.inc(source_for_url(str(self._url)), reason)
+            logger.debug(f"🔁 Reintento {attempt} de {self._url} en {wait:.2f}s ({reason})")
+            await asyncio.sleep(wait)
+
+    async def __aenter__(self):
+        self._response = await self._run()
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._response is not None:
+            await self._response.__aexit__(exc_type, exc, tb)
+
+    def __await__(self):
+        return self._run().__await__()
@@ -6,6 +6,7 @@ Reemplaza: bcra_scheduler.py, monitor.py, monitor_render.py, monitoring.py
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from time import perf_counter
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -16,6 +17,10 @@ from ..config import settings
 from ..database import get_db
 from ..models import EconomicIndicator, HealthCheck
 from .bcra_service import bcra_service
+from .ingestion import ingest_indicators
+from .health_monitor import health_monitor
+from .metrics_service import observe_task
+from ..utils.retry import decorrelated_jitter
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +43,7 @@ class ScheduledTask:
     error_count: int = 0
     max_errors: int = 3
     enabled: bool = True
+    retry_delay_minutes: float = 0  # último backoff aplicado (0 = sin fallas)
     
     def __post_init__(self):
         if self.next_run is None:
@@ -190,6 +196,7 @@ class UnifiedScheduler:
         """Ejecuta una tarea específica"""
         task.status = TaskStatus.RUNNING
         task.last_run = datetime.now()
+        start = perf_counter()
         
         try:
             logger.debug(f"Executing task: {task.name}")
@@ -201,13 +208,16 @@ class UnifiedScheduler:
             
             task.status = TaskStatus.COMPLETED
             task.error_count = 0  # Reset error count on success
+            task.retry_delay_minutes = 0
             task.next_run = datetime.now() + timedelta(minutes=task.interval_minutes)
+            observe_task(task.name, perf_counter() - start, "completed")
             
             logger.debug(f"Task '{task.name}' completed successfully")
             
         except Exception as e:
             task.status = TaskStatus.FAILED
             task.error_count += 1
+            observe_task(task.name, perf_counter() - start, "failed")
             
             logger.error(f"Task '{task.name}' failed: {e}")
             
@@ -216,9 +226,12 @@ class UnifiedScheduler:
                 task.enabled = False
                 logger.error(f"Task '{task.name}' disabled after {task.max_errors} errors")
             else:
-                # Retry con backoff exponencial
-                delay = min(task.interval_minutes * (2 ** task.error_count), 60)
-                task.next_run = datetime.now() + timedelta(minutes=delay)
+                # Retry con backoff con jitter (las fallas transitorias de cada
+                # request ya se reintentan en http_pool; esto cubre caídas largas)
+                task.retry_delay_minutes = decorrelated_jitter(
+                    task.retry_delay_minutes, base=task.interval_minutes, cap=60
+                )
+                task.next_run = datetime.now() + timedelta(minutes=task.retry_delay_minutes)
     
     async def _update_bcra_data(self):
         """Tarea principal: actualizar datos del BCRA"""
@@ -251,14 +264,8 @@ class UnifiedScheduler:
             except:
                 self.health.services["bcra_api"] = False
             
-            # Check database
-            try:
-                db = next(get_db())
-                db.execute("SELECT 1")
-                self.health.services["database"] = True
-                db.close()
-            except:
-                self.health.services["database"] = False
+            # Check database (último resultado del sampler de background)
+            self.health.services["database"] = health_monitor.snapshot()["database"].get("healthy", False)
             
             # Determinar estado general
             failed_services = [k for k, v in self.health.services.items() if not v]
@@ -308,27 +315,26 @@ class UnifiedScheduler:
     async def _collect_system_metrics(self):
         """Recolecta métricas del sistema (solo en producción)"""
         try:
-            import psutil
+            # Último snapshot del sampler de background (no bloquea el loop)
+            system = health_monitor.snapshot()["system"]
+            if not system.get("available"):
+                logger.debug("psutil not available, skipping system metrics")
+                return
             
-            # CPU y memoria
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
+            cpu_percent = system["cpu_percent"]
+            memory_percent = system["memory_percent"]
+            disk_percent = system["disk_percent"]
             
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            
-            logger.info(f"System metrics - CPU: {cpu_percent}%, Memory: {memory.percent}%, Disk: {disk.percent}%")
+            logger.info(f"System metrics - CPU: {cpu_percent}%, Memory: {memory_percent}%, Disk: {disk_percent}%")
             
             # Alertas si los recursos están altos
             if cpu_percent > 80:
                 logger.warning(f"High CPU usage: {cpu_percent}%")
-            if memory.percent > 80:
-                logger.warning(f"High memory usage: {memory.percent}%")
-            if disk.percent > 90:
-                logger.warning(f"High disk usage: {disk.percent}%")
+            if memory_percent > 80:
+                logger.warning(f"High memory usage: {memory_percent}%")
+            if disk_percent > 90:
+                logger.warning(f"High disk usage: {disk_percent}%")
                 
-        except ImportError:
-            logger.debug("psutil not available, skipping system metrics")
         except Exception as e:
             logger.error(f"Failed to collect system metrics: {e}")
     
@@ -336,26 +342,14 @@ class UnifiedScheduler:
         """Guarda indicadores en la base de datos"""
         try:
             db = next(get_db())
-            
-            for key, data in indicators.items():
-                # Desactivar indicadores anteriores del mismo tipo
-                db.query(EconomicIndicator).filter(
-                    EconomicIndicator.indicator_type == key,
-                    EconomicIndicator.is_active == True
-                ).update({"is_active": False})
-                
-                # Crear nuevo indicador
-                indicator = EconomicIndicator(
-                    indicator_type=key,
-                    value=data["value"],
-                    source=data["source"],
-                    date=datetime.now(),
-                    is_active=True
-                )
-                db.add(indicator)
-            
-            db.commit()
-            db.close()
+            try:
+                # Desactivar anteriores + insertar nuevos en una transacción
+                ingest_indicators(db, [
+                    {"indicator_type": key, "value": data["value"], "source": data["source"]}
+                    for key, data in indicators.items()
+                ])
+            finally:
+                db.close()
             
         except Exception as e:
             logger.error(f"Failed to save indicators to DB: {e}")
@@ -0,0 +1,257 @@
+# backend/app/services/snapshot_service.py
+"""
+Snapshot materializado de "último valor por indicador".
+
+`economic_indicators` guarda todo el historial; la tabla `current_indicators`
+tiene una fila por indicator_type con el valor vigente. Los caminos de
+escritura (scheduler, refresh, ingestas) llaman a `record_latest` dentro de
+su misma transacción, y los endpoints de lectura consultan el snapshot en
+O(indicadores) en lugar de un GROUP BY sobre O(filas).
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import dialect_insert
+from ..models import CurrentIndicator, EconomicIndicator, HistoricalData
+from ..utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMNS = ("indicator_id", "value", "source", "date", "unit", "label", "category")
+
+# Versión del snapshot (para ETags): se cachea unos segundos por proceso y
+# se invalida en cada escritura local; otros workers la ven al vencer el TTL
+VERSION_TTL = float(os.getenv("SNAPSHOT_VERSION_TTL", "2"))
+_versions = LRUCache(maxsize=512, default_ttl=VERSION_TTL)
+
+
+class SnapshotVersion(NamedTuple):
+    count: int
+    last_id: Optional[int]  # id de ingesta más reciente (crece en cada cambio)
+    updated_at: Optional[datetime]
+
+
+class HistoryVersion(NamedTuple):
+    """High-water mark del historial de un indicador en la base"""
+    historical_count: int
+    historical_last_id: Optional[int]
+    indicators_count: int
+    indicators_last_id: Optional[int]
+
+
+def _snapshot_row(indicator: EconomicIndicator) -> Dict:
+    return {
+        "indicator_type": indicator.indicator_type,
+        "indicator_id": indicator.id,
+        "value": indicator.value,
+        "source": indicator.source,
+        "date": indicator.date,
+        "unit": indicator.unit,
+        "label": indicator.label,
+        "category": indicator.category,
+    }
+
+
+def record_latest(db: Session, indicators: Iterable[EconomicIndicator]) -> int:
+    """
+    Actualizar el snapshot con indicadores recién escritos (sin commit).
+    Solo reemplaza una fila si el valor nuevo no es más viejo que el vigente.
+    """
+    latest: Dict[str, EconomicIndicator] = {}
+    for indicator in indicators:
+        if indicator.date is None or indicator.is_active is False:
+            continue
+        current = latest.get(indicator.indicator_type)
+        if current is None or indicator.date >= current.date:
+            latest[indicator.indicator_type] = indicator
+
+    if not latest:
+        return 0
+
+    db.flush()  # asegura los ids de EconomicIndicator
+    return record_rows(db, [_snapshot_row(indicator) for indicator in latest.values()])
+
+
+def record_rows(db: Session, rows: List[Dict]) -> int:
+    """
+    Variante set-based de `record_latest` para filas ya insertadas en bloque
+    (dicts con las columnas del snapshot, una por indicator_type).
+    """
+    if not rows:
+        return 0
+
+    insert = dialect_insert(db.get_bind().dialect.name)
+    if insert is not None:
+        stmt = insert(CurrentIndicator).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CurrentIndicator.indicator_type],
+            set_={
+                **{column: stmt.excluded[column] for column in SNAPSHOT_COLUMNS},
+                "updated_at": func.now(),  # onupdate no aplica a ON CONFLICT
+            },
+            where=CurrentIndicator.date <= stmt.excluded.date,
+        )
+        db.execute(stmt)
+    else:
+        for row in rows:
+            existing = db.get(CurrentIndicator, row["indicator_type"])
+            if existing is None or existing.date <= row["date"]:
+                db.merge(CurrentIndicator(**row))
+
+    invalidate_versions()
+    return len(rows)
+
+
+def rebuild(db: Session) -> int:
+    """Recalcular el snapshot completo desde economic_indicators (con commit)"""
+    subquery = db.query(
+        EconomicIndicator.indicator_type,
+        func.max(EconomicIndicator.date).label("max_date")
+    ).filter(
+        EconomicIndicator.is_active == True
+    ).group_by(EconomicIndicator.indicator_type).subquery()
+
+    latest = db.query(EconomicIndicator).join(
+        subquery,
+        (EconomicIndicator.indicator_type == subquery.c.indicator_type) &
+        (EconomicIndicator.date == subquery.c.max_date)
+    ).all()
+
+    db.query(CurrentIndicator).delete()
+    count = record_latest(db, latest)
+    db.commit()
+    logger.info(f"📸 Snapshot de indicadores reconstruido ({count} tipos)")
+    return count
+
+
+def ensure_snapshot(db: Session) -> int:
+    """Construir el snapshot si está vacío pero hay historial (bases existentes)"""
+    if db.query(CurrentIndicator.indicator_type).first() is not None:
+        return 0
+    if db.query(EconomicIndicator.id).first() is None:
+        return 0
+    return rebuild(db)
+
+
+# === LECTURAS ===
+# Los statements se arman una vez y se usan tanto con Session como con AsyncSession
+
+def current_statement() -> Select:
+    return select(CurrentIndicator).order_by(CurrentIndicator.indicator_type)
+
+
+def search_statement(
+    q: str,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 20
+) -> Select:
+    """Búsqueda por label o indicator_type sobre el valor vigente"""
+    search_term = f"%{q.lower()}%"
+    stmt = select(CurrentIndicator).where(
+        (func.lower(CurrentIndicator.label).like(search_term)) |
+        (func.lower(CurrentIndicator.indicator_type).like(search_term))
+    )
+
+    if source:
+        stmt = stmt.where(CurrentIndicator.source == source.upper())
+
+    if category:
+        stmt = stmt.where(CurrentIndicator.category == category.lower())
+
+    return stmt.order_by(CurrentIndicator.indicator_type).limit(limit)
+
+
+def get_current(db: Session) -> List[CurrentIndicator]:
+    """Último valor de cada indicador"""
+    return list(db.scalars(current_statement()))
+
+
+def get_one(db: Session, indicator_type: str) -> Optional[CurrentIndicator]:
+    return db.get(CurrentIndicator, indicator_type)
+
+
+def search(
+    db: Session,
+    q: str,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 20
+) -> List[CurrentIndicator]:
+    return list(db.scalars(search_statement(q, source, category, limit)))
+
+
+async def get_current_async(db: AsyncSession) -> List[CurrentIndicator]:
+    return list(await db.scalars(current_statement()))
+
+
+async def get_one_async(db: AsyncSession, indicator_type: str) -> Optional[CurrentIndicator]:
+    return await db.get(CurrentIndicator, indicator_type)
+
+
+async def search_async(
+    db: AsyncSession,
+    q: str,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 20
+) -> List[CurrentIndicator]:
+    return list(await db.scalars(search_statement(q, source, category, limit)))
+
+
+# === VERSIÓN (ETag / Last-Modified) ===
+
+def version_statement(indicator_type: Optional[str] = None) -> Select:
+    stmt = select(
+        func.count(CurrentIndicator.indicator_type),
+        func.max(CurrentIndicator.indicator_id),
+        func.max(CurrentIndicator.updated_at)
+    )
+    if indicator_type is not None:
+        stmt = stmt.where(CurrentIndicator.indicator_type == indicator_type)
+    return stmt
+
+
+async def get_version_async(db: AsyncSession, indicator_type: Optional[str] = None) -> SnapshotVersion:
+    """Versión del snapshot completo o de un indicador (cacheada VERSION_TTL segundos)"""
+    key = indicator_type or "*"
+    version = _versions.get(key)
+    if version is None:
+        version = SnapshotVersion(*(await db.execute(version_statement(indicator_type))).one())
+        _versions.set(key, version)
+    return version
+
+
+def history_version_statement(indicator_type: str) -> Select:
+    """Cantidad e id máximo de filas del indicador en historical_data y economic_indicators"""
+    columns = []
+    for model in (HistoricalData, EconomicIndicator):
+        where = model.indicator_type == indicator_type
+        columns.append(select(func.count(model.id)).where(where).scalar_subquery())
+        columns.append(select(func.max(model.id)).where(where).scalar_subquery())
+    return select(*columns)
+
+
+async def get_history_version_async(db: AsyncSession, indicator_type: str) -> HistoryVersion:
+    """
+    High-water mark del historial (cacheado VERSION_TTL segundos, como la
+    versión del snapshot). Cambia con cualquier escritura a la base,
+    incluidas las que no pasan por la ingesta (scripts, SQL manual).
+    """
+    key = f"history:{indicator_type}"
+    version = _versions.get(key)
+    if version is None:
+        version = HistoryVersion(*(await db.execute(history_version_statement(indicator_type))).one())
+        _versions.set(key, version)
+    return version
+
+
+def invalidate_versions() -> None:
+    _versions.clear()
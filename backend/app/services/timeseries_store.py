@@ -0,0 +1,179 @@
+# backend/app/services/timeseries_store.py
+"""
+Historial de indicadores servido desde el store columnar (utils/timeseries).
+
+- La primera lectura de un indicador hace backfill desde la base
+  (historical_data, o economic_indicators si no hay historial cargado)
+  con una sesión propia: la llamada es single-flight y no puede depender
+  de la sesión del request que la disparó.
+- El backfill guarda en la metadata el high-water mark del historial en la
+  base (`snapshot_service.HistoryVersion`). Cada lectura lo compara con el
+  actual (cacheado unos segundos, como la versión para ETags) y, si la base
+  cambió por cualquier camino (otro worker, scripts, SQL manual), la serie
+  se reconstruye completa.
+- Las ingestas agregan sus puntos a las series que ya existen, agrupados
+  por indicador y fuera del event loop, para que este worker los sirva
+  antes de que venza el high-water mark cacheado. Los puntos de una serie
+  cuyo backfill está en curso quedan pendientes y el backfill los agrega
+  al terminar; si la serie no existe ni se está cargando, el próximo
+  backfill los lee de la base.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import EconomicIndicator, HistoricalData
+from . import snapshot_service
+from ..utils.singleflight import SingleFlight
+from ..utils.timeseries import TimeLike, TimeSeriesStore
+
+logger = logging.getLogger(__name__)
+
+TIMESERIES_DIR = os.getenv("TIMESERIES_DIR", os.path.join("data", "timeseries"))
+
+timeseries_store = TimeSeriesStore(TIMESERIES_DIR)
+_backfills = SingleFlight()
+
+# indicador -> filas ingestadas mientras corría su backfill
+_pending: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
+_pending_lock = threading.Lock()
+# Escrituras lanzadas desde el event loop (referencia para que no las recolecte el GC)
+_writes: Set[asyncio.Task] = set()
+
+
+async def _fetch_history(db: AsyncSession, indicator: str):
+    for model, origin in ((HistoricalData, "historical_data"), (EconomicIndicator, "economic_indicators")):
+        rows = (await db.execute(
+            select(model.date, model.value, model.source).where(
+                model.indicator_type == indicator,
+                model.date.is_not(None)
+            ).order_by(model.date.asc())
+        )).all()
+        if rows:
+            return rows, origin
+    return [], None
+
+
+def _default_session_factory() -> Callable:
+    from ..database import get_async_sessionmaker
+    return get_async_sessionmaker()
+
+
+def _take_pending(indicator: str) -> List[Mapping[str, Any]]:
+    with _pending_lock:
+        return _pending.pop(indicator, [])
+
+
+async def backfill(indicator: str, session_factory: Optional[Callable] = None) -> int:
+    """(Re)construir la serie completa de un indicador desde la base"""
+    async with (session_factory or _default_session_factory())() as db:
+        # El mark se lee antes que las filas: si algo se escribe en el medio,
+        # la próxima lectura ve un mark distinto y vuelve a reconstruir
+        mark = snapshot_service.HistoryVersion(*(await db.execute(
+            snapshot_service.history_version_statement(indicator))).one())
+        rows, origin = await _fetch_history(db, indicator)
+
+    count = 0
+    if rows:
+        count = await asyncio.to_thread(
+            timeseries_store.replace,
+            indicator,
+            [row.date for row in rows],
+            [row.value for row in rows],
+            {"source": rows[-1].source, "origin": origin, "db_mark": list(mark)},
+        )
+        logger.info(f"📈 Serie {indicator}: {count} puntos cargados desde {origin}")
+    elif timeseries_store.has(indicator):
+        await asyncio.to_thread(timeseries_store.delete, indicator)
+
+    # Puntos ingestados después de la lectura de la base
+    while pending := _take_pending(indicator):
+        count = await asyncio.to_thread(_append_rows, indicator, pending)
+    return count
+
+
+async def load_series(
+    indicator: str,
+    start: Optional[TimeLike] = None,
+    end: Optional[TimeLike] = None,
+    session_factory: Optional[Callable] = None
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+    """Timestamps (µs), valores y metadata de la serie en [start, end]"""
+    if not TimeSeriesStore.is_valid_name(indicator):
+        return np.empty(0, np.int64), np.empty(0, np.float64), {}
+
+    session_factory = session_factory or _default_session_factory()
+    async with session_factory() as db:
+        mark = await snapshot_service.get_history_version_async(db, indicator)
+
+    if not timeseries_store.has(indicator) or timeseries_store.get_meta(indicator).get("db_mark") != list(mark):
+        await _backfills.do(indicator, backfill, indicator, session_factory)
+
+    timestamps, values = timeseries_store.range(indicator, start, end)
+    return timestamps, values, timeseries_store.get_meta(indicator)
+
+
+def _append_rows(indicator: str, rows: List[Mapping[str, Any]]) -> int:
+    return timeseries_store.append(
+        indicator,
+        [row["date"] for row in rows],
+        [row["value"] for row in rows],
+        {"source": rows[-1].get("source")},
+    )
+
+
+def _write_batches(batches: Dict[str, List[Mapping[str, Any]]]) -> None:
+    for indicator, rows in batches.items():
+        try:
+            _append_rows(indicator, rows)
+        except Exception as e:
+            logger.warning(f"Could not append {indicator} to time-series store: {e}")
+
+
+def record_points(rows: Iterable[Mapping[str, Any]]) -> int:
+    """
+    Agregar valores recién ingestados al store (una escritura por
+    indicador). Desde el event loop la escritura corre en un thread; desde
+    un thread (BackgroundTasks, scripts) se hace en el momento.
+    """
+    batches: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
+    recorded = 0
+    for row in rows:
+        indicator = row["indicator_type"]
+        if not TimeSeriesStore.is_valid_name(indicator):
+            continue
+        if timeseries_store.has(indicator):
+            batches[indicator].append(row)
+            recorded += 1
+        elif _backfills.is_running(indicator):
+            with _pending_lock:
+                _pending[indicator].append(row)
+            recorded += 1
+
+    if not batches:
+        return recorded
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _write_batches(batches)
+        return recorded
+
+    task = loop.create_task(asyncio.to_thread(_write_batches, dict(batches)))
+    _writes.add(task)
+    task.add_done_callback(_writes.discard)
+    return recorded
+
+
+async def wait_for_writes() -> None:
+    """Esperar las escrituras en background (shutdown, tests)"""
+    if _writes:
+        await asyncio.gather(*list(_writes), return_exceptions=True)
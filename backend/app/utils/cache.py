@@ -0,0 +1,312 @@
+# backend/app/utils/cache.py
+"""
+Cache de dos niveles: LRU en proceso (L1) delante de Redis (L2).
+
+- L1: `LRUCache` acotado en cantidad de entradas, con TTL por clave.
+- L2: `RedisBackend` sobre un cliente `redis.asyncio` (o `fakeredis` en tests).
+- Serialización orjson / msgpack / json para lo que va a Redis.
+
+Los valores de L1 se guardan por referencia: quien los lee no debe mutarlos.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:
+    class RedisError(Exception):
+        """Placeholder cuando redis no está instalado"""
+
+BACKEND_ERRORS = (RedisError, OSError, asyncio.TimeoutError)
+
+
+# ------------------------------------------------------------------------- #
+# L1: LRU en proceso
+# ------------------------------------------------------------------------- #
+@dataclass
+class CacheEntry:
+    """Valor cacheado con sus marcas de tiempo (reloj monotónico)"""
+    value: Any
+    stored_at: float
+    expires_at: float
+
+    def is_expired(self, now: float) -> bool:
+        return now >= self.expires_at
+
+
+class LRUCache:
+    """LRU con tamaño máximo y TTL por clave"""
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float = 300,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_entry(self, key: Hashable, allow_expired: bool = False) -> Optional[CacheEntry]:
+        """Entrada completa; con `allow_expired` devuelve también las vencidas"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.is_expired(self._clock()) and not allow_expired:
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.get_entry(key)
+        return default if entry is None else entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        now = self._clock()
+        ttl = self.default_ttl if ttl is None else ttl
+        self._data[key] = CacheEntry(value=value, stored_at=now, expires_at=now + ttl)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and not entry.is_expired(self._clock())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# ------------------------------------------------------------------------- #
+# Serialización
+# ------------------------------------------------------------------------- #
+def _to_primitive(obj: Any) -> Any:
+    """Fallback para tipos que json/msgpack no saben serializar"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return asdict(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Type {type(obj).__name__} is not serializable")
+
+
+class JSONSerializer:
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=_to_primitive).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=_to_primitive, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer:
+    name = "msgpack"
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=_to_primitive, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def get_serializer(name: str = "orjson"):
+    """Serializador por nombre, con fallback a json si falta la librería"""
+    if name == "msgpack" and msgpack is not None:
+        return MsgpackSerializer()
+    if name in ("orjson", "msgpack") and orjson is not None:
+        return OrjsonSerializer()
+    return JSONSerializer()
+
+
+# ------------------------------------------------------------------------- #
+# L2: Redis
+# ------------------------------------------------------------------------- #
+class RedisBackend:
+    """
+    Backend async sobre `redis.asyncio.Redis`. Acepta cualquier cliente con
+    la misma interfaz (p.ej. `fakeredis.FakeAsyncRedis` en tests).
+    Los errores de conexión se registran y se tratan como miss.
+    """
+
+    def __init__(self, client, prefix: str = "argfy:"):
+        self.client = client
+        self.prefix = prefix
+        self.errors = 0
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}{key}"
+
+    async def get(self, key: Hashable) -> Optional[tuple]:
+        """Devuelve (bytes, ttl_restante_segundos) o None"""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.get(self._key(key))
+                pipe.pttl(self._key(key))
+                data, pttl = await pipe.execute()
+        except BACKEND_ERRORS as e:
+            self.errors += 1
+            logger.warning(f"Redis get failed for {key}: {e}")
+            return None
+        if data is None:
+            return None
+        return data, (pttl / 1000 if pttl and pttl > 0 else None)
+
+    async def set(self, key: Hashable, data: bytes, ttl: float) -> bool:
+        try:
+            await self.client.set(self._key(key), data, px=max(1, int(ttl * 1000)))
+            return True
+        except BACKEND_ERRORS as e:
+            self.errors += 1
+            logger.warning(f"Redis set failed for {key}: {e}")
+            return False
+
+    async def delete(self, key: Hashable) -> bool:
+        try:
+            return bool(await self.client.delete(self._key(key)))
+        except BACKEND_ERRORS as e:
+            self.errors += 1
+            logger.warning(f"Redis delete failed for {key}: {e}")
+            return False
+
+
+# ------------------------------------------------------------------------- #
+# Fachada de dos niveles
+# ------------------------------------------------------------------------- #
+class TwoTierCache:
+    """Lee L1 → L2 → loader; escribe en ambos niveles"""
+
+    def __init__(self, local: Optional[LRUCache] = None,
+                 backend: Optional[RedisBackend] = None,
+                 serializer=None):
+        self.local = local or LRUCache()
+        self.backend = backend
+        self.serializer = serializer or get_serializer()
+        self._flights = SingleFlight()
+        self.l2_hits = 0
+        self.misses = 0
+        self.sets = 0
+
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.local.get_entry(key)
+        if entry is not None:
+            return entry.value
+
+        if self.backend is not None:
+            found = await self.backend.get(key)
+            if found is not None:
+                data, remaining = found
+                try:
+                    value = self.serializer.loads(data)
+                except Exception as e:  # noqa: BLE001 - payload corrupto = miss
+                    logger.warning(f"Cache payload for {key} could not be decoded: {e}")
+                else:
+                    self.l2_hits += 1
+                    self.local.set(key, value, ttl=remaining)
+                    return value
+
+        self.misses += 1
+        return default
+
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.local.default_ttl if ttl is None else ttl
+        self.local.set(key, value, ttl=ttl)
+        self.sets += 1
+        if self.backend is not None:
+            await self.backend.set(key, self.serializer.dumps(value), ttl)
+
+    async def delete(self, key: Hashable) -> None:
+        self.local.delete(key)
+        if self.backend is not None:
+            await self.backend.delete(key)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                          ttl: Optional[float] = None) -> Any:
+        """Valor cacheado o resultado de `loader` (una sola carga concurrente por clave)"""
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        async def load_and_store():
+            result = await loader()
+            if result is not None:
+                await self.set(key, result, ttl=ttl)
+            return result
+
+        return await self._flights.do(key, load_and_store)
+
+    def get_stats(self) -> Dict[str, Any]:
+        local = self.local.get_stats()
+        lookups = local["hits"] + self.l2_hits + self.misses
+        return {
+            "l1": local,
+            "l2": {
+                "enabled": self.backend is not None,
+                "hits": self.l2_hits,
+                "errors": self.backend.errors if self.backend else 0,
+            },
+            "misses": self.misses,
+            "sets": self.sets,
+            "hit_ratio": round((local["hits"] + self.l2_hits) / lookups, 4) if lookups else 0.0,
+            "serializer": self.serializer.name,
+        }
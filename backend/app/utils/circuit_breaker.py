@@ -0,0 +1,145 @@
+# backend/app/utils/circuit_breaker.py
+"""
+Circuit breaker por fuente (closed → open → half-open).
+
+Cada breaker mira las últimas `window` llamadas: si con al menos
+`min_calls` la tasa de errores supera `failure_rate` o la de llamadas
+lentas (≥ `slow_call_seconds`) supera `slow_call_rate`, se abre y rechaza
+todo al instante durante `open_seconds`. Después deja pasar hasta
+`half_open_calls` llamadas de prueba: si salen bien se cierra, si no
+vuelve a abrirse. Los llamadores tratan `CircuitOpenError` como cualquier
+otro error de la fuente y sirven cache/fallback sin esperar el timeout.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """La fuente está cortada; no se hizo la llamada"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit open for {name} (retry in {retry_in:.1f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Breaker de una fuente; sin locks (todo corre en el event loop)"""
+
+    def __init__(self, name: str, window: int = 20, min_calls: int = 5,
+                 failure_rate: float = 0.5, slow_call_seconds: float = 10.0,
+                 slow_call_rate: float = 0.8, open_seconds: float = 30.0,
+                 half_open_calls: int = 1,
+                 on_state_change: Optional[Callable[[str, str, str], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._on_state_change = on_state_change
+        self._clock = clock
+        self._calls: Deque[Tuple[bool, bool]] = deque(maxlen=window)  # (falló, lenta)
+        self.state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        if state == OPEN:
+            self._opened_at = self._clock()
+        if state != CLOSED:
+            self._probes = 0
+        else:
+            self._calls.clear()
+        if self._on_state_change is not None and previous != state:
+            self._on_state_change(self.name, previous, state)
+
+    def retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(self._opened_at + self.open_seconds - self._clock(), 0.0)
+
+    def allow(self) -> bool:
+        """¿Se puede llamar a la fuente? (en half-open reserva un lugar de prueba)"""
+        if self.state == OPEN:
+            if self.retry_in() > 0:
+                self.rejected += 1
+                return False
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self._probes >= self.half_open_calls:
+                self.rejected += 1
+                return False
+            self._probes += 1
+        return True
+
+    def check(self) -> None:
+        """Como `allow()`, pero levanta CircuitOpenError"""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def record(self, success: bool, elapsed: float) -> None:
+        """Resultado de una llamada admitida por `allow()`"""
+        slow = elapsed >= self.slow_call_seconds
+        if self.state == HALF_OPEN:
+            self._transition(CLOSED if success and not slow else OPEN)
+            return
+
+        self._calls.append((not success, slow))
+        if self.state == CLOSED and len(self._calls) >= self.min_calls:
+            failures, slow_calls = self._rates()
+            if failures >= self.failure_rate or slow_calls >= self.slow_call_rate:
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        """Llamada admitida que se canceló sin resultado (libera la prueba)"""
+        if self.state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _rates(self) -> Tuple[float, float]:
+        if not self._calls:
+            return 0.0, 0.0
+        total = len(self._calls)
+        return (sum(failed for failed, _ in self._calls) / total,
+                sum(slow for _, slow in self._calls) / total)
+
+    def snapshot(self) -> Dict[str, Any]:
+        failures, slow_calls = self._rates()
+        return {
+            "state": self.state,
+            "calls": len(self._calls),
+            "failure_rate": round(failures, 3),
+            "slow_call_rate": round(slow_calls, 3),
+            "retry_in_seconds": round(self.retry_in(), 1),
+            "rejected": self.rejected,
+        }
+
+
+class BreakerRegistry:
+    """Un breaker por fuente, creado a demanda con la misma configuración"""
+
+    def __init__(self, **defaults: Any):
+        self._defaults = defaults
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name, **self._defaults)
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())}
+
+    def open_circuits(self) -> List[str]:
+        return [name for name, breaker in self._breakers.items() if breaker.state == OPEN]
@@ -0,0 +1,75 @@
+# backend/app/utils/columnar.py
+"""
+Exports columnares (Parquet / Arrow IPC) con pyarrow.
+
+Las filas llegan en lotes (p.ej. `Result.partitions()`), cada lote se
+transpone a arrays por columna y se escribe como un RecordBatch: nunca se
+arma una lista de dicts por fila. Arrow IPC se escribe sin compresión para
+que pandas/polars lo lean zero-copy; Parquet usa zstd.
+"""
+
+import logging
+from typing import Any, Iterable, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+    logger.warning("pyarrow no instalado, exports parquet/arrow deshabilitados")
+
+# formato -> (media type, extensión)
+COLUMNAR_FORMATS = {
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.file", "arrow"),
+}
+
+PARQUET_COMPRESSION = "zstd"
+
+
+def is_available() -> bool:
+    return pa is not None
+
+
+def schema(fields: Sequence[Tuple[str, str]]):
+    """Schema desde pares (nombre, tipo): string, float64, timestamp"""
+    types = {
+        "string": pa.string(),
+        "float64": pa.float64(),
+        "timestamp": pa.timestamp("us"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in fields])
+
+
+def _record_batch(rows: Sequence[Sequence[Any]], table_schema):
+    columns = list(zip(*rows)) if rows else [()] * len(table_schema)
+    arrays = [pa.array(column, type=field.type) for column, field in zip(columns, table_schema)]
+    return pa.RecordBatch.from_arrays(arrays, schema=table_schema)
+
+
+def write_columnar(batches: Iterable[Sequence[Sequence[Any]]], table_schema, format: str) -> bytes:
+    """Serializar lotes de filas a Parquet o Arrow IPC (formato archivo)"""
+    if not is_available():
+        raise RuntimeError("pyarrow is required for parquet/arrow exports")
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format '{format}'")
+
+    sink = pa.BufferOutputStream()
+    if format == "parquet":
+        writer = pq.ParquetWriter(sink, table_schema, compression=PARQUET_COMPRESSION)
+    else:
+        writer = pa_ipc.new_file(sink, table_schema)
+
+    with writer:
+        wrote = False
+        for rows in batches:
+            if rows:
+                writer.write_batch(_record_batch(rows, table_schema))
+                wrote = True
+        if not wrote:
+            writer.write_batch(_record_batch([], table_schema))
+
+    return sink.getvalue().to_pybytes()
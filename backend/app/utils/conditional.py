@@ -0,0 +1,97 @@
+# backend/app/utils/conditional.py
+"""
+Requests condicionales (ETag / Last-Modified -> 304 Not Modified).
+
+Los endpoints calculan un validador barato (versión de los datos, no el
+body) y, si coincide con `If-None-Match` / `If-Modified-Since`, responden
+304 sin consultar la base ni serializar nada. Para contenido estático
+`PrecomputedResponse` serializa una sola vez y reutiliza body y ETag.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+DEFAULT_CACHE_CONTROL = "no-cache"  # el cliente puede guardar, pero revalida siempre
+
+
+def make_etag(*parts: Any) -> str:
+    """ETag fuerte a partir de la versión de los datos (cualquier valor serializable)"""
+    payload = json.dumps(parts, default=str, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return '"' + hashlib.blake2b(payload, digest_size=16).hexdigest() + '"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Los datetimes naive de la base se interpretan como UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def http_date(value: datetime) -> str:
+    return format_datetime(_as_utc(value), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match usa comparación débil: W/"x" equivale a "x"
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(headers: Mapping[str, str], etag: Optional[str],
+                    last_modified: Optional[datetime] = None) -> bool:
+    """RFC 9110: If-None-Match tiene prioridad sobre If-Modified-Since"""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP-date tiene resolución de segundos
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+    return False
+
+
+def validator_headers(etag: Optional[str], last_modified: Optional[datetime] = None,
+                      cache_control: str = DEFAULT_CACHE_CONTROL) -> Dict[str, str]:
+    headers = {"Cache-Control": cache_control}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(etag: Optional[str], last_modified: Optional[datetime] = None,
+                 cache_control: str = DEFAULT_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified, cache_control))
+
+
+class PrecomputedResponse:
+    """Body JSON y ETag calculados una vez (config estática)"""
+
+    def __init__(self, content: Any, cache_control: str = "public, max-age=3600"):
+        self.body = JSONResponse(content).body
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=16).hexdigest() + '"'
+        self.last_modified = datetime.now(timezone.utc)
+        self.cache_control = cache_control
+
+    def respond(self, request: Request) -> Response:
+        if is_not_modified(request.headers, self.etag, self.last_modified):
+            return not_modified(self.etag, self.last_modified, self.cache_control)
+        return Response(
+            content=self.body,
+            media_type="application/json",
+            headers=validator_headers(self.etag, self.last_modified, self.cache_control)
+        )
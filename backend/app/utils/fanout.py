@@ -0,0 +1,129 @@
+# backend/app/utils/fanout.py
+"""
+Fan-out concurrente a varias fuentes con deadlines.
+
+Todas las llamadas arrancan a la vez (o de a `concurrency`); cada una
+tiene su propio deadline (acotado por lo que queda del presupuesto total
+de la respuesta) y las que no llegan a tiempo se cancelan. El resultado
+siempre trae una entrada por fuente con su estado, así el llamador puede
+devolver resultados parciales en lugar de fallar o esperar la suma de
+todos los timeouts.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+class SourceOutcome(NamedTuple):
+    status: str  # ok | timeout | error
+    value: Any
+    elapsed_ms: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OK
+
+
+async def fan_out(
+    calls: Mapping[str, Callable[[], Awaitable[Any]]],
+    budget: float,
+    deadlines: Optional[Mapping[str, float]] = None,
+    default_deadline: Optional[float] = None,
+    concurrency: Optional[int] = None
+) -> Dict[str, SourceOutcome]:
+    """
+    Ejecutar `calls` (nombre → función async sin argumentos) en paralelo.
+    Tarda a lo sumo `budget` segundos; `deadlines` (o `default_deadline`)
+    acota cada fuente y `concurrency` limita las llamadas simultáneas.
+    """
+    deadlines = deadlines or {}
+    start = time.perf_counter()
+    semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+    def elapsed_ms() -> float:
+        return round((time.perf_counter() - start) * 1000, 1)
+
+    async def call_with_deadline(name: str, call: Callable[[], Awaitable[Any]]) -> SourceOutcome:
+        deadline = deadlines.get(name, default_deadline or budget)
+        remaining = budget - (time.perf_counter() - start)
+        timeout = min(deadline, remaining)
+        try:
+            value = await asyncio.wait_for(call(), max(timeout, 0))
+        except asyncio.TimeoutError:
+            return SourceOutcome(TIMEOUT, None, elapsed_ms(), f"deadline {timeout:.3g}s exceeded")
+        except Exception as e:
+            return SourceOutcome(ERROR, None, elapsed_ms(), str(e) or type(e).__name__)
+        return SourceOutcome(OK, value, elapsed_ms())
+
+    async def run(name: str, call: Callable[[], Awaitable[Any]]) -> SourceOutcome:
+        if semaphore is None:
+            return await call_with_deadline(name, call)
+        async with semaphore:
+            return await call_with_deadline(name, call)
+
+    tasks = {name: asyncio.ensure_future(run(name, call)) for name, call in calls.items()}
+    if not tasks:
+        return {}
+
+    # Red de seguridad: una fuente que ignora la cancelación no retiene la respuesta
+    await asyncio.wait(tasks.values(), timeout=budget)
+
+    outcomes = {}
+    for name, task in tasks.items():
+        if task.done():
+            outcomes[name] = task.result()
+        else:
+            task.cancel()
+            outcomes[name] = SourceOutcome(TIMEOUT, None, elapsed_ms(), f"budget {budget:g}s exceeded")
+    return outcomes
+
+
+def status_map(outcomes: Mapping[str, SourceOutcome]) -> Dict[str, Dict[str, Any]]:
+    """Estado por fuente para incluir en respuestas JSON"""
+    return {
+        name: {
+            "status": outcome.status,
+            "elapsed_ms": outcome.elapsed_ms,
+            **({"error": outcome.error} if outcome.error else {}),
+        }
+        for name, outcome in outcomes.items()
+    }
+
+
+class Collected(NamedTuple):
+    """Valores de un fan-out (aplanados) junto con el estado por fuente"""
+    values: Tuple[Any, ...]
+    source_status: Dict[str, Dict[str, Any]]
+
+    @property
+    def partial(self) -> bool:
+        return any(status["status"] != OK for status in self.source_status.values())
+
+
+async def collect(
+    calls: Mapping[str, Callable[[], Awaitable[Any]]],
+    budget: float,
+    deadlines: Optional[Mapping[str, float]] = None
+) -> Collected:
+    """
+    `fan_out` que junta los valores de las fuentes exitosas (listas se
+    aplanan, None se descarta) y agrega la cantidad aportada por cada una
+    al estado. El estado viaja con el resultado: con single-flight cada
+    caller coalescido recibe el mismo `Collected`, no un atributo de otra
+    instancia.
+    """
+    outcomes = await fan_out(calls, budget=budget, deadlines=deadlines)
+    values = []
+    source_status = status_map(outcomes)
+    for name, outcome in outcomes.items():
+        items = outcome.value if isinstance(outcome.value, list) else [outcome.value]
+        items = [item for item in items if item is not None] if outcome.ok else []
+        values.extend(items)
+        source_status[name]["indicators"] = len(items)
+    return Collected(tuple(values), source_status)
@@ -0,0 +1,126 @@
+# backend/app/utils/hedging.py
+"""
+Requests "hedged" sobre fuentes redundantes.
+
+Se dispara la fuente preferida y, si no respondió dentro de su p90 de
+latencia observado, se dispara también la siguiente; gana la primera
+respuesta válida y el resto se cancela. Si una fuente falla (o responde
+algo inválido) la siguiente arranca de inmediato, sin esperar el delay.
+Las fuentes canceladas también alimentan el tracker (muestra censurada:
+su latencia real es al menos lo que llevaban esperando), para que una
+fuente que siempre pierde por lenta no conserve un p90 viejo y optimista.
+Así una fuente colgada cuesta ~p90 en lugar del timeout completo, con un
+costo extra de ~10% de requests duplicados.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Sequence, Tuple
+
+
+class LatencyTracker:
+    """Ventana deslizante de latencias por fuente para calcular el delay de hedge"""
+
+    def __init__(self, window: int = 200, quantile: float = 0.9, default: float = 1.0,
+                 floor: float = 0.05, ceiling: float = 5.0, min_samples: int = 10):
+        self.window = window
+        self.quantile = quantile
+        self.default = default
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._cancelled: Dict[str, int] = {}
+
+    def observe(self, source: str, seconds: float) -> None:
+        samples = self._samples.get(source)
+        if samples is None:
+            samples = self._samples[source] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def censor(self, source: str, seconds: float) -> None:
+        """
+        Llamada cancelada tras `seconds` (cota inferior de su latencia). Solo
+        se registra si ya superaba el delay actual: una cota menor no aporta
+        información y sesgaría el p90 hacia abajo.
+        """
+        self._cancelled[source] = self._cancelled.get(source, 0) + 1
+        if seconds >= self.delay(source):
+            self.observe(source, seconds)
+
+    def percentile(self, source: str, q: Optional[float] = None) -> Optional[float]:
+        samples = self._samples.get(source)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int((q if q is not None else self.quantile) * len(ordered)))
+        return ordered[index]
+
+    def delay(self, source: str) -> float:
+        """Cuánto esperar a `source` antes de disparar la siguiente"""
+        samples = self._samples.get(source)
+        if samples is None or len(samples) < self.min_samples:
+            return self.default
+        return min(max(self.percentile(source), self.floor), self.ceiling)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            source: {
+                "samples": len(samples),
+                "p50_ms": round(self.percentile(source, 0.5) * 1000, 1),
+                "p90_ms": round(self.percentile(source, 0.9) * 1000, 1),
+                "hedge_delay_ms": round(self.delay(source) * 1000, 1),
+                "cancelled": self._cancelled.get(source, 0),
+            }
+            for source, samples in self._samples.items() if samples
+        }
+
+
+async def hedged(
+    calls: Sequence[Tuple[str, Callable[[], Awaitable[Any]]]],
+    tracker: LatencyTracker,
+    is_valid: Callable[[Any], bool] = bool
+) -> Optional[Tuple[str, Any]]:
+    """
+    Ejecutar `calls` (nombre, función async) en orden de preferencia con
+    hedging. Devuelve (nombre, resultado) de la primera respuesta válida o
+    None si todas fallan. Las respuestas válidas alimentan `tracker` y las
+    llamadas canceladas entran como muestras censuradas.
+    """
+    queue = list(calls)
+    pending: Dict[asyncio.Future, Tuple[str, float]] = {}
+    hedge_at = 0.0
+
+    def launch() -> None:
+        nonlocal hedge_at
+        name, call = queue.pop(0)
+        started = time.perf_counter()
+        pending[asyncio.ensure_future(call())] = (name, started)
+        hedge_at = started + tracker.delay(name)
+
+    try:
+        launch()
+        while pending:
+            timeout = max(hedge_at - time.perf_counter(), 0) if queue else None
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                launch()  # la fuente en curso superó su p90
+                continue
+
+            failed = False
+            for task in done:
+                name, started = pending.pop(task)
+                if task.exception() is None and is_valid(task.result()):
+                    tracker.observe(name, time.perf_counter() - started)
+                    return name, task.result()
+                failed = True
+
+            if failed and queue:
+                launch()
+        return None
+    finally:
+        now = time.perf_counter()
+        for task, (name, started) in pending.items():
+            task.cancel()
+            tracker.censor(name, now - started)
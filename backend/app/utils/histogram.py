@@ -0,0 +1,50 @@
+# backend/app/utils/histogram.py
+"""
+Histograma de latencias con buckets fijos.
+
+Los conteos por bucket son aditivos (se suman entre minutos, horas o
+procesos), así que los percentiles de cualquier ventana salen de sumar
+histogramas pre-agregados sin volver a leer latencias individuales.
+"""
+
+from bisect import bisect_left
+from typing import List, Sequence
+
+# Límite superior (inclusive) de cada bucket en ms; el último bucket es +inf
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+BUCKET_COLUMNS = tuple(f"h_{bound}" for bound in LATENCY_BUCKETS_MS) + ("h_inf",)
+
+
+def bucket_index(latency_ms: float) -> int:
+    return bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+
+
+def observe(counts: List[int], latency_ms: float) -> None:
+    counts[bucket_index(latency_ms)] += 1
+
+
+def empty() -> List[int]:
+    return [0] * len(BUCKET_COLUMNS)
+
+
+def percentile(counts: Sequence[int], q: float) -> float:
+    """
+    Percentil `q` (0-100) estimado con interpolación lineal dentro del
+    bucket. Si cae en el bucket +inf devuelve el último límite finito.
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+
+    rank = q / 100 * total
+    cumulative = 0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            if index >= len(LATENCY_BUCKETS_MS):
+                return float(LATENCY_BUCKETS_MS[-1])
+            lower = LATENCY_BUCKETS_MS[index - 1] if index else 0
+            upper = LATENCY_BUCKETS_MS[index]
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+    return float(LATENCY_BUCKETS_MS[-1])
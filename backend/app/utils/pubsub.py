@@ -0,0 +1,119 @@
+# backend/app/utils/pubsub.py
+"""
+Pub/sub en proceso para empujar actualizaciones a clientes (SSE / WebSocket).
+
+Cada suscriptor tiene una cola acotada: `publish` nunca bloquea y un
+cliente lento pierde los mensajes más viejos en lugar de frenar al resto.
+Un update se serializa una sola vez y se reparte a todos los suscriptores
+de su tópico (fan-out), en vez de N clientes haciendo polling.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+ALL_TOPICS = "*"
+
+
+class Subscription:
+    """Cola de mensajes de un cliente suscripto a un conjunto de tópicos"""
+
+    def __init__(self, broadcaster: "Broadcaster", topics: Iterable[str], maxsize: int):
+        self._broadcaster = broadcaster
+        self.topics: Set[str] = set(topics) or {ALL_TOPICS}
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = asyncio.get_running_loop()
+        self.dropped = 0
+
+    def wants(self, topic: str) -> bool:
+        return ALL_TOPICS in self.topics or topic in self.topics
+
+    def offer(self, message: Any) -> None:
+        """Encolar sin bloquear; si la cola está llena se descarta el más viejo"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout: Optional[float] = None) -> Any:
+        """Próximo mensaje; None si vence el timeout (para heartbeats)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def update_topics(self, subscribe: Iterable[str] = (), unsubscribe: Iterable[str] = ()) -> None:
+        subscribe = set(subscribe)
+        # Suscribirse a tópicos concretos reemplaza el "todos" inicial
+        topics = self.topics - {ALL_TOPICS} if subscribe else self.topics
+        self.topics = (topics | subscribe) - set(unsubscribe)
+
+    def close(self) -> None:
+        self._broadcaster.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Broadcaster:
+    """Registro de suscripciones y fan-out de mensajes por tópico"""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+
+    def subscribe(self, topics: Iterable[str] = ()) -> Subscription:
+        subscription = Subscription(self, topics, self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, topic: str, message: Any) -> int:
+        """
+        Entregar `message` a los suscriptores de `topic`. Se puede llamar
+        desde cualquier thread: la entrega corre en el loop de cada cliente.
+        """
+        self.published += 1
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.wants(topic)]
+
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        for subscription in targets:
+            if subscription.loop is current_loop:
+                subscription.offer(message)
+            elif not subscription.loop.is_closed():
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+        self.delivered += len(targets)
+        return len(targets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        topics: Dict[str, int] = {}
+        for subscription in subscriptions:
+            for topic in subscription.topics:
+                topics[topic] = topics.get(topic, 0) + 1
+        return {
+            "subscribers": len(subscriptions),
+            "topics": topics,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": sum(s.dropped for s in subscriptions),
+        }
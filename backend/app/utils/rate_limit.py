@@ -0,0 +1,165 @@
+# backend/app/utils/rate_limit.py
+"""
+Limitadores de requests con la misma interfaz (`await limiter.hit(key, quota)`):
+
+- `TokenBucketLimiter`: en proceso, O(1) por request, para un solo nodo.
+  Cada clave tiene un bucket de `limit` tokens que se recarga a
+  `limit / window` tokens por segundo (permite ráfagas hasta `limit`).
+- `RedisSlidingWindowLimiter`: ventana deslizante en Redis con un script
+  Lua atómico (un round-trip), compartida entre workers. Si Redis falla
+  el request se deja pasar (fail-open) y se cuenta el error.
+"""
+
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, NamedTuple
+
+from .cache import BACKEND_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Quota:
+    """`limit` requests cada `window` segundos"""
+    limit: int
+    window: float = 60.0
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.window
+
+    @property
+    def policy(self) -> str:
+        """Valor de RateLimit-Policy, p.ej. '60;w=60'"""
+        return f"{self.limit};w={int(self.window)}"
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float  # segundos hasta tener la cuota completa de nuevo
+    retry_after: float  # segundos hasta poder hacer el próximo request (0 si allowed)
+
+
+class TokenBucketLimiter:
+    """Token bucket por clave en memoria"""
+
+    def __init__(self, maxsize: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        # clave -> [tokens, último refill]
+        self._buckets: Dict[Hashable, List[float]] = {}
+        self.allowed = 0
+        self.rejected = 0
+
+    async def hit(self, key: Hashable, quota: Quota) -> RateLimitResult:
+        return self.hit_sync(key, quota)
+
+    def hit_sync(self, key: Hashable, quota: Quota) -> RateLimitResult:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.maxsize:
+                self._prune(now, quota)
+            bucket = self._buckets[key] = [float(quota.limit), now]
+        else:
+            tokens = bucket[0] + (now - bucket[1]) * quota.rate
+            bucket[0] = quota.limit if tokens > quota.limit else tokens
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed += 1
+            retry_after = 0.0
+            allowed = True
+        else:
+            self.rejected += 1
+            retry_after = (1 - bucket[0]) / quota.rate
+            allowed = False
+
+        return RateLimitResult(
+            allowed=allowed,
+            limit=quota.limit,
+            remaining=int(bucket[0]),
+            reset_after=(quota.limit - bucket[0]) / quota.rate,
+            retry_after=retry_after,
+        )
+
+    def _prune(self, now: float, quota: Quota) -> None:
+        """Descartar buckets ya llenos (inactivos); si no alcanza, los más viejos"""
+        idle = [key for key, (_, last) in self._buckets.items() if now - last >= quota.window]
+        for key in idle:
+            del self._buckets[key]
+        if len(self._buckets) >= self.maxsize:
+            for key in list(self._buckets)[: len(self._buckets) - self.maxsize + 1]:
+                del self._buckets[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"backend": "memory", "keys": len(self._buckets), "allowed": self.allowed, "rejected": self.rejected}
+
+
+# KEYS[1] = clave; ARGV = ahora (ms), ventana (ms), límite, id único del request
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+local reset = 0
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    if count == 0 then
+        reset = window
+    end
+    return {1, limit - count - 1, reset}
+end
+return {0, 0, reset}
+"""
+
+
+class RedisSlidingWindowLimiter:
+    """Ventana deslizante compartida entre workers (sorted set por clave)"""
+
+    def __init__(self, client, prefix: str = "argfy:ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(SLIDING_WINDOW_LUA)
+        self.allowed = 0
+        self.rejected = 0
+        self.errors = 0
+
+    async def hit(self, key: Hashable, quota: Quota) -> RateLimitResult:
+        now_ms = int(time.time() * 1000)
+        window_ms = int(quota.window * 1000)
+        try:
+            allowed, remaining, reset_ms = await self._script(
+                keys=[f"{self.prefix}{key}"],
+                args=[now_ms, window_ms, quota.limit, f"{now_ms}-{uuid.uuid4().hex}"],
+            )
+        except BACKEND_ERRORS as e:
+            self.errors += 1
+            logger.warning(f"Redis rate limit failed for {key}: {e}")
+            return RateLimitResult(True, quota.limit, quota.limit, 0.0, 0.0)
+
+        reset_after = max(0, int(reset_ms)) / 1000
+        if allowed:
+            self.allowed += 1
+            return RateLimitResult(True, quota.limit, int(remaining), reset_after, 0.0)
+        self.rejected += 1
+        return RateLimitResult(False, quota.limit, 0, reset_after, reset_after)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"backend": "redis", "allowed": self.allowed, "rejected": self.rejected, "errors": self.errors}
+
@@ -0,0 +1,122 @@
+# backend/app/utils/resampling.py
+"""
+Agregación y downsampling vectorizados para series temporales.
+
+Trabaja sobre los arrays del store columnar (timestamps int64 en µs,
+valores float64, ordenados por timestamp):
+
+- `resample`: agrupa en buckets daily/weekly/monthly y calcula OHLC,
+  promedio o último valor con `np.*.reduceat` (sin loop por punto).
+- `lttb_indices`: Largest-Triangle-Three-Buckets, elige `max_points`
+  puntos que preservan la forma visual de la serie para gráficos.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+PERIODS = ("raw", "daily", "weekly", "monthly")
+AGGREGATIONS = ("ohlc", "mean", "last")
+
+_US_PER_DAY = 86_400_000_000
+_EPOCH_MONDAY = 4  # 1970-01-05 fue lunes (día 4 desde epoch)
+
+
+def bucket_keys(timestamps: np.ndarray, period: str) -> np.ndarray:
+    """Inicio del bucket (µs) al que pertenece cada timestamp"""
+    if period == "raw":
+        return timestamps
+    if period == "daily":
+        return (timestamps // _US_PER_DAY) * _US_PER_DAY
+    if period == "weekly":
+        days = timestamps // _US_PER_DAY
+        return (((days - _EPOCH_MONDAY) // 7) * 7 + _EPOCH_MONDAY) * _US_PER_DAY
+    if period == "monthly":
+        months = timestamps.astype("datetime64[us]").astype("datetime64[M]")
+        return months.astype("datetime64[us]").astype(np.int64)
+    raise ValueError(f"Unknown period '{period}', expected one of {PERIODS}")
+
+
+def resample(timestamps: np.ndarray, values: np.ndarray, period: str = "daily",
+             how: str = "last") -> Dict[str, np.ndarray]:
+    """
+    Agregar por período. Devuelve arrays alineados: `timestamp` (inicio del
+    bucket), `value` y, con how="ohlc", `open`/`high`/`low`/`close`/`count`.
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation '{how}', expected one of {AGGREGATIONS}")
+
+    keys = bucket_keys(timestamps, period)
+    if len(keys) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        result = {"timestamp": np.empty(0, dtype=np.int64), "value": empty}
+        if how == "ohlc":
+            result.update(open=empty, high=empty, low=empty, close=empty, count=np.empty(0, dtype=np.int64))
+        return result
+
+    values = np.asarray(values, dtype=np.float64)
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(keys)]))
+    counts = ends - starts
+
+    close = values[ends - 1]
+    result = {"timestamp": keys[starts]}
+
+    if how == "last":
+        result["value"] = close
+    elif how == "mean":
+        result["value"] = np.add.reduceat(values, starts) / counts
+    else:
+        result.update(
+            open=values[starts],
+            high=np.maximum.reduceat(values, starts),
+            low=np.minimum.reduceat(values, starts),
+            close=close,
+            count=counts,
+            value=close,
+        )
+    return result
+
+
+def lttb_indices(timestamps: np.ndarray, values: np.ndarray, max_points: int) -> np.ndarray:
+    """Índices de los puntos que conserva LTTB (siempre incluye primero y último)"""
+    n = len(values)
+    if max_points >= n or n <= 2:
+        return np.arange(n)
+    if max_points < 3:
+        raise ValueError("max_points must be at least 3")
+
+    x = np.asarray(timestamps, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+
+    # Buckets internos (sin el primer y último punto)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # Promedio del bucket siguiente (o el último punto)
+        next_start, next_end = end, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Área del triángulo (a, candidato, promedio siguiente)
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def downsample(series: Dict[str, np.ndarray], max_points: int) -> Dict[str, np.ndarray]:
+    """Aplicar LTTB sobre `value` y recortar todas las columnas con los mismos índices"""
+    indices = lttb_indices(series["timestamp"], series["value"], max_points)
+    if len(indices) == len(series["value"]):
+        return series
+    return {name: column[indices] for name, column in series.items()}
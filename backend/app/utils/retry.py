@@ -0,0 +1,107 @@
+# backend/app/utils/retry.py
+"""
+Política de reintentos compartida para GETs idempotentes.
+
+- Backoff con "decorrelated jitter": cada espera es aleatoria entre `base`
+  y 3× la anterior (acotada a `cap`), así los clientes que fallaron juntos
+  no reintentan sincronizados.
+- Se respeta `Retry-After` (segundos o fecha HTTP); si pide esperar más de
+  `max_retry_after` no se reintenta.
+- Presupuesto global de reintentos: cada request original deposita `ratio`
+  tokens y cada reintento consume uno, de modo que durante una caída los
+  reintentos suman a lo sumo ~`ratio` de carga extra (más `max_tokens`
+  de reserva para tráfico bajo) en lugar de multiplicarla.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Optional
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    """Próxima espera a partir de la anterior (0 en el primer reintento)"""
+    return min(cap, random.uniform(base, max(previous, base) * 3))
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Segundos pedidos por un header Retry-After (None si falta o es inválido)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max((moment - (now or datetime.now(timezone.utc))).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """Token bucket: reintentos ≤ `ratio` × requests + `max_tokens`"""
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        """Un request original (no reintento)"""
+        self.requests += 1
+        # round: 10 × 0.1 tiene que dar un token entero
+        self._tokens = min(round(self._tokens + self.ratio, 6), self.max_tokens)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            self.exhausted += 1
+            return False
+        self._tokens -= 1
+        self.retries += 1
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "exhausted": self.exhausted,
+            "tokens": round(self._tokens, 2),
+        }
+
+
+class RetryPolicy:
+    """Cuántas veces y cuánto esperar; `delay()` devuelve None si no hay que reintentar"""
+
+    def __init__(self, max_attempts: int = 3, base: float = 0.2, cap: float = 5.0,
+                 max_retry_after: float = 10.0, budget: Optional[RetryBudget] = None,
+                 retry_statuses: FrozenSet[int] = RETRY_STATUSES):
+        self.max_attempts = max_attempts
+        self.base = base
+        self.cap = cap
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self.retry_statuses = retry_statuses
+
+    def delay(self, attempt: int, previous: float, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Espera antes del intento `attempt + 1` (`attempt` = intentos hechos),
+        o None si se agotaron los intentos o el presupuesto.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            wait = retry_after
+        else:
+            wait = decorrelated_jitter(previous, self.base, self.cap)
+        if not self.budget.withdraw():
+            return None
+        return wait
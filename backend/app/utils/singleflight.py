@@ -0,0 +1,106 @@
+# backend/app/utils/singleflight.py
+"""
+Coalescing de requests concurrentes ("single-flight").
+
+Cuando N corrutinas piden la misma clave al mismo tiempo, solo la primera
+ejecuta la llamada upstream; el resto espera ese mismo resultado. La llamada
+corre en una task propia, así que si el request que la disparó se cancela
+(cliente desconectado) los demás siguen recibiendo la respuesta.
+
+Cada caller recibe su propia copia (deepcopy) del resultado: los servicios
+devuelven dicts/listas que los routers modifican, y sin copia un caller
+alteraría la respuesta de los demás.
+"""
+
+import asyncio
+import copy
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Grupo de llamadas en vuelo indexadas por clave"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Ejecutar `func` una sola vez por clave mientras haya una llamada en vuelo"""
+        task = self._inflight.get(key)
+
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Coalesced call for {key!r}")
+
+        # shield: cancelar a un solo caller no cancela la llamada compartida
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def in_flight(self) -> int:
+        """Cantidad de claves con una llamada en curso"""
+        return len(self._inflight)
+
+    def is_running(self, key: Hashable) -> bool:
+        """¿Hay una llamada en curso para `key`?"""
+        return key in self._inflight
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Evitar el warning "exception was never retrieved" si nadie esperó
+        if not task.cancelled():
+            task.exception()
+
+
+# Grupo compartido por los servicios de datos
+upstream_flights = SingleFlight()
+
+
+def _make_key(func: Callable, args: tuple, kwargs: dict) -> Optional[Hashable]:
+    key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def singleflight(func: Optional[Callable] = None, *, group: Optional[SingleFlight] = None):
+    """
+    Decorador para métodos async de servicios.
+
+    La clave se arma con el nombre del método y sus argumentos, ignorando
+    `self`: dos instancias del mismo servicio (los routers crean una por
+    request) comparten la llamada upstream.
+    """
+
+    def decorator(method: Callable[..., Awaitable[Any]]):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            flights = group or upstream_flights
+            key = _make_key(method, args, kwargs)
+            if key is None:
+                return await method(self, *args, **kwargs)
+            return await flights.do(key, method, self, *args, **kwargs)
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -0,0 +1,119 @@
+# backend/app/utils/streaming.py
+"""
+Serialización incremental para exports grandes.
+
+Los generadores reciben lotes de filas (p.ej. `Result.partitions()` con
+`yield_per`) y emiten un chunk de bytes por lote, así la memoria queda
+acotada al tamaño de un lote sin importar cuántas filas tenga el export.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+GZIP_WBITS = 16 + zlib.MAX_WBITS  # header/trailer gzip
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def csv_chunks(batches: Iterable[Sequence[Sequence[Any]]], columns: Sequence[str]) -> Iterator[bytes]:
+    """CSV con header; un chunk por lote (con quoting correcto vía csv.writer)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+
+    for batch in batches:
+        writer.writerows([_jsonable(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Export vacío: igual se emite el header
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def ndjson_chunks(batches: Iterable[Sequence[Sequence[Any]]], columns: Sequence[str]) -> Iterator[bytes]:
+    """Un objeto JSON por línea; un chunk por lote"""
+    for batch in batches:
+        lines = [
+            json.dumps({column: _jsonable(value) for column, value in zip(columns, row)}, ensure_ascii=False)
+            for row in batch
+        ]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def json_chunks(
+    batches: Iterable[Sequence[Sequence[Any]]],
+    columns: Sequence[str],
+    envelope: Optional[Dict[str, Any]] = None
+) -> Iterator[bytes]:
+    """
+    Documento JSON `{**envelope, "data": [...], "count": n}` emitido por
+    lotes; `count` va al final porque recién se conoce al terminar.
+    """
+    head = json.dumps(envelope or {}, ensure_ascii=False)[:-1]
+    yield (head + (", " if envelope else "") + '"data": [').encode("utf-8")
+
+    count = 0
+    for batch in batches:
+        items = [
+            json.dumps({column: _jsonable(value) for column, value in zip(columns, row)}, ensure_ascii=False)
+            for row in batch
+        ]
+        if items:
+            yield (("" if count == 0 else ", ") + ", ".join(items)).encode("utf-8")
+            count += len(items)
+
+    yield f'], "count": {count}}}'.encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Comprimir un stream de bytes al vuelo (sin acumular el cuerpo completo)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def negotiate_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """
+    Elegir el encoding según Accept-Encoding (q-values, `*` y q=0).
+    Ante empate gana el primero de `available` (orden de preferencia).
+    """
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """True si el header Accept-Encoding admite gzip (respetando q=0)"""
+    return negotiate_encoding(accept_encoding, ("gzip",)) == "gzip"
@@ -0,0 +1,152 @@
+# backend/app/utils/swr.py
+"""
+Stale-while-revalidate para valores de fuentes externas.
+
+Cada valor guardado tiene dos límites de edad:
+- soft_ttl: hasta acá el valor es "fresco" y se sirve sin más.
+- hard_ttl: entre soft y hard se sirve el último valor bueno marcado como
+  `stale` y se dispara un refresh en background. Pasado hard_ttl el valor
+  ya no se sirve y el request espera la carga.
+
+Solo se guardan resultados válidos (`is_valid`), así un fallback demo nunca
+pisa el último dato real.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Union
+
+from .cache import LRUCache
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    """Límites de edad (segundos) para servir un valor"""
+    soft_ttl: float
+    hard_ttl: float
+
+    @classmethod
+    def coerce(cls, policy: Union["FreshnessPolicy", Mapping[str, float]]) -> "FreshnessPolicy":
+        if isinstance(policy, cls):
+            return policy
+        return cls(soft_ttl=policy["soft_ttl"], hard_ttl=policy["hard_ttl"])
+
+
+@dataclass
+class SWRResult:
+    """Valor servido con su edad y si está vencido"""
+    value: Any
+    age: float
+    stale: bool
+    cached: bool
+
+
+class StaleWhileRevalidate:
+    """Store de valores con refresh en background"""
+
+    def __init__(self, store: Optional[LRUCache] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.store = store or LRUCache(maxsize=512, clock=clock)
+        self._flights = SingleFlight()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self.stale_served = 0
+        self.refreshes = 0
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                  policy: Union[FreshnessPolicy, Mapping[str, float]],
+                  is_valid: Optional[Callable[[Any], bool]] = None) -> SWRResult:
+        policy = FreshnessPolicy.coerce(policy)
+        entry = self.store.get_entry(key)  # pasado hard_ttl la entrada ya no existe
+
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age <= policy.soft_ttl:
+                return SWRResult(entry.value, age, stale=False, cached=True)
+
+            self.stale_served += 1
+            self._refresh_in_background(key, loader, policy, is_valid)
+            return SWRResult(entry.value, age, stale=True, cached=True)
+
+        value = await self._load(key, loader, policy, is_valid)
+        return SWRResult(value, 0.0, stale=False, cached=False)
+
+    async def _load(self, key, loader, policy: FreshnessPolicy, is_valid) -> Any:
+        async def load_and_store():
+            value = await loader()
+            if is_valid is None or is_valid(value):
+                self.store.set(key, value, ttl=policy.hard_ttl)
+            return value
+
+        return await self._flights.do(key, load_and_store)
+
+    def _refresh_in_background(self, key, loader, policy, is_valid) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self._load(key, loader, policy, is_valid)
+            except Exception as e:  # noqa: BLE001 - se sigue sirviendo el valor anterior
+                logger.warning(f"Background refresh failed for {key}: {e}")
+
+        self.refreshes += 1
+        task = asyncio.ensure_future(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda t, k=key: self._refreshing.pop(k, None))
+
+    def is_refreshing(self, key: Hashable) -> bool:
+        return key in self._refreshing
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self.store),
+            "stale_served": self.stale_served,
+            "background_refreshes": self.refreshes,
+            "refreshing": len(self._refreshing),
+        }
+
+
+# Store compartido por los servicios de datos
+swr_store = StaleWhileRevalidate()
+
+
+def annotate_dict(value: Any, result: SWRResult) -> Any:
+    """Agrega edad y flag `stale` a resultados tipo dict"""
+    if isinstance(value, dict):
+        return {**value, "age_seconds": round(result.age, 1), "stale": result.stale}
+    return value
+
+
+def stale_while_revalidate(key: str,
+                           policy: Union[FreshnessPolicy, Mapping[str, float]],
+                           is_valid: Optional[Callable[[Any], bool]] = None,
+                           annotate: Optional[Callable[[Any, SWRResult], Any]] = annotate_dict,
+                           store: Optional[StaleWhileRevalidate] = None):
+    """
+    Decorador para métodos async de servicios. La clave final incluye los
+    argumentos del método, así `get_bcra_variable(29)` y `(31)` no se mezclan.
+    """
+
+    def decorator(method: Callable[..., Awaitable[Any]]):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            swr = store or swr_store
+            full_key = (key, args, tuple(sorted(kwargs.items()))) if (args or kwargs) else key
+            result = await swr.get(
+                full_key,
+                lambda: method(self, *args, **kwargs),
+                policy,
+                is_valid,
+            )
+            return annotate(result.value, result) if annotate else result.value
+
+        return wrapper
+
+    return decorator
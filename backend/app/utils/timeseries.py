@@ -0,0 +1,267 @@
+# backend/app/utils/timeseries.py
+"""
+Almacenamiento columnar de series temporales.
+
+Cada indicador se guarda en un único `<indicador>.npy` de forma (2, n)
+int64 en orden C, es decir dos columnas contiguas:
+- fila 0: timestamps (microsegundos desde epoch)
+- fila 1: valores float64 (mismos bytes, vistos como int64 en disco)
+
+El archivo se abre con `mmap_mode="r"`, así una serie de varios años no
+se copia a memoria; los rangos se resuelven con `np.searchsorted` y se
+devuelven como vistas sobre el mmap. Las escrituras reescriben la serie en
+un archivo temporal único, lo sincronizan a disco y hacen `os.replace`: al
+ser un solo archivo, un lector nunca ve timestamps y valores de versiones
+distintas. El ciclo leer → mezclar → guardar de cada indicador se serializa
+con un `flock` sobre `<indicador>.lock`, así dos workers que escriben a la
+vez no pierden el lote del otro (en plataformas sin fcntl solo queda el
+lock entre threads del mismo proceso).
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+TS_DTYPE = np.int64
+VALUE_DTYPE = np.float64
+
+TimeLike = Union[datetime, np.datetime64, int]
+
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+
+def to_micros(value: TimeLike) -> int:
+    """datetime (naive = tal cual) / datetime64 / int -> microsegundos desde epoch"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    return int(np.datetime64(value, "us").astype(TS_DTYPE))
+
+
+def to_datetime64(timestamps: np.ndarray) -> np.ndarray:
+    return timestamps.astype("datetime64[us]")
+
+
+def to_isoformat(timestamps: np.ndarray) -> List[str]:
+    """ISO 8601 vectorizado (sin loop de Python por punto)"""
+    return np.datetime_as_string(to_datetime64(timestamps), unit="us").tolist()
+
+
+class TimeSeriesStore:
+    """Series por indicador en archivos .npy mapeados en memoria"""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        # indicador -> (versión del archivo, timestamps, values)
+        self._mapped: Dict[str, Tuple[tuple, np.ndarray, np.ndarray]] = {}
+
+    # ------------------------------------------------------------------ #
+    # Archivos
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def is_valid_name(indicator: str) -> bool:
+        return bool(_SAFE_NAME.match(indicator))
+
+    def _paths(self, indicator: str) -> Tuple[str, str]:
+        if not self.is_valid_name(indicator):
+            raise ValueError(f"Invalid indicator name: {indicator!r}")
+        base = os.path.join(self.root, indicator)
+        return f"{base}.npy", f"{base}.meta.json"
+
+    @contextmanager
+    def _write_lock(self, indicator: str) -> Iterator[None]:
+        """Lock de escritura del indicador: entre threads y entre procesos"""
+        lock_path = os.path.join(self.root, f"{indicator}.lock")
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(lock_path, "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def has(self, indicator: str) -> bool:
+        return os.path.exists(self._paths(indicator)[0])
+
+    def indicators(self) -> List[str]:
+        return sorted(
+            name[:-len(".npy")] for name in os.listdir(self.root)
+            if name.endswith(".npy") and not name.endswith(".tmp.npy")
+        )
+
+    def _load(self, indicator: str) -> Tuple[np.ndarray, np.ndarray]:
+        path = self._paths(indicator)[0]
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return np.empty(0, TS_DTYPE), np.empty(0, VALUE_DTYPE)
+
+        version = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        cached = self._mapped.get(indicator)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        data = np.load(path, mmap_mode="r")
+        if data.ndim != 2 or data.shape[0] != 2 or data.dtype != TS_DTYPE:
+            raise ValueError(f"Corrupted series {indicator}: shape {data.shape}, dtype {data.dtype}")
+        timestamps, values = data[0], data[1].view(VALUE_DTYPE)
+        self._mapped[indicator] = (version, timestamps, values)
+        return timestamps, values
+
+    @staticmethod
+    def _atomic_save(path: str, timestamps: np.ndarray, values: np.ndarray) -> None:
+        data = np.empty((2, len(timestamps)), dtype=TS_DTYPE)
+        data[0] = timestamps
+        data[1] = values.view(TS_DTYPE)
+        directory, name = os.path.split(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name[:-len('.npy')]}.", suffix=".tmp.npy")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    @staticmethod
+    def _save_meta(meta_path: str, meta: Dict[str, Any]) -> None:
+        directory, name = os.path.split(meta_path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, meta_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    # ------------------------------------------------------------------ #
+    # Escritura
+    # ------------------------------------------------------------------ #
+    def append(
+        self,
+        indicator: str,
+        timestamps: Iterable[TimeLike],
+        values: Iterable[float],
+        meta: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Agregar puntos a una serie. Se ordena por timestamp y, si un
+        timestamp ya existe, gana el valor nuevo. Devuelve el largo final.
+        """
+        return self._write(indicator, timestamps, values, meta, replace=False)
+
+    def replace(
+        self,
+        indicator: str,
+        timestamps: Iterable[TimeLike],
+        values: Iterable[float],
+        meta: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Reemplazar la serie y su metadata completas (rebuild desde la base)"""
+        return self._write(indicator, timestamps, values, meta, replace=True)
+
+    def _write(self, indicator: str, timestamps: Iterable[TimeLike], values: Iterable[float],
+               meta: Optional[Dict[str, Any]], replace: bool) -> int:
+        new_ts = np.fromiter((to_micros(t) for t in timestamps), dtype=TS_DTYPE)
+        new_values = np.asarray(list(values), dtype=VALUE_DTYPE)
+        if len(new_ts) != len(new_values):
+            raise ValueError("timestamps and values must have the same length")
+
+        path, meta_path = self._paths(indicator)
+        with self._write_lock(indicator):
+            if replace:
+                old_ts, old_values = np.empty(0, TS_DTYPE), np.empty(0, VALUE_DTYPE)
+            else:
+                old_ts, old_values = self._load(indicator)
+            # Nuevos primero: con un sort estable quedan antes que los viejos
+            all_ts = np.concatenate([new_ts, old_ts])
+            all_values = np.concatenate([new_values, old_values])
+            order = np.argsort(all_ts, kind="stable")
+            all_ts, all_values = all_ts[order], all_values[order]
+
+            if len(all_ts) > 1:
+                keep = np.empty(len(all_ts), dtype=bool)
+                keep[0] = True
+                np.not_equal(all_ts[1:], all_ts[:-1], out=keep[1:])
+                all_ts, all_values = all_ts[keep], all_values[keep]
+
+            self._atomic_save(path, all_ts, all_values)
+            if replace:
+                self._save_meta(meta_path, dict(meta or {}))
+            elif meta:
+                self._save_meta(meta_path, {**self.get_meta(indicator), **meta})
+            self._mapped.pop(indicator, None)
+            return len(all_ts)
+
+    def delete(self, indicator: str) -> None:
+        with self._write_lock(indicator):
+            for path in self._paths(indicator):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._mapped.pop(indicator, None)
+
+    # ------------------------------------------------------------------ #
+    # Lectura
+    # ------------------------------------------------------------------ #
+    def range(
+        self,
+        indicator: str,
+        start: Optional[TimeLike] = None,
+        end: Optional[TimeLike] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Puntos con start <= ts <= end (vistas de solo lectura sobre el mmap)"""
+        timestamps, values = self._load(indicator)
+        lo = 0 if start is None else int(np.searchsorted(timestamps, to_micros(start), side="left"))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, to_micros(end), side="right"))
+        return timestamps[lo:hi], values[lo:hi]
+
+    def latest(self, indicator: str) -> Optional[Tuple[int, float]]:
+        timestamps, values = self._load(indicator)
+        if not len(timestamps):
+            return None
+        return int(timestamps[-1]), float(values[-1])
+
+    def get_meta(self, indicator: str) -> Dict[str, Any]:
+        meta_path = self._paths(indicator)[1]
+        if not os.path.exists(meta_path):
+            return {}
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def get_stats(self) -> Dict[str, Any]:
+        names = self.indicators()
+        return {
+            "series": len(names),
+            "mapped": len(self._mapped),
+            "points": sum(len(self._load(name)[0]) for name in names),
+        }
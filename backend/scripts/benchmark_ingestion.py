@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# backend/scripts/benchmark_ingestion.py
+"""
+Benchmark de escritura de indicadores: por fila (UPDATE + INSERT por
+indicador) vs ingesta en bloque (`services.ingestion.ingest_indicators`).
+Ejecutar: python scripts/benchmark_ingestion.py [--indicators 85] [--rounds 50]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Agregar el directorio padre al path para imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import EconomicIndicator
+from app.services.ingestion import ingest_indicators
+
+
+def make_batch(n_indicators, round_no):
+    return [
+        {
+            "indicator_type": f"bcra_var_{i}",
+            "value": 1000.0 + i + round_no,
+            "source": "BCRA",
+            "unit": "ARS",
+            "category": "monetary",
+        }
+        for i in range(n_indicators)
+    ]
+
+
+def save_per_row(db, batch):
+    """Camino anterior: un UPDATE y un INSERT ORM por indicador"""
+    for data in batch:
+        db.query(EconomicIndicator).filter(
+            EconomicIndicator.indicator_type == data["indicator_type"],
+            EconomicIndicator.is_active == True
+        ).update({"is_active": False})
+
+        db.add(EconomicIndicator(
+            indicator_type=data["indicator_type"],
+            value=data["value"],
+            source=data["source"],
+            unit=data["unit"],
+            category=data["category"],
+            date=datetime.now(),
+            is_active=True
+        ))
+    db.commit()
+
+
+def save_bulk(db, batch, now):
+    ingest_indicators(db, batch, now=now)
+
+
+def run(label, writer, n_indicators, rounds):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        start_date = datetime.now()
+
+        start = time.perf_counter()
+        for round_no in range(rounds):
+            batch = make_batch(n_indicators, round_no)
+            if writer is save_bulk:
+                writer(db, batch, start_date + timedelta(seconds=round_no))
+            else:
+                writer(db, batch)
+        elapsed = time.perf_counter() - start
+
+        total = db.query(EconomicIndicator).count()
+        db.close()
+        engine.dispose()
+
+    rows = n_indicators * rounds
+    print(f"{label:<10} {rows:>7} filas  {elapsed:8.3f}s  {rows / elapsed:10.0f} filas/s  (tabla: {total})")
+    return rows / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de ingesta de indicadores")
+    parser.add_argument("--indicators", type=int, default=85, help="Indicadores por refresh (45 BCRA + 40 monedas)")
+    parser.add_argument("--rounds", type=int, default=50, help="Cantidad de refreshes")
+    args = parser.parse_args()
+
+    print(f"📊 Ingesta: {args.indicators} indicadores x {args.rounds} refreshes (SQLite en disco)")
+    per_row = run("por fila", save_per_row, args.indicators, args.rounds)
+    bulk = run("en bloque", save_bulk, args.indicators, args.rounds)
+    print(f"🚀 Speedup: {bulk / per_row:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
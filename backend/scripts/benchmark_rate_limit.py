@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# backend/scripts/benchmark_rate_limit.py
+"""
+Microbenchmark del overhead de RateLimitMiddleware por request: se llama
+al stack ASGI directamente (sin red ni servidor) con y sin el middleware.
+Con --redis-url mide también el limitador de ventana deslizante en Redis.
+Ejecutar: python scripts/benchmark_rate_limit.py [--requests 100000] [--clients 1000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Agregar el directorio padre al path para imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.middleware.rate_limit_middleware import RateLimitMiddleware
+from app.utils.rate_limit import Quota, RedisSlidingWindowLimiter, TokenBucketLimiter
+
+
+async def endpoint(scope, receive, send):
+    """App ASGI mínima: el costo medido es solo el del middleware"""
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def make_scopes(n_clients):
+    return [
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/indicators/current",
+            "headers": [(b"host", b"localhost"), (b"accept", b"application/json")],
+            "client": (f"10.0.{i // 256}.{i % 256}", 50000),
+        }
+        for i in range(n_clients)
+    ]
+
+
+async def measure(app, scopes, n_requests):
+    start = time.perf_counter()
+    for i in range(n_requests):
+        await app(scopes[i % len(scopes)], receive, send)
+    return (time.perf_counter() - start) / n_requests * 1_000_000
+
+
+async def run(args):
+    scopes = make_scopes(args.clients)
+    quota = Quota(10**9, 60)  # sin rechazos: se mide el camino normal
+
+    baseline = await measure(endpoint, scopes, args.requests)
+    memory = RateLimitMiddleware(
+        endpoint,
+        limiter=TokenBucketLimiter(),
+        default_quota=quota,
+        route_quotas={"/api/v1/data/export": Quota(10, 60)},
+    )
+    with_memory = await measure(memory, scopes, args.requests)
+
+    print(f"📊 {args.requests} requests, {args.clients} clientes")
+    print(f"sin middleware      {baseline:8.2f} µs/request")
+    print(f"token bucket        {with_memory:8.2f} µs/request  (overhead {with_memory - baseline:6.2f} µs)")
+
+    if args.redis_url:
+        import redis.asyncio as aioredis
+
+        client = aioredis.from_url(args.redis_url)
+        redis_app = RateLimitMiddleware(
+            endpoint, limiter=RedisSlidingWindowLimiter(client, prefix="bench:ratelimit:"), default_quota=quota
+        )
+        n = min(args.requests, 10000)
+        with_redis = await measure(redis_app, scopes, n)
+        print(f"redis (Lua)         {with_redis:8.2f} µs/request  (overhead {with_redis - baseline:6.2f} µs, {n} requests)")
+        await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark de rate limiting")
+    parser.add_argument("--requests", type=int, default=100000, help="Requests a simular")
+    parser.add_argument("--clients", type=int, default=1000, help="Clientes distintos (IPs)")
+    parser.add_argument("--redis-url", default=None, help="Medir también el backend Redis")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# backend/scripts/benchmark_serialization.py
+"""
+Benchmark de serialización y compresión de respuestas: JSONResponse
+(json estándar) vs ORJSONResponse, y bytes sin comprimir / gzip / brotli
+para payloads con la forma de /dashboard/complete, /config/indicators y
+/data/export/json.
+Ejecutar: python scripts/benchmark_serialization.py [--rows 20000] [--repeat 20]
+"""
+import argparse
+import gzip
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Agregar el directorio padre al path para imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.config.indicators_mapping import ALL_INDICATORS, CATEGORIES
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def dashboard_payload():
+    """Misma forma que get_all_indicators + metadata de /dashboard/complete"""
+    now = datetime.now()
+    data = {}
+    for category, info in CATEGORIES.items():
+        data[category] = {
+            name: {
+                "value": 1000.0 + i * 3.7,
+                "date": now.strftime("%Y-%m-%d"),
+                "source": ALL_INDICATORS.get(name, {}).get("source", "DEMO"),
+                "unit": ALL_INDICATORS.get(name, {}).get("unit", ""),
+                "status": "success",
+                "age_seconds": 12.5,
+                "stale": False,
+            }
+            for i, name in enumerate(info["indicators"])
+        }
+        data[category].update(timestamp=now.isoformat(), category=category)
+    return {
+        "status": "success",
+        "data": data,
+        "metadata": {"categories": list(CATEGORIES), "total_indicators": len(ALL_INDICATORS)},
+        "timestamp": now.isoformat(),
+    }
+
+
+def export_payload(rows):
+    """Misma forma que /data/export/json"""
+    start = datetime.now()
+    data = [
+        {
+            "indicator_type": f"bcra_var_{i % 85}",
+            "value": 1000.0 + i * 0.25,
+            "date": (start - timedelta(minutes=i)).isoformat(),
+            "source": "BCRA",
+        }
+        for i in range(rows)
+    ]
+    return {"status": "success", "format": "json", "data": data, "count": rows}
+
+
+def render_time(response_class, payload, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = response_class(payload).body
+    return (time.perf_counter() - start) / repeat * 1000, body
+
+
+def report(label, payload, repeat):
+    json_ms, body = render_time(JSONResponse, payload, repeat)
+    orjson_ms, _ = render_time(ORJSONResponse, payload, repeat)
+
+    sizes = [f"raw {len(body):>10,}", f"gzip {len(gzip.compress(body, 6)):>9,}"]
+    if brotli is not None:
+        sizes.append(f"br {len(brotli.compress(body, quality=4)):>9,}")
+
+    print(f"{label:<20} json {json_ms:8.2f}ms  orjson {orjson_ms:8.2f}ms  ({json_ms / orjson_ms:4.1f}x)  " + "  ".join(sizes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de serialización de respuestas")
+    parser.add_argument("--rows", type=int, default=20000, help="Filas del export JSON")
+    parser.add_argument("--repeat", type=int, default=20, help="Repeticiones por medición")
+    args = parser.parse_args()
+
+    print(f"📊 Serialización ({args.repeat} repeticiones, tiempos promedio por respuesta)")
+    report("/dashboard/complete", dashboard_payload(), args.repeat)
+    report("/config/indicators", {"status": "success", "indicators": ALL_INDICATORS}, args.repeat)
+    report("/data/export/json", export_payload(args.rows), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# backend/tests/test_api_usage.py
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.middleware.logging_middleware import UNMATCHED_ROUTE, LoggingMiddleware
+from app.models import APIUsage, APIUsageHour, APIUsageMinute
+from app.services import api_usage
+from app.services.api_usage import UsageRecorder
+from app.utils import histogram
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_ring_buffer_drops_oldest():
+    recorder = UsageRecorder(maxsize=3)
+    for i in range(5):
+        recorder.record("GET", f"/r{i}", 200, 1.0)
+
+    assert [r[2] for r in recorder.drain()] == ["/r2", "/r3", "/r4"]
+    assert recorder.get_stats()["dropped"] == 2
+
+
+def test_flush_inserts_batch(session_factory):
+    recorder = UsageRecorder(session_factory, maxsize=100)
+    recorder.record("GET", "/api/v1/indicators/{indicator_type}", 200, 12.5, "1.2.3.4", "x" * 600, "ip:1.2.3.4")
+    recorder.record("POST", "/api/v1/data/refresh", 429, 0.3)
+
+    assert recorder.flush() == 2
+    assert recorder.flush() == 0
+
+    db = session_factory()
+    rows = db.query(APIUsage).order_by(APIUsage.id).all()
+    assert [(r.method, r.status_code) for r in rows] == [("GET", 200), ("POST", 429)]
+    assert rows[0].endpoint == "/api/v1/indicators/{indicator_type}"
+    assert len(rows[0].user_agent) == 500
+    db.close()
+
+
+def test_middleware_records_route_template():
+    recorder = UsageRecorder(maxsize=100)
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, recorder=recorder)
+
+    @app.get("/api/v1/indicators/{indicator_type}")
+    async def by_type(indicator_type: str):
+        return {"indicator_type": indicator_type}
+
+    client = TestClient(app)
+    response = client.get("/api/v1/indicators/reservas", headers={"X-API-Key": "secret"})
+    assert response.status_code == 200
+    assert response.headers["x-response-time"].endswith("ms")
+    client.get("/nope")
+    client.get("/docs")
+
+    first, second = recorder.drain()
+    assert first[1:4] == ("GET", "/api/v1/indicators/{indicator_type}", 200)
+    assert first[7].startswith("key:") and "secret" not in first[7]
+    assert second[2:4] == (UNMATCHED_ROUTE, 404)
+
+
+def test_histogram_percentiles():
+    counts = histogram.empty()
+    for latency in [1.0] * 50 + [20.0] * 45 + [700.0] * 4 + [9000.0]:
+        histogram.observe(counts, latency)
+
+    assert counts[histogram.bucket_index(1.0)] == 50
+    assert histogram.percentile(counts, 50) == 5.0
+    assert 10 < histogram.percentile(counts, 95) <= 25
+    assert 500 < histogram.percentile(counts, 99) <= 1000
+    assert histogram.percentile(histogram.empty(), 99) == 0.0
+
+
+def test_flush_maintains_rollups_incrementally(session_factory):
+    recorder = UsageRecorder(session_factory, maxsize=100)
+    for latency in (3.0, 40.0, 40.0):
+        recorder.record("GET", "/api/v1/indicators/current", 200, latency)
+    recorder.flush()
+    recorder.record("GET", "/api/v1/indicators/current", 200, 300.0)
+    recorder.record("GET", "/api/v1/indicators/current", 304, 1.0)
+    recorder.flush()
+
+    db = session_factory()
+    hours = db.query(APIUsageHour).filter(APIUsageHour.status_code == 200).all()
+    assert sum(h.count for h in hours) == 4
+    assert sum(h.sum_latency_ms for h in hours) == pytest.approx(383.0)
+    assert [sum(getattr(h, c) for h in hours) for c in ("h_5", "h_50", "h_500")] == [1, 2, 1]
+    assert db.query(APIUsageMinute).count() >= 2
+
+    stats = api_usage.usage_stats(db, hours=1)
+    assert stats["resolution"] == "minute"
+    assert stats["total_requests"] == 5
+    assert stats["status_codes"] == {"200": 4, "304": 1}
+    [endpoint] = stats["endpoints"]
+    assert endpoint["avg_response_time_ms"] == pytest.approx(76.8)
+    assert 25 < endpoint["p50_ms"] <= 50
+    assert api_usage.usage_stats(db, hours=24)["total_requests"] == 5
+    db.close()
+
+
+def test_prune_respects_retention(session_factory):
+    db = session_factory()
+    now = datetime(2025, 6, 1, 12, 0)
+    old = now - api_usage.RAW_RETENTION - timedelta(minutes=1)
+    db.add_all([
+        APIUsage(endpoint="/a", method="GET", status_code=200, timestamp=old),
+        APIUsage(endpoint="/a", method="GET", status_code=200, timestamp=now),
+        APIUsageMinute(bucket=now - api_usage.MINUTE_RETENTION - timedelta(minutes=1),
+                       endpoint="/a", method="GET", status_code=200, count=1),
+        APIUsageHour(bucket=old, endpoint="/a", method="GET", status_code=200, count=1),
+    ])
+    db.commit()
+
+    deleted = api_usage.prune(db, now=now)
+    assert deleted == {"api_usage": 1, "api_usage_minute": 1, "api_usage_hour": 0}
+    assert db.query(APIUsage).count() == 1
+    assert db.query(APIUsageHour).count() == 1
+    db.close()
@@ -0,0 +1,115 @@
+# backend/tests/test_cache.py
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.utils.cache import LRUCache, RedisBackend, TwoTierCache, get_serializer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1  # "a" pasa a ser el más reciente
+    lru.set("c", 3)
+
+    assert "b" not in lru
+    assert lru.get("a") == 1 and lru.get("c") == 3
+    assert lru.evictions == 1
+
+
+def test_lru_per_key_ttl():
+    clock = FakeClock()
+    lru = LRUCache(maxsize=10, default_ttl=60, clock=clock)
+    lru.set("blue", 1180.0, ttl=120)
+    lru.set("ipc", 3.2)
+
+    clock.now = 90
+    assert lru.get("ipc") is None
+    assert lru.get("blue") == 1180.0
+    assert lru.expirations == 1
+
+    # Las entradas vencidas siguen disponibles para stale-while-revalidate
+    lru.set("merval", 100, ttl=1)
+    clock.now = 200
+    assert lru.get_entry("merval", allow_expired=True).value == 100
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgpack", "json"])
+def test_serializers_roundtrip(name):
+    serializer = get_serializer(name)
+    payload = {"value": 1180.5, "sources": ["bluelytics"], "date": datetime(2024, 6, 25)}
+    assert serializer.loads(serializer.dumps(payload)) == {
+        "value": 1180.5,
+        "sources": ["bluelytics"],
+        "date": "2024-06-25T00:00:00",
+    }
+
+
+def test_two_tier_reads_through_to_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def run():
+        client = fakeredis.FakeAsyncRedis()
+        writer = TwoTierCache(local=LRUCache(maxsize=8), backend=RedisBackend(client))
+        reader = TwoTierCache(local=LRUCache(maxsize=8), backend=RedisBackend(client))
+
+        await writer.set("dolar_blue_rate", {"sell": 1180.0}, ttl=60)
+        first = await reader.get("dolar_blue_rate")
+        second = await reader.get("dolar_blue_rate")
+        return reader, first, second
+
+    reader, first, second = asyncio.run(run())
+    assert first == second == {"sell": 1180.0}
+    stats = reader.get_stats()
+    assert stats["l2"]["hits"] == 1
+    assert stats["l1"]["hits"] == 1
+
+
+def test_get_or_load_loads_once_for_concurrent_callers():
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [1, 2, 3]
+
+    async def run():
+        cache = TwoTierCache(local=LRUCache(maxsize=8))
+        results = await asyncio.gather(*[cache.get_or_load("k", loader) for _ in range(10)])
+        results.append(await cache.get_or_load("k", loader))
+        return results
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(r == [1, 2, 3] for r in results)
+
+
+def test_backend_errors_degrade_to_local_cache():
+    class BrokenClient:
+        def pipeline(self, transaction=False):
+            raise ConnectionError("redis down")
+
+        async def set(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    async def run():
+        cache = TwoTierCache(local=LRUCache(maxsize=8), backend=RedisBackend(BrokenClient()))
+        await cache.set("k", 1)
+        hit = await cache.get("k")
+        miss = await cache.get("missing")
+        return cache, hit, miss
+
+    cache, hit, miss = asyncio.run(run())
+    assert hit == 1 and miss is None
+    assert cache.get_stats()["l2"]["errors"] == 2
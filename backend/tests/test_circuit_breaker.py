@@ -0,0 +1,105 @@
+# backend/tests/test_circuit_breaker.py
+import asyncio
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from app.services.circuit_breakers import GuardedRequest, breaker_for_url
+from app.utils.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, BreakerRegistry, CircuitBreaker, CircuitOpenError
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_opens_on_error_rate_and_recovers_through_half_open():
+    clock = FakeClock()
+    transitions = []
+    breaker = CircuitBreaker("BCRA", min_calls=4, failure_rate=0.5, open_seconds=30,
+                             on_state_change=lambda *change: transitions.append(change), clock=clock)
+
+    for success in (True, False, True, False):
+        assert breaker.allow()
+        breaker.record(success, 0.1)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    assert breaker.snapshot()["rejected"] == 2
+
+    clock.now = 31
+    assert breaker.allow()  # única llamada de prueba
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.state == CLOSED
+    assert transitions == [("BCRA", CLOSED, OPEN), ("BCRA", OPEN, HALF_OPEN), ("BCRA", HALF_OPEN, CLOSED)]
+
+
+def test_slow_calls_and_failed_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker("INDEC", min_calls=3, slow_call_seconds=1, slow_call_rate=0.6,
+                             open_seconds=10, clock=clock)
+    for _ in range(3):
+        breaker.allow()
+        breaker.record(True, 2.0)  # responde, pero lento
+    assert breaker.state == OPEN
+
+    clock.now = 11
+    assert breaker.allow()
+    breaker.release()  # prueba cancelada: libera el lugar sin decidir
+    assert breaker.allow()
+    breaker.record(False, 0.1)
+    assert breaker.state == OPEN and breaker.retry_in() == 10
+
+
+def test_breaker_per_source_or_host():
+    registry = BreakerRegistry()
+    assert breaker_for_url("https://api.bcra.gob.ar/estadisticas/v3.0", registry).name == "BCRA"
+    assert breaker_for_url("https://www.scrapeme.com.ar/precios", registry).name == "www.scrapeme.com.ar"
+    assert set(registry.snapshot()) == {"BCRA", "www.scrapeme.com.ar"}
+
+
+def test_open_circuit_short_circuits_http_calls():
+    async def scenario():
+        async def broken(request):
+            return web.Response(status=503)
+
+        app = web.Application()
+        app.router.add_get("/broken", broken)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        url = f"http://127.0.0.1:{runner.addresses[0][1]}/broken"
+
+        breaker = CircuitBreaker("local", min_calls=2, open_seconds=60)
+        try:
+            async with aiohttp.ClientSession() as session:
+                for _ in range(2):
+                    async with GuardedRequest(breaker, lambda: session.get(url)) as response:
+                        assert response.status == 503
+                # también como awaitable
+                response = await GuardedRequest(CircuitBreaker("other"), lambda: session.get(url))
+                response.release()
+
+                start = time.perf_counter()
+                with pytest.raises(CircuitOpenError):
+                    async with GuardedRequest(breaker, lambda: session.get(url)):
+                        pass
+                elapsed = time.perf_counter() - start
+        finally:
+            await runner.cleanup()
+        return breaker, elapsed
+
+    breaker, elapsed = asyncio.run(scenario())
+    assert breaker.state == OPEN
+    assert elapsed < 0.01
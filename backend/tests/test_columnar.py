@@ -0,0 +1,35 @@
+# backend/tests/test_columnar.py
+import io
+from datetime import datetime
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+
+from app.utils.columnar import schema, write_columnar
+
+FIELDS = (("indicator_type", "string"), ("value", "float64"), ("date", "timestamp"), ("source", "string"))
+BATCHES = [
+    [("dolar_blue", 1200.5, datetime(2024, 1, 1), "BLUELYTICS")],
+    [("merval", 1.0, datetime(2024, 1, 2), "BYMA"), ("ipc", None, datetime(2024, 1, 3), "INDEC")],
+]
+
+
+def test_parquet_roundtrip_keeps_types():
+    table = pq.read_table(io.BytesIO(write_columnar(BATCHES, schema(FIELDS), "parquet")))
+    assert table.num_rows == 3
+    assert table.schema.field("date").type == pa.timestamp("us")
+    assert table.column("value").to_pylist() == [1200.5, 1.0, None]
+
+
+def test_arrow_file_one_record_batch_per_input_batch():
+    reader = pa_ipc.open_file(pa.BufferReader(write_columnar(BATCHES, schema(FIELDS), "arrow")))
+    assert reader.num_record_batches == 2
+    assert reader.read_all().column("indicator_type").to_pylist() == ["dolar_blue", "merval", "ipc"]
+
+
+def test_empty_export_still_has_schema():
+    table = pq.read_table(io.BytesIO(write_columnar(iter([]), schema(FIELDS), "parquet")))
+    assert table.num_rows == 0 and table.column_names == [name for name, _ in FIELDS]
@@ -0,0 +1,82 @@
+# backend/tests/test_compression.py
+import gzip
+
+import brotli
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.compression_middleware import CompressionMiddleware
+from app.utils.streaming import negotiate_encoding
+
+BIG = {"indicators": [{"name": f"ind_{i}", "value": i * 1.5} for i in range(500)]}
+
+
+def make_client():
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/big")
+    async def big():
+        return BIG
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse((b"x" * 10 for _ in range(300)), media_type="text/plain")
+
+    @app.get("/precompressed")
+    async def precompressed():
+        body = gzip.compress(b"y" * 5000)
+        return StreamingResponse(iter([body]), headers={"Content-Encoding": "gzip"})
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding_prefers_brotli_and_respects_q():
+    assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("br;q=0.1, gzip", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("br;q=0, *", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+
+
+def test_large_bodies_compressed_small_ones_untouched():
+    client = make_client()
+
+    response = client.get("/big", headers={"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert response.json() == BIG  # el cliente decodifica br
+
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(response.content) / 3
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip, br"})
+    assert "content-encoding" not in small.headers
+    assert small.json() == {"status": "ok"}
+
+
+def test_streaming_and_precompressed_responses():
+    client = make_client()
+
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "x" * 3000
+
+    response = client.get("/precompressed", headers={"Accept-Encoding": "br, gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == "y" * 5000
+
+
+def test_brotli_stream_roundtrip():
+    # Chunks con flush intermedio siguen formando un stream brotli válido
+    from app.middleware.compression_middleware import _Encoder
+
+    encoder = _Encoder("br", 6, 4)
+    body = encoder.compress(b"abc" * 100) + encoder.compress(b"def" * 100) + encoder.finish()
+    assert brotli.decompress(body) == b"abc" * 100 + b"def" * 100
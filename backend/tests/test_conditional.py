@@ -0,0 +1,122 @@
+# backend/tests/test_conditional.py
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import Base, create_async_db_engine, create_db_engine
+from app.services import snapshot_service
+from app.services.ingestion import ingest_indicators
+from app.utils.conditional import PrecomputedResponse, http_date, is_not_modified, make_etag
+
+
+def test_etag_and_if_modified_since_rules():
+    etag = make_etag("current", 3, 42)
+    assert etag == make_etag("current", 3, 42) != make_etag("current", 3, 43)
+
+    assert is_not_modified({"if-none-match": etag}, etag)
+    assert is_not_modified({"if-none-match": f'"other", W/{etag}'}, etag)
+    assert not is_not_modified({"if-none-match": '"other"'}, etag)
+
+    modified = datetime(2025, 1, 10, 12, 0, 0, 500000)
+    assert is_not_modified({"if-modified-since": http_date(modified)}, etag, modified)
+    assert not is_not_modified({"if-modified-since": http_date(modified - timedelta(seconds=5))}, etag, modified)
+    # If-None-Match tiene prioridad
+    assert not is_not_modified(
+        {"if-none-match": '"other"', "if-modified-since": http_date(modified)}, etag, modified
+    )
+
+
+def test_precomputed_response_returns_304():
+    config = PrecomputedResponse({"status": "success", "categories": ["economia"]})
+    app = FastAPI()
+
+    @app.get("/config")
+    async def get_config(request: Request):
+        return config.respond(request)
+
+    client = TestClient(app)
+    first = client.get("/config")
+    assert first.status_code == 200 and first.json()["categories"] == ["economia"]
+    assert first.headers["etag"] == config.etag
+
+    second = client.get("/config", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304 and second.content == b""
+    assert client.get("/config", headers={"If-Modified-Since": first.headers["last-modified"]}).status_code == 304
+
+
+def test_snapshot_version_changes_on_ingestion(tmp_path):
+    url = f"sqlite:///{tmp_path}/version.db"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+
+    async def version():
+        async_engine = create_async_db_engine(url)
+        try:
+            async with AsyncSession(async_engine) as db:
+                return await snapshot_service.get_version_async(db)
+        finally:
+            await async_engine.dispose()
+
+    with Session(engine) as db:
+        now = datetime(2025, 1, 10)
+        ingest_indicators(db, [{"indicator_type": "dolar_blue", "value": 1300, "source": "BLUE", "date": now}])
+        first = asyncio.run(version())
+        assert first.count == 1 and first.updated_at is not None
+
+        # Cacheada hasta que una escritura la invalida
+        assert asyncio.run(version()) == first
+        ingest_indicators(db, [{"indicator_type": "dolar_blue", "value": 1310, "source": "BLUE",
+                                "date": now + timedelta(hours=1)}])
+        second = asyncio.run(version())
+
+    assert second.count == 1 and second.last_id > first.last_id
+    engine.dispose()
+
+
+def test_cards_return_304_from_snapshot_version_before_fetching(tmp_path):
+    from app.database import get_async_db
+    from app.routers.economic_cards import cards_etag, router
+
+    url = f"sqlite:///{tmp_path}/cards.db"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        ingest_indicators(db, [{"indicator_type": "dolar_blue", "value": 1300, "source": "BLUE",
+                                "date": datetime(2025, 1, 10)}])
+
+    async def version():
+        async_engine = create_async_db_engine(url)
+        try:
+            async with AsyncSession(async_engine) as db:
+                return await snapshot_service.get_version_async(db)
+        finally:
+            await async_engine.dispose()
+
+    async def override_db():
+        async_engine = create_async_db_engine(url)
+        try:
+            async with AsyncSession(async_engine) as db:
+                yield db
+        finally:
+            await async_engine.dispose()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_db] = override_db
+    client = TestClient(app)
+
+    # El 304 sale sin consultar el servicio de cards
+    etag = cards_etag(asyncio.run(version()), "Exchange", 4)
+    cached = client.get("/api/v1/cards/", params={"category": "exchange", "limit": 4},
+                        headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.headers["etag"] == etag
+
+    with Session(engine) as db:
+        ingest_indicators(db, [{"indicator_type": "dolar_blue", "value": 1310, "source": "BLUE",
+                                "date": datetime(2025, 1, 11)}])
+    assert cards_etag(asyncio.run(version()), "exchange", 4) != etag
+    engine.dispose()
@@ -0,0 +1,122 @@
+# backend/tests/test_database.py
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.database import create_async_db_engine, create_db_engine, to_async_url
+
+
+def test_sqlite_file_engine_uses_wal_and_queue_pool(tmp_path):
+    url = f"sqlite:///{tmp_path}/argfy.db"
+    engine = create_db_engine(url)
+    read_engine = create_db_engine(url, read_only=True)
+
+    assert isinstance(engine.pool, QueuePool)
+    with engine.begin() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    with read_engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+
+
+def test_sqlite_memory_engine_keeps_static_pool():
+    engine = create_db_engine("sqlite://")
+    assert isinstance(engine.pool, StaticPool)
+
+
+def test_to_async_url_picks_async_driver():
+    assert to_async_url("sqlite:///./data/argentina.db") == "sqlite+aiosqlite:///./data/argentina.db"
+    assert to_async_url("postgresql://u:p@db/argfy") == "postgresql+asyncpg://u:p@db/argfy"
+    assert to_async_url("postgresql+psycopg2://u:p@db/argfy") == "postgresql+asyncpg://u:p@db/argfy"
+
+
+def test_async_engine_reads_rows_written_by_sync_engine(tmp_path):
+    url = f"sqlite:///{tmp_path}/argfy.db"
+    with create_db_engine(url).begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1), (2)"))
+
+    async def read():
+        async_engine = create_async_db_engine(url)
+        try:
+            async with async_engine.connect() as conn:
+                mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+                total = (await conn.execute(text("SELECT sum(x) FROM t"))).scalar()
+                return mode, total
+        finally:
+            await async_engine.dispose()
+
+    assert asyncio.run(read()) == ("wal", 3)
+
+
+def test_async_read_engine_is_query_only(tmp_path):
+    url = f"sqlite:///{tmp_path}/argfy.db"
+    with create_db_engine(url).begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+
+    async def write():
+        async_engine = create_async_db_engine(url, read_only=True)
+        try:
+            async with async_engine.begin() as conn:
+                await conn.execute(text("INSERT INTO t VALUES (1)"))
+        finally:
+            await async_engine.dispose()
+
+    with pytest.raises(OperationalError):
+        asyncio.run(write())
+
+
+def test_async_engine_shares_in_memory_database():
+    engine = create_db_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (7)"))
+
+    async def read():
+        async_engine = create_async_db_engine("sqlite://", sync_engine=engine)
+        try:
+            async with async_engine.connect() as conn:
+                return (await conn.execute(text("SELECT sum(x) FROM t"))).scalar()
+        finally:
+            await async_engine.dispose()
+
+    assert asyncio.run(read()) == 7
+    # dispose del engine async no cierra la base del engine sync
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 1
+
+    with pytest.raises(ValueError):
+        create_async_db_engine("sqlite://")
+
+
+def test_async_session_does_not_roll_back_sync_writes_in_memory():
+    engine = create_db_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+
+    async def read():
+        async_engine = create_async_db_engine("sqlite://", read_only=True, sync_engine=engine)
+        try:
+            async with AsyncSession(async_engine) as db:
+                return (await db.execute(text("SELECT count(*) FROM t"))).scalar()
+        finally:
+            await async_engine.dispose()
+
+    with Session(engine) as db:
+        db.execute(text("INSERT INTO t VALUES (1)"))
+        asyncio.run(read())  # cerrar la sesión async no toca la transacción sync
+        db.commit()
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 1
+    engine.dispose()
@@ -0,0 +1,99 @@
+# backend/tests/test_fanout.py
+import asyncio
+import time
+
+from app.utils.fanout import ERROR, OK, TIMEOUT, collect, fan_out, status_map
+from app.utils.singleflight import SingleFlight, singleflight
+
+
+async def _value(value, delay):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _boom():
+    raise ValueError("upstream down")
+
+
+def test_fan_out_runs_concurrently_with_partial_results():
+    calls = {
+        "bcra": lambda: _value(["reservas"], 0.1),
+        "dolar": lambda: _value(["blue"], 0.1),
+        "market": lambda: _value(["merval"], 5),
+        "inflation": _boom,
+    }
+
+    start = time.perf_counter()
+    outcomes = asyncio.run(fan_out(calls, budget=2, deadlines={"market": 0.2}))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5  # max(deadlines), no la suma
+    assert outcomes["bcra"].status == OK and outcomes["bcra"].value == ["reservas"]
+    assert outcomes["market"].status == TIMEOUT and outcomes["market"].value is None
+    assert outcomes["inflation"].status == ERROR
+
+    statuses = status_map(outcomes)
+    assert statuses["inflation"]["error"] == "upstream down"
+    assert "error" not in statuses["dolar"]
+
+
+def test_budget_caps_sources_without_deadline():
+    outcomes = asyncio.run(fan_out({"slow": lambda: _value(1, 5), "fast": lambda: _value(2, 0)}, budget=0.2))
+    assert outcomes["slow"].status == TIMEOUT
+    assert outcomes["fast"].value == 2
+    assert asyncio.run(fan_out({}, budget=1)) == {}
+
+
+def test_concurrency_limit_and_default_deadline():
+    running = 0
+    peak = 0
+
+    async def tracked(delay):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            running -= 1
+        return delay
+
+    calls = {f"ind_{i}": (lambda: tracked(0.05)) for i in range(6)}
+    calls["slow"] = lambda: tracked(5)
+
+    start = time.perf_counter()
+    outcomes = asyncio.run(fan_out(calls, budget=2, default_deadline=0.2, concurrency=2))
+    elapsed = time.perf_counter() - start
+
+    assert peak == 2
+    assert elapsed < 1
+    assert outcomes["slow"].status == TIMEOUT
+    assert all(outcomes[f"ind_{i}"].ok for i in range(6))
+
+
+def test_collected_status_reaches_every_coalesced_caller():
+    group = SingleFlight()
+    calls = 0
+
+    class Service:
+        @singleflight(group=group)
+        async def fetch_current(self):
+            nonlocal calls
+            calls += 1
+            return await collect({
+                "bcra": lambda: _value(["reservas", "tasa"], 0.05),
+                "dolar": lambda: _value("blue", 0.05),
+                "inflation": _boom,
+            }, budget=1)
+
+    async def run():
+        return await asyncio.gather(Service().fetch_current(), Service().fetch_current())
+
+    first, second = asyncio.run(run())
+    assert calls == 1
+    for result in (first, second):
+        assert sorted(result.values) == ["blue", "reservas", "tasa"]
+        assert result.partial
+        assert result.source_status["inflation"]["status"] == ERROR
+        assert result.source_status["inflation"]["indicators"] == 0
+        assert result.source_status["bcra"]["indicators"] == 2
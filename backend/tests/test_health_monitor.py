@@ -0,0 +1,80 @@
+# backend/tests/test_health_monitor.py
+import asyncio
+
+import aiohttp
+from aiohttp import web
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services.health_monitor import HealthMonitor
+
+
+def _session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    return sessionmaker(bind=engine)
+
+
+def test_snapshot_before_and_after_sampling():
+    monitor = HealthMonitor(_session_factory(), interval=5, upstream_checks={})
+
+    # Sin muestras todavía: responde igual, marcado como degradado
+    assert monitor.snapshot()["status"] == "degraded"
+    assert monitor.snapshot()["sample_age_seconds"] is None
+
+    asyncio.run(monitor.tick())
+    snapshot = monitor.snapshot()
+    assert snapshot["database"]["healthy"] is True
+    assert snapshot["sample_age_seconds"] < 5
+    assert "memory_percent" in snapshot["system"]
+
+
+def test_database_failure_is_unhealthy():
+    broken = sessionmaker(bind=create_engine("sqlite:////nonexistent/dir/db.sqlite"))
+    monitor = HealthMonitor(broken, upstream_checks={})
+    asyncio.run(monitor.tick())
+    assert monitor.snapshot()["status"] == "unhealthy"
+    assert monitor.snapshot()["database"]["healthy"] is False
+
+
+def test_upstream_checks_run_concurrently_and_are_cached():
+    async def scenario():
+        async def ok(request):
+            await asyncio.sleep(0.2)
+            return web.Response(text="ok")
+
+        async def broken(request):
+            await asyncio.sleep(0.2)
+            return web.Response(status=503)
+
+        app = web.Application()
+        app.router.add_get("/ok", ok)
+        app.router.add_get("/broken", broken)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        monitor = HealthMonitor(_session_factory(), upstream_checks={
+            "Bluelytics": f"http://127.0.0.1:{port}/ok",
+            "DolarSi": f"http://127.0.0.1:{port}/broken",
+            "BCRA": "http://127.0.0.1:1/unreachable",
+        })
+        try:
+            async with aiohttp.ClientSession() as session:
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                await monitor.check_upstreams(session)
+                elapsed = loop.time() - start
+        finally:
+            await runner.cleanup()
+        return monitor.snapshot()["upstreams"], elapsed
+
+    upstreams, elapsed = asyncio.run(scenario())
+    assert elapsed < 0.4  # en paralelo, no 0.2 + 0.2
+    assert upstreams["Bluelytics"]["reachable"] is True
+    assert upstreams["DolarSi"] == {**upstreams["DolarSi"], "reachable": False, "status_code": 503}
+    assert upstreams["BCRA"]["reachable"] is False and "error" in upstreams["BCRA"]
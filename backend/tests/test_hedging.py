@@ -0,0 +1,82 @@
+# backend/tests/test_hedging.py
+import asyncio
+import time
+
+from app.utils.hedging import LatencyTracker, hedged
+
+
+async def _answer(value, delay, log, name):
+    log.append(name)
+    try:
+        await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+        log.append(f"{name}:cancelled")
+        raise
+    return value
+
+
+def test_tracker_uses_default_until_enough_samples():
+    tracker = LatencyTracker(default=1.0, floor=0.01, ceiling=2.0, min_samples=5)
+    assert tracker.delay("a") == 1.0
+
+    for ms in range(10, 110, 10):
+        tracker.observe("a", ms / 1000)
+    assert tracker.delay("a") == 0.1  # p90 de 10..100 ms
+    assert tracker.stats()["a"]["samples"] == 10
+
+    for _ in range(10):
+        tracker.observe("b", 30)
+    assert tracker.delay("b") == 2.0  # acotado al ceiling
+
+
+def test_hanging_primary_is_hedged_after_p90():
+    tracker = LatencyTracker(min_samples=1)
+    tracker.observe("primary", 0.1)
+    log = []
+
+    calls = [
+        ("primary", lambda: _answer({"blue": 1}, 5, log, "primary")),
+        ("secondary", lambda: _answer({"blue": 2}, 0.05, log, "secondary")),
+        ("backup", lambda: _answer({"blue": 3}, 0.05, log, "backup")),
+    ]
+
+    start = time.perf_counter()
+    result = asyncio.run(hedged(calls, tracker, is_valid=lambda rates: "blue" in rates))
+    elapsed = time.perf_counter() - start
+
+    assert result == ("secondary", {"blue": 2})
+    assert elapsed < 0.5  # ~p90 + latencia de la secundaria, no el timeout
+    assert "backup" not in log
+    assert "primary:cancelled" in log
+    assert tracker.stats()["secondary"]["samples"] == 1
+    # La primaria cancelada entra como cota inferior y sube su p90
+    primary = tracker.stats()["primary"]
+    assert primary["samples"] == 2 and primary["cancelled"] == 1
+    assert tracker.delay("primary") > 0.1
+
+
+def test_short_censored_samples_only_count_cancellations():
+    tracker = LatencyTracker(min_samples=1)
+    tracker.observe("a", 0.5)
+    tracker.censor("a", 0.01)  # perdió pronto: no dice nada de su latencia
+    assert tracker.stats()["a"]["samples"] == 1
+    assert tracker.stats()["a"]["cancelled"] == 1
+    tracker.censor("a", 2.0)
+    assert tracker.stats()["a"]["samples"] == 2 and tracker.delay("a") == 2.0
+
+
+def test_invalid_answer_falls_through_immediately():
+    tracker = LatencyTracker(default=5.0)
+    log = []
+
+    calls = [
+        ("primary", lambda: _answer({}, 0, log, "primary")),
+        ("secondary", lambda: _answer({"blue": 2}, 0, log, "secondary")),
+    ]
+
+    start = time.perf_counter()
+    assert asyncio.run(hedged(calls, tracker, is_valid=lambda rates: "blue" in rates)) == ("secondary", {"blue": 2})
+    assert time.perf_counter() - start < 0.5  # sin esperar el delay de 5 s
+
+    assert asyncio.run(hedged([("only", lambda: _answer({}, 0, log, "only"))], tracker,
+                              is_valid=lambda rates: "blue" in rates)) is None
@@ -0,0 +1,74 @@
+# backend/tests/test_live_updates.py
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.services import live_updates
+from app.utils.pubsub import Broadcaster
+
+
+def test_fanout_by_topic_and_slow_consumers_drop_oldest():
+    async def scenario():
+        broadcaster = Broadcaster(queue_size=2)
+        economia = broadcaster.subscribe(["economia"])
+        everything = broadcaster.subscribe()
+
+        assert broadcaster.publish("economia", "a") == 2
+        assert broadcaster.publish("mercados", "b") == 1
+        broadcaster.publish("economia", "c")
+
+        assert [await economia.get(0.1), await economia.get(0.1)] == ["a", "c"]
+        assert await economia.get(0.01) is None
+        assert everything.dropped == 1  # "a" se descartó, la cola tenía lugar para 2
+        assert [await everything.get(0.1), await everything.get(0.1)] == ["b", "c"]
+
+        economia.close()
+        assert broadcaster.get_stats()["subscribers"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_publish_from_another_thread():
+    async def scenario():
+        broadcaster = Broadcaster()
+        with broadcaster.subscribe(["mercados"]) as subscription:
+            thread = threading.Thread(target=broadcaster.publish, args=("mercados", "merval"))
+            thread.start()
+            thread.join()
+            return await subscription.get(1.0)
+
+    assert asyncio.run(scenario()) == "merval"
+
+
+def test_publish_changes_only_emits_changed_indicators(monkeypatch):
+    broadcaster = Broadcaster()
+    monkeypatch.setattr(live_updates, "broadcaster", broadcaster)
+    monkeypatch.setattr(live_updates, "_last_values", {})
+
+    async def scenario():
+        with broadcaster.subscribe(["economia"]) as subscription:
+            rows = [
+                {"indicator_type": "dolar_blue", "value": 1300.0, "source": "BLUE"},
+                {"indicator_type": "merval", "value": 2_000_000.0, "source": "BYMA"},
+            ]
+            assert live_updates.publish_changes(rows) == 2
+            assert live_updates.publish_changes(rows) == 0
+            assert live_updates.publish_changes([{**rows[0], "value": 1310.0}]) == 1
+
+            first = json.loads(await subscription.get(0.1))
+            second = json.loads(await subscription.get(0.1))
+            assert await subscription.get(0.01) is None
+            return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first["topic"] == "economia" and [i["indicator_type"] for i in first["data"]] == ["dolar_blue"]
+    assert second["data"][0]["value"] == 1310.0
+
+
+def test_parse_topics():
+    assert live_updates.parse_topics(None) == []
+    assert live_updates.parse_topics("economia, mercados") == ["economia", "mercados"]
+    with pytest.raises(ValueError):
+        live_updates.parse_topics("economia,nope")
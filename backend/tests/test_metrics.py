@@ -0,0 +1,76 @@
+# backend/tests/test_metrics.py
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.middleware.logging_middleware import LoggingMiddleware
+from app.services import metrics_service
+from app.utils.metrics import Registry
+
+
+def test_registry_renders_prometheus_text():
+    registry = Registry()
+    requests = registry.counter("demo_requests_total", "Requests", ("route",))
+    latency = registry.histogram("demo_latency_seconds", "Latencia", ("route",), buckets=(0.1, 1.0))
+    registry.collector(lambda: [("demo_ratio", "gauge", "Ratio", [({"cache": "l1"}, 0.75)])])
+
+    requests.inc("/a")
+    requests.inc("/a", amount=2)
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value, "/a")
+
+    output = registry.render()
+    assert "# TYPE demo_requests_total counter" in output
+    assert 'demo_requests_total{route="/a"} 3' in output
+    assert 'demo_latency_seconds_bucket{route="/a",le="0.1"} 1' in output
+    assert 'demo_latency_seconds_bucket{route="/a",le="1"} 2' in output
+    assert 'demo_latency_seconds_bucket{route="/a",le="+Inf"} 3' in output
+    assert 'demo_latency_seconds_count{route="/a"} 3' in output
+    assert 'demo_ratio{cache="l1"} 0.75' in output
+
+
+def test_upstream_sources_and_errors():
+    assert metrics_service.source_for_url("https://api.bcra.gob.ar/estadisticas/v2.0") == "BCRA"
+    assert metrics_service.source_for_url("https://dolarapi.com/v1/dolares") == "DolarAPI"
+    assert metrics_service.source_for_url("https://example.com") == "other"
+
+    before = metrics_service.upstream_errors.value("DolarSi", "TimeoutError")
+    metrics_service.observe_upstream("DolarSi", 0.2, error=TimeoutError())
+    metrics_service.observe_upstream("DolarSi", 0.1, status=503)
+    assert metrics_service.upstream_errors.value("DolarSi", "TimeoutError") == before + 1
+    assert metrics_service.upstream_errors.value("DolarSi", "http_5xx") >= 1
+
+
+def test_db_queries_are_timed():
+    metrics_service.instrument_db()
+    metrics_service.instrument_db()  # idempotente
+    before = metrics_service.db_latency.count("SELECT")
+
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert metrics_service.db_latency.count("SELECT") == before + 1
+
+
+def test_metrics_endpoint_and_request_histogram():
+    from app.routers.metrics import router
+
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, metrics=metrics_service.observe_request)
+    app.include_router(router)
+
+    @app.get("/api/v1/indicators/{indicator_type}")
+    async def by_type(indicator_type: str):
+        return {"indicator_type": indicator_type}
+
+    client = TestClient(app)
+    client.get("/api/v1/indicators/reservas")
+    client.get("/api/v1/indicators/dolar_blue")
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'argfy_http_requests_total{method="GET",route="/api/v1/indicators/{indicator_type}",status="200"} 2' in body
+    assert "argfy_http_request_duration_seconds_bucket" in body
+    assert 'argfy_cache_hit_ratio{cache="snapshot_version"}' in body
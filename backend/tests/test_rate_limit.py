@@ -0,0 +1,134 @@
+# backend/tests/test_rate_limit.py
+import asyncio
+
+import fakeredis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.rate_limit_middleware import RateLimitMiddleware, api_key_id
+from app.utils.rate_limit import Quota, RedisSlidingWindowLimiter, TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(clock=clock)
+    quota = Quota(limit=3, window=60)  # 1 token cada 20s
+
+    results = [limiter.hit_sync("client", quota) for _ in range(4)]
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert results[2].remaining == 0
+    assert round(results[3].retry_after) == 20
+
+    clock.now += 20
+    assert limiter.hit_sync("client", quota).allowed
+    assert limiter.hit_sync("other", quota).remaining == 2
+
+
+def test_token_bucket_is_bounded():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(maxsize=10, clock=clock)
+    for i in range(25):
+        limiter.hit_sync(f"client-{i}", Quota(5))
+        clock.now += 1
+    assert len(limiter._buckets) <= 10
+
+
+def test_redis_sliding_window():
+    async def scenario():
+        limiter = RedisSlidingWindowLimiter(fakeredis.FakeAsyncRedis())
+        quota = Quota(limit=2, window=60)
+        return [await limiter.hit("client", quota) for _ in range(3)]
+
+    first, second, third = asyncio.run(scenario())
+    assert (first.allowed, first.remaining) == (True, 1)
+    assert (second.allowed, second.remaining) == (True, 0)
+    assert not third.allowed and 0 < third.retry_after <= 60
+
+
+def make_client(**options):
+    app = FastAPI()
+    options.setdefault("limiter", TokenBucketLimiter())
+    app.add_middleware(RateLimitMiddleware, **options)
+
+    @app.get("/api/v1/indicators/current")
+    async def current():
+        return {"status": "success"}
+
+    @app.get("/api/v1/data/export/csv")
+    async def export():
+        return {"status": "success"}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return TestClient(app)
+
+
+def test_middleware_headers_and_429():
+    client = make_client(default_quota=Quota(2, 60))
+
+    response = client.get("/api/v1/indicators/current")
+    assert response.status_code == 200
+    assert response.headers["ratelimit-limit"] == "2"
+    assert response.headers["ratelimit-remaining"] == "1"
+    assert response.headers["ratelimit-policy"] == "2;w=60"
+
+    client.get("/api/v1/indicators/current")
+    limited = client.get("/api/v1/indicators/current")
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 1
+    assert limited.json()["detail"] == "Rate limit exceeded"
+
+    # Exentas no se ven afectadas; una key desconocida sigue limitada por IP
+    assert client.get("/health").status_code == 200
+    assert client.get("/api/v1/indicators/current", headers={"X-API-Key": "abc"}).status_code == 429
+
+
+def test_route_and_client_quotas():
+    client = make_client(
+        default_quota=Quota(100, 60),
+        route_quotas={"/api/v1/data/export": Quota(1, 60)},
+        client_quotas={"key:partner": Quota(1, 60)},
+    )
+
+    assert client.get("/api/v1/data/export/csv").status_code == 200
+    assert client.get("/api/v1/data/export/csv").status_code == 429
+    # La cuota de export es independiente de la general
+    assert client.get("/api/v1/indicators/current").headers["ratelimit-limit"] == "100"
+
+    partner = {"X-API-Key": "partner"}
+    assert client.get("/api/v1/indicators/current", headers=partner).status_code == 200
+    assert client.get("/api/v1/indicators/current", headers=partner).status_code == 429
+
+
+def test_rotating_unknown_keys_do_not_bypass_ip_limit():
+    client = make_client(default_quota=Quota(2, 60), api_keys=["validated"])
+
+    statuses = [
+        client.get("/api/v1/indicators/current", headers={"X-API-Key": f"random-{i}"}).status_code
+        for i in range(4)
+    ]
+    assert statuses == [200, 200, 429, 429]
+
+    # Una key validada tiene su propio bucket
+    response = client.get("/api/v1/indicators/current", headers={"X-API-Key": "validated"})
+    assert response.status_code == 200
+
+
+def test_bucket_keys_never_contain_the_api_key():
+    limiter = TokenBucketLimiter()
+    client = make_client(limiter=limiter, client_quotas={"key:s3cret-partner": Quota(1, 60)})
+
+    assert client.get("/api/v1/indicators/current", headers={"X-API-Key": "s3cret-partner"}).status_code == 200
+    # La cuota del partner se sigue buscando por la key en claro
+    assert client.get("/api/v1/indicators/current", headers={"X-API-Key": "s3cret-partner"}).status_code == 429
+    assert list(limiter._buckets) == [f"{api_key_id('s3cret-partner')}|*"]
@@ -0,0 +1,63 @@
+# backend/tests/test_resampling.py
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.utils.resampling import downsample, lttb_indices, resample
+from app.utils.timeseries import to_isoformat, to_micros
+
+
+def _series(start, count, step=timedelta(hours=6)):
+    timestamps = np.array([to_micros(start + i * step) for i in range(count)], dtype=np.int64)
+    return timestamps, np.arange(count, dtype=np.float64)
+
+
+def test_daily_ohlc_and_mean():
+    timestamps, values = _series(datetime(2024, 3, 1), 8)  # 4 puntos por día
+
+    ohlc = resample(timestamps, values, "daily", "ohlc")
+    assert to_isoformat(ohlc["timestamp"]) == ["2024-03-01T00:00:00.000000", "2024-03-02T00:00:00.000000"]
+    assert ohlc["open"].tolist() == [0.0, 4.0]
+    assert ohlc["high"].tolist() == [3.0, 7.0]
+    assert ohlc["low"].tolist() == [0.0, 4.0]
+    assert ohlc["close"].tolist() == ohlc["value"].tolist() == [3.0, 7.0]
+    assert ohlc["count"].tolist() == [4, 4]
+
+    assert resample(timestamps, values, "daily", "mean")["value"].tolist() == [1.5, 5.5]
+    assert resample(timestamps, values, "daily", "last")["value"].tolist() == [3.0, 7.0]
+
+
+def test_weekly_buckets_start_on_monday_and_monthly_on_first():
+    timestamps, values = _series(datetime(2024, 1, 3), 40, step=timedelta(days=1))  # miércoles
+
+    weekly = resample(timestamps, values, "weekly", "last")
+    assert to_isoformat(weekly["timestamp"])[:2] == ["2024-01-01T00:00:00.000000", "2024-01-08T00:00:00.000000"]
+    assert weekly["value"][0] == 4.0  # domingo 7/1
+
+    monthly = resample(timestamps, values, "monthly", "ohlc")
+    assert to_isoformat(monthly["timestamp"]) == ["2024-01-01T00:00:00.000000", "2024-02-01T00:00:00.000000"]
+    assert monthly["count"].tolist() == [29, 11]
+
+    with pytest.raises(ValueError):
+        resample(timestamps, values, "hourly")
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    timestamps, _ = _series(datetime(2020, 1, 1), 5000, step=timedelta(days=1))
+    values = np.sin(np.linspace(0, 20, len(timestamps)))
+    values[2500] = 10.0  # pico aislado
+
+    indices = lttb_indices(timestamps, values, 300)
+    assert len(indices) == 300
+    assert indices[0] == 0 and indices[-1] == len(values) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert 2500 in indices
+
+    assert len(lttb_indices(timestamps[:10], values[:10], 300)) == 10
+
+
+def test_downsample_trims_all_columns():
+    timestamps, values = _series(datetime(2024, 1, 1), 1000)
+    series = downsample(resample(timestamps, values, "raw", "ohlc"), 50)
+    assert {len(column) for column in series.values()} == {50}
@@ -0,0 +1,82 @@
+# backend/tests/test_retry.py
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import aiohttp
+from aiohttp import web
+
+from app.services.retries import RetryingRequest
+from app.utils.retry import RetryBudget, RetryPolicy, decorrelated_jitter, parse_retry_after
+
+
+def test_decorrelated_jitter_bounds():
+    previous = 0.0
+    for _ in range(50):
+        previous = decorrelated_jitter(previous, base=0.1, cap=2.0)
+        assert 0.1 <= previous <= 2.0
+
+
+def test_parse_retry_after():
+    now = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=30), usegmt=True), now=now) == 30.0
+    assert parse_retry_after("mañana") is None
+    assert parse_retry_after(None) is None
+
+
+def test_policy_attempts_retry_after_and_budget():
+    policy = RetryPolicy(max_attempts=3, base=0.1, cap=1.0, max_retry_after=5,
+                         budget=RetryBudget(ratio=0.1, max_tokens=2))
+    assert policy.delay(3, 0.5) is None  # sin más intentos
+    assert policy.delay(1, 0.0, retry_after=60) is None  # pide esperar demasiado
+    assert policy.delay(1, 0.0, retry_after=2) == 2
+    assert 0.1 <= policy.delay(1, 0.0) <= 1.0
+    assert policy.delay(1, 0.0) is None  # presupuesto agotado
+
+    for _ in range(10):
+        policy.budget.deposit()  # 10 requests → 1 reintento más
+    assert policy.delay(1, 0.0) is not None
+    assert policy.budget.snapshot()["exhausted"] == 1
+
+
+def test_retrying_request_absorbs_transient_5xx():
+    async def scenario():
+        hits = {"flaky": 0, "down": 0}
+
+        async def flaky(request):
+            hits["flaky"] += 1
+            if hits["flaky"] == 1:
+                return web.Response(status=503, headers={"Retry-After": "0"})
+            return web.json_response({"ok": True})
+
+        async def down(request):
+            hits["down"] += 1
+            return web.Response(status=502)
+
+        app = web.Application()
+        app.router.add_get("/flaky", flaky)
+        app.router.add_get("/down", down)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base = f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+        policy = RetryPolicy(max_attempts=3, base=0.01, cap=0.02, budget=RetryBudget(max_tokens=2))
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with RetryingRequest(base, lambda: session.get(f"{base}/flaky"), policy) as response:
+                    assert response.status == 200
+                    assert await response.json() == {"ok": True}
+
+                response = await RetryingRequest(base, lambda: session.get(f"{base}/down"), policy)
+                assert response.status == 502  # agotó los intentos
+                response.release()
+        finally:
+            await runner.cleanup()
+        return hits, policy.budget.snapshot()
+
+    hits, budget = asyncio.run(scenario())
+    assert hits == {"flaky": 2, "down": 2}  # el 3er intento no entra en el presupuesto
+    assert budget["retries"] == 2 and budget["exhausted"] == 1
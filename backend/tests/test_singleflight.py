@@ -0,0 +1,115 @@
+# backend/tests/test_singleflight.py
+import asyncio
+
+import pytest
+
+from app.utils.singleflight import SingleFlight, singleflight
+
+
+def test_concurrent_calls_share_one_upstream_call():
+    """N llamadas concurrentes con la misma clave ejecutan la función una vez"""
+    group = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 42}
+
+    async def run():
+        return await asyncio.gather(*[group.do("bcra", fetch) for _ in range(50)])
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(r == {"value": 42} for r in results)
+    assert group.coalesced == 49
+    assert group.in_flight() == 0
+
+
+def test_errors_propagate_to_all_waiters_and_are_not_cached():
+    group = SingleFlight()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        return await asyncio.gather(
+            *[group.do("k", failing) for _ in range(5)], return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert calls == 1
+
+    # Una vez terminada, la siguiente llamada vuelve a ir upstream
+    with pytest.raises(RuntimeError):
+        asyncio.run(group.do("k", failing))
+    assert calls == 2
+
+
+def test_decorator_ignores_instance_and_keys_by_arguments():
+    group = SingleFlight()
+    calls = []
+
+    class Service:
+        @singleflight(group=group)
+        async def get_historical(self, variable_id, days=30):
+            calls.append((variable_id, days))
+            await asyncio.sleep(0.01)
+            return variable_id * days
+
+    async def run():
+        return await asyncio.gather(
+            Service().get_historical(1),
+            Service().get_historical(1),
+            Service().get_historical(2, days=7),
+        )
+
+    assert asyncio.run(run()) == [30, 30, 14]
+    assert sorted(calls) == [(1, 30), (2, 7)]
+
+
+def test_cancelling_one_caller_does_not_cancel_shared_call():
+    group = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def run():
+        first = asyncio.ensure_future(group.do("k", slow))
+        second = asyncio.ensure_future(group.do("k", slow))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "ok"
+
+
+def test_each_caller_gets_its_own_copy():
+    """Mutar el resultado en un caller no afecta a los demás"""
+    group = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return {"rates": [{"value": 1300}]}
+
+    async def caller(mutate):
+        result = await group.do("blue", fetch)
+        if mutate:
+            result["rates"][0]["value"] = 0
+            result["extra"] = True
+        return result
+
+    async def run():
+        return await asyncio.gather(caller(True), caller(False), caller(False))
+
+    mutated, first, second = asyncio.run(run())
+    assert mutated == {"rates": [{"value": 0}], "extra": True}
+    assert first == second == {"rates": [{"value": 1300}]}
+    assert first is not second
@@ -0,0 +1,95 @@
+# backend/tests/test_snapshot.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import CurrentIndicator, EconomicIndicator
+from app.services import snapshot_service
+from app.services.ingestion import ingest_indicators
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _indicator(indicator_type, value, date, **kwargs):
+    return EconomicIndicator(
+        indicator_type=indicator_type, value=value, source="BCRA",
+        date=date, is_active=True, **kwargs
+    )
+
+
+def test_record_latest_keeps_newest_value_per_type(db):
+    now = datetime(2025, 1, 10)
+    rows = [
+        _indicator("reservas", 1.0, now - timedelta(days=1)),
+        _indicator("reservas", 2.0, now),
+        _indicator("dolar_blue", 1300.0, now, label="Dólar Blue"),
+    ]
+    db.add_all(rows)
+    assert snapshot_service.record_latest(db, rows) == 2
+    db.commit()
+
+    current = {c.indicator_type: c for c in snapshot_service.get_current(db)}
+    assert current["reservas"].value == 2.0
+    assert current["reservas"].indicator_id == rows[1].id
+
+    # Un valor más viejo que el vigente no pisa el snapshot
+    older = _indicator("reservas", 0.5, now - timedelta(days=5))
+    db.add(older)
+    snapshot_service.record_latest(db, [older])
+    db.commit()
+    db.expire_all()
+    assert snapshot_service.get_one(db, "reservas").value == 2.0
+
+
+def test_rebuild_and_search(db):
+    now = datetime(2025, 1, 10)
+    db.add_all([
+        _indicator("usd_oficial", 1000.0, now - timedelta(days=1), label="Dólar Oficial", category="exchange"),
+        _indicator("usd_oficial", 1010.0, now, label="Dólar Oficial", category="exchange"),
+        _indicator("tasa_bcra", 40.0, now, label="Tasa BCRA", category="monetary"),
+    ])
+    db.commit()
+
+    assert snapshot_service.ensure_snapshot(db) == 2
+    assert db.query(CurrentIndicator).count() == 2
+    assert snapshot_service.ensure_snapshot(db) == 0  # ya construido
+
+    results = snapshot_service.search(db, "dólar")
+    assert [(r.indicator_type, r.value) for r in results] == [("usd_oficial", 1010.0)]
+    assert snapshot_service.search(db, "a", category="monetary")[0].indicator_type == "tasa_bcra"
+
+
+def test_ingest_deactivates_previous_and_updates_snapshot(db):
+    first = datetime(2025, 1, 10)
+    assert ingest_indicators(db, [
+        {"indicator_type": "reservas", "value": 1.0, "source": "BCRA"},
+        {"indicator_type": "tasa_bcra", "value": "40", "source": "BCRA", "unit": "%"},
+        {"indicator_type": "sin_valor", "value": None, "source": "BCRA"},
+    ], now=first) == 2
+
+    assert ingest_indicators(db, [
+        {"indicator_type": "reservas", "value": 2.0, "source": "BCRA"},
+    ], now=first + timedelta(hours=1)) == 1
+
+    active = db.query(EconomicIndicator).filter(EconomicIndicator.is_active == True).all()
+    assert sorted((i.indicator_type, i.value) for i in active) == [("reservas", 2.0), ("tasa_bcra", 40.0)]
+    assert db.query(EconomicIndicator).count() == 3
+
+    snapshot = snapshot_service.get_one(db, "reservas")
+    latest = db.query(EconomicIndicator).filter_by(indicator_type="reservas", is_active=True).one()
+    assert (snapshot.value, snapshot.indicator_id) == (2.0, latest.id)
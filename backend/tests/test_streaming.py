@@ -0,0 +1,48 @@
+# backend/tests/test_streaming.py
+import gzip
+import json
+from datetime import datetime
+
+from app.utils.streaming import accepts_gzip, csv_chunks, gzip_chunks, json_chunks, ndjson_chunks
+
+COLUMNS = ("indicator_type", "value", "date", "source")
+BATCHES = [
+    [("dolar_blue", 1200.5, datetime(2024, 1, 1), "BLUELYTICS")],
+    [("merval", 1.0, datetime(2024, 1, 2), "BYMA, ARG"), ("ipc", 2.5, datetime(2024, 1, 3), "INDEC")],
+]
+
+
+def test_csv_chunks_one_chunk_per_batch_and_quoting():
+    chunks = list(csv_chunks(iter(BATCHES), COLUMNS))
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert lines[0] == "indicator_type,value,date,source"
+    assert lines[1] == "dolar_blue,1200.5,2024-01-01T00:00:00,BLUELYTICS"
+    assert lines[2].endswith('"BYMA, ARG"')
+
+    assert b"".join(csv_chunks(iter([]), COLUMNS)) == b"indicator_type,value,date,source\n"
+
+
+def test_ndjson_and_gzip_roundtrip():
+    body = b"".join(gzip_chunks(ndjson_chunks(iter(BATCHES), COLUMNS)))
+    rows = [json.loads(line) for line in gzip.decompress(body).splitlines()]
+    assert [row["indicator_type"] for row in rows] == ["dolar_blue", "merval", "ipc"]
+    assert rows[0]["date"] == "2024-01-01T00:00:00"
+
+
+def test_json_chunks_stream_a_single_document():
+    chunks = list(json_chunks(iter(BATCHES), COLUMNS, {"status": "success", "format": "json"}))
+    assert len(chunks) == 4  # apertura, un chunk por lote, cierre con count
+    document = json.loads(b"".join(chunks))
+    assert document["status"] == "success" and document["count"] == 3
+    assert [row["indicator_type"] for row in document["data"]] == ["dolar_blue", "merval", "ipc"]
+    assert document["data"][1]["source"] == "BYMA, ARG"
+
+    assert json.loads(b"".join(json_chunks(iter([]), COLUMNS))) == {"data": [], "count": 0}
+
+
+def test_accepts_gzip():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, gzip;q=0.5")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("")
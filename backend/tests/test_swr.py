@@ -0,0 +1,101 @@
+# backend/tests/test_swr.py
+import asyncio
+
+from app.utils.swr import FreshnessPolicy, StaleWhileRevalidate, stale_while_revalidate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+POLICY = FreshnessPolicy(soft_ttl=60, hard_ttl=600)
+
+
+def test_serves_stale_value_and_refreshes_in_background():
+    clock = FakeClock()
+    swr = StaleWhileRevalidate(clock=clock)
+    values = iter([1, 2])
+
+    async def loader():
+        return next(values)
+
+    async def run():
+        first = await swr.get("ipc", loader, POLICY)
+        clock.now += 120  # pasado soft_ttl, antes de hard_ttl
+        stale = await swr.get("ipc", loader, POLICY)
+        await asyncio.sleep(0)  # dejar correr el refresh
+        await asyncio.sleep(0)
+        fresh = await swr.get("ipc", loader, POLICY)
+        return first, stale, fresh
+
+    first, stale, fresh = asyncio.run(run())
+    assert (first.value, first.stale, first.cached) == (1, False, False)
+    assert (stale.value, stale.stale, stale.age) == (1, True, 120)
+    assert (fresh.value, fresh.stale) == (2, False)
+    assert swr.get_stats()["background_refreshes"] == 1
+
+
+def test_past_hard_ttl_waits_for_loader():
+    clock = FakeClock()
+    swr = StaleWhileRevalidate(clock=clock)
+    values = iter(["old", "new"])
+
+    async def loader():
+        return next(values)
+
+    async def run():
+        await swr.get("k", loader, POLICY)
+        clock.now += 601
+        return await swr.get("k", loader, POLICY)
+
+    result = asyncio.run(run())
+    assert (result.value, result.stale, result.cached) == ("new", False, False)
+
+
+def test_invalid_results_do_not_replace_last_good_value():
+    clock = FakeClock()
+    swr = StaleWhileRevalidate(clock=clock)
+    values = iter([{"status": "success", "value": 10}, {"status": "demo", "value": 0}])
+
+    async def loader():
+        return next(values)
+
+    def is_valid(v):
+        return v["status"] == "success"
+
+    async def run():
+        await swr.get("k", loader, POLICY, is_valid)
+        clock.now += 120
+        await swr.get("k", loader, POLICY, is_valid)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return await swr.get("k", loader, POLICY, is_valid)
+
+    result = asyncio.run(run())
+    assert result.value["value"] == 10
+    assert result.stale
+
+
+def test_decorator_annotates_dicts_and_keys_by_arguments():
+    swr = StaleWhileRevalidate()
+    calls = []
+
+    class Service:
+        @stale_while_revalidate("bcra", {"soft_ttl": 60, "hard_ttl": 600}, store=swr)
+        async def get_variable(self, variable_id):
+            calls.append(variable_id)
+            return {"value": variable_id}
+
+    async def run():
+        service = Service()
+        return [await service.get_variable(i) for i in (1, 1, 2)]
+
+    results = asyncio.run(run())
+    assert calls == [1, 2]
+    assert results[1]["value"] == 1
+    assert results[1]["stale"] is False
+    assert "age_seconds" in results[1]
@@ -0,0 +1,85 @@
+# backend/tests/test_timeseries.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.utils.timeseries import TimeSeriesStore, to_isoformat, to_micros
+
+
+def test_append_sorts_and_new_values_win(tmp_path):
+    store = TimeSeriesStore(str(tmp_path))
+    base = datetime(2024, 1, 1)
+
+    store.append("dolar_blue", [base + timedelta(days=2), base], [3.0, 1.0], meta={"source": "BLUELYTICS"})
+    assert store.append("dolar_blue", [base + timedelta(days=1), base], [2.0, 10.0]) == 3
+
+    timestamps, values = store.range("dolar_blue")
+    assert timestamps.dtype == np.int64 and values.dtype == np.float64
+    assert values.tolist() == [10.0, 2.0, 3.0]
+    assert to_isoformat(timestamps)[0] == "2024-01-01T00:00:00.000000"
+    assert store.get_meta("dolar_blue") == {"source": "BLUELYTICS"}
+
+
+def test_range_uses_inclusive_bounds_over_multi_year_series(tmp_path):
+    store = TimeSeriesStore(str(tmp_path))
+    start = datetime(2015, 1, 1)
+    days = [start + timedelta(days=i) for i in range(10 * 365)]
+    store.append("reservas", days, np.arange(len(days), dtype=float))
+
+    timestamps, values = store.range("reservas", datetime(2020, 1, 1), datetime(2020, 1, 31))
+    assert len(values) == 31
+    assert timestamps[0] == to_micros(datetime(2020, 1, 1))
+    assert store.latest("reservas")[1] == len(days) - 1
+
+    # Las lecturas son vistas sobre el mmap, no copias
+    assert isinstance(timestamps.base, np.memmap) or isinstance(timestamps, np.memmap)
+
+
+def test_readers_see_new_version_after_write(tmp_path):
+    store = TimeSeriesStore(str(tmp_path))
+    other = TimeSeriesStore(str(tmp_path))  # p.ej. otro worker
+    store.append("ipc", [datetime(2024, 1, 1)], [3.2])
+    assert other.range("ipc")[1].tolist() == [3.2]
+
+    store.append("ipc", [datetime(2024, 2, 1)], [2.9])
+    assert other.range("ipc")[1].tolist() == [3.2, 2.9]
+    assert other.indicators() == ["ipc"]
+
+
+def test_missing_and_invalid_series(tmp_path):
+    store = TimeSeriesStore(str(tmp_path))
+    timestamps, values = store.range("nope")
+    assert len(timestamps) == 0 and len(values) == 0
+    assert store.latest("nope") is None
+
+    with pytest.raises(ValueError):
+        store.append("../etc/passwd", [datetime(2024, 1, 1)], [1.0])
+
+
+def test_concurrent_writers_never_lose_points_or_leave_temp_files(tmp_path):
+    # Dos stores = dos workers: no comparten el threading.Lock, solo el flock
+    stores = [TimeSeriesStore(str(tmp_path)), TimeSeriesStore(str(tmp_path))]
+    base = datetime(2024, 1, 1)
+
+    def write(i):
+        stores[i % 2].append("reservas", [base + timedelta(days=i)], [float(i)], {"source": "BCRA"})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(40)))
+
+    assert sorted(os.listdir(tmp_path)) == ["reservas.lock", "reservas.meta.json", "reservas.npy"]
+    timestamps, values = stores[0].range("reservas")
+    assert values.tolist() == [float(i) for i in range(40)]
+    assert all(np.diff(timestamps) > 0)
+
+
+def test_replace_drops_old_points_and_meta(tmp_path):
+    store = TimeSeriesStore(str(tmp_path))
+    base = datetime(2024, 1, 1)
+    store.append("reservas", [base, base + timedelta(days=1)], [1.0, 2.0], {"source": "BCRA", "old": True})
+    assert store.replace("reservas", [base + timedelta(days=2)], [3.0], {"source": "BCRA"}) == 1
+    assert store.range("reservas")[1].tolist() == [3.0]
+    assert store.get_meta("reservas") == {"source": "BCRA"}
@@ -0,0 +1,88 @@
+# backend/tests/test_timeseries_store.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import HistoricalData
+from app.services import snapshot_service
+from app.services import timeseries_store as service
+from app.utils.timeseries import TimeSeriesStore
+
+BASE = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = TimeSeriesStore(str(tmp_path / "series"))
+    monkeypatch.setattr(service, "timeseries_store", store)
+    return store
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    path = tmp_path / "argfy.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add_all([
+            HistoricalData(indicator_type="reservas", value=float(i), date=BASE + timedelta(days=i), source="BCRA")
+            for i in range(3)
+        ])
+        db.commit()
+    engine.dispose()
+    return async_sessionmaker(create_async_engine(f"sqlite+aiosqlite:///{path}"))
+
+
+def _row(day, value):
+    return {"indicator_type": "reservas", "date": BASE + timedelta(days=day), "value": value, "source": "BCRA"}
+
+
+def test_points_ingested_during_backfill_are_appended(store, session_factory):
+    async def scenario():
+        backfill = asyncio.ensure_future(service._backfills.do("reservas", service.backfill, "reservas", session_factory))
+        await asyncio.sleep(0)  # backfill en vuelo, la serie todavía no existe
+        assert service.record_points([_row(10, 99.0)]) == 1
+        await backfill
+        await service.wait_for_writes()
+
+    asyncio.run(scenario())
+    timestamps, values = store.range("reservas")
+    assert values.tolist() == [0.0, 1.0, 2.0, 99.0]
+
+
+def test_record_points_batches_writes_off_the_loop(store):
+    store.append("reservas", [BASE], [1.0])
+    writes = []
+    original = store.append
+    store.append = lambda *args, **kwargs: writes.append(args[0]) or original(*args, **kwargs)
+
+    async def scenario():
+        assert service.record_points([_row(1, 2.0), _row(2, 3.0), {**_row(3, 4.0), "indicator_type": "nueva"}]) == 2
+        await service.wait_for_writes()
+
+    asyncio.run(scenario())
+    assert writes == ["reservas"]  # una escritura por indicador; "nueva" espera su backfill
+    assert store.range("reservas")[1].tolist() == [1.0, 2.0, 3.0]
+    assert not store.has("nueva")
+
+
+def test_series_is_rebuilt_when_the_database_changes_outside_ingestion(store, session_factory, tmp_path):
+    snapshot_service.invalidate_versions()
+    assert asyncio.run(service.load_series("reservas", session_factory=session_factory))[1].tolist() == [0.0, 1.0, 2.0]
+
+    # Escritura directa (script / SQL manual / otro worker): no pasa por record_points
+    engine = create_engine(f"sqlite:///{tmp_path / 'argfy.db'}")
+    with sessionmaker(bind=engine)() as db:
+        db.add(HistoricalData(indicator_type="reservas", value=3.0, date=BASE + timedelta(days=3), source="BCRA"))
+        db.commit()
+    engine.dispose()
+
+    snapshot_service.invalidate_versions()  # en producción vence por TTL
+    timestamps, values, meta = asyncio.run(service.load_series("reservas", session_factory=session_factory))
+    assert values.tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert meta["db_mark"][:2] == [4, 4]